@@ -1,8 +1,12 @@
+import math
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 
-from src.pattern_utils import generate_pattern_matrix
+from src.pattern_utils import generate_pattern_matrix, pattern_dtype
 
-CHUNK_SIZE = 13000
+# RAM allowed for the pattern kernels of all workers combined (bytes)
+MEMORY_BUDGET = 512 * 2**20
 
 
 def chunks(lst, length):
@@ -13,18 +17,99 @@ def chunks(lst, length):
         yield lst[i : i + length]
 
 
-def generate_full_pattern_matrix_in_blocks(words, length=CHUNK_SIZE):
-    block_matrix = None
-    for words1 in chunks(words, length):
-        row = None
+def block_length(word_length, memory_budget=MEMORY_BUDGET, workers=1):
+    """
+    Side of the largest square block whose kernel fits in memory_budget
+    when `workers` blocks are computed at the same time.
+
+    The kernel keeps one boolean plane per answer letter, two scratch
+    planes and the output plane, i.e. about word_length + 2 bytes plus
+    the pattern size per pair of words.
+    """
+    per_pair = word_length + 2 + np.dtype(pattern_dtype(word_length)).itemsize
+    return max(1, math.isqrt(memory_budget // (workers * per_pair)))
+
+
+def _write_block(path, words1, words2, row, col):
+    """Compute one block in a worker and write it straight into the .npy file."""
+    out = np.load(path, mmap_mode="r+")
+    out[row : row + len(words1), col : col + len(words2)] = generate_pattern_matrix(words1, words2)
+    out.flush()
+
+
+def generate_full_pattern_matrix_in_blocks(
+    words,
+    length=None,
+    path=None,
+    workers=1,
+    memory_budget=MEMORY_BUDGET,
+):
+    """
+    Pattern matrix between all pairs of words, computed block by block.
+
+    The output is preallocated once and each block is written in place: in
+    RAM, or, when `path` is given, in a .npy file opened as a memmap, so
+    that only the blocks being computed are held in memory. With
+    workers > 1 the blocks are spread over a process pool (workers write
+    their blocks to the file themselves when there is one).
+
+    `length` is the side of a block; by default the largest one that keeps
+    all workers within memory_budget.
+    """
+    n = len(words)
+    word_length = len(words[0])
+    dtype = pattern_dtype(word_length)
+    if length is None:
+        length = block_length(word_length, memory_budget, workers)
 
-        for words2 in chunks(words, length):
-            block = generate_pattern_matrix(words1, words2)
+    if path is None:
+        block_matrix = np.empty((n, n), dtype=dtype)
+    else:
+        block_matrix = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n, n))
 
-            row = np.hstack((row, block)) if row is not None else block
+    starts = range(0, n, length)
+    tasks = [(row, col) for row in starts for col in starts]
 
-        block_matrix = (
-            np.vstack((block_matrix, row)) if block_matrix is not None else row
-        )
+    if workers <= 1:
+        for row, col in tasks:
+            block_matrix[row : row + length, col : col + length] = generate_pattern_matrix(
+                words[row : row + length],
+                words[col : col + length],
+            )
+    elif path is not None:
+        block_matrix.flush()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _write_block,
+                    str(path),
+                    words[row : row + length],
+                    words[col : col + length],
+                    row,
+                    col,
+                )
+                for row, col in tasks
+            ]
+            for future in as_completed(futures):
+                future.result()
+        # Reopen to see the blocks written by the workers
+        del block_matrix
+        block_matrix = np.load(path, mmap_mode="r+")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    generate_pattern_matrix,
+                    words[row : row + length],
+                    words[col : col + length],
+                ): (row, col)
+                for row, col in tasks
+            }
+            for future in as_completed(futures):
+                row, col = futures[future]
+                block = future.result()
+                block_matrix[row : row + block.shape[0], col : col + block.shape[1]] = block
 
+    if path is not None:
+        block_matrix.flush()
     return block_matrix
@@ -1,5 +1,6 @@
 import itertools
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -17,44 +18,84 @@ PATTERN_GRID_DATA: dict[str, Any] = {}
 # Generating color patterns between strings, etc.
 
 
-def generate_full_pattern_matrix(game_name, language="en"):
+def generate_full_pattern_matrix(game_name, language="en", workers=None):
     words = get_word_list(game_name, language=language)
-    pattern_matrix = generate_full_pattern_matrix_in_blocks(words)
-    # Save to file
-    np.save(get_pattern_matrix_fname(game_name, language=language), pattern_matrix)
-    return pattern_matrix
-
-
-def get_pattern_matrix(words1, words2, game_name, language="en"):
-    pattern_matrix_fname = get_pattern_matrix_fname(game_name, language=language)
+    pattern_matrix_fname = Path(get_pattern_matrix_fname(game_name, language=language))
+    # Blocks are written straight to file, then the file is moved in place
+    tmp_fname = pattern_matrix_fname.with_name(pattern_matrix_fname.name + ".tmp")
+    pattern_matrix = generate_full_pattern_matrix_in_blocks(
+        words,
+        path=tmp_fname,
+        workers=workers or os.cpu_count() or 1,
+    )
+    del pattern_matrix
+    tmp_fname.replace(pattern_matrix_fname)
+    return np.load(pattern_matrix_fname, mmap_mode="r")
+
+
+def get_pattern_grid_data(game_name, language="en"):
+    """
+    Pattern grid of a language with its word <-> index tables.
+
+    The grid is opened with mmap_mode, so loading is instant and the pages
+    are shared between processes (simulation workers) through the OS cache.
+    """
     if language not in PATTERN_GRID_DATA:
+        pattern_matrix_fname = get_pattern_matrix_fname(game_name, language=language)
         if not Path(pattern_matrix_fname).exists():
             logger = logging.getLogger(__name__)
             logger.info(
                 "Generating pattern matrix. This takes a minute, but\nthe result will be saved to file so that it only\nneeds to be computed once.",
             )
             generate_full_pattern_matrix(game_name, language=language)
-        
+
+        words = get_word_list(game_name, language=language)
         PATTERN_GRID_DATA[language] = {
-            "grid": np.load(pattern_matrix_fname),
-            "words_to_index": dict(
-                zip(get_word_list(game_name, language=language), itertools.count(), strict=False),
-            )
+            "grid": np.load(pattern_matrix_fname, mmap_mode="r"),
+            "words": np.array(words),
+            "words_to_index": dict(zip(words, itertools.count(), strict=False)),
         }
+    return PATTERN_GRID_DATA[language]
+
+
+def is_index_array(words):
+    return isinstance(words, np.ndarray) and np.issubdtype(words.dtype, np.integer)
 
-    full_grid = PATTERN_GRID_DATA[language]["grid"]
-    words_to_index = PATTERN_GRID_DATA[language]["words_to_index"]
 
-    indices1 = [words_to_index[w] for w in words1]
-    indices2 = [words_to_index[w] for w in words2]
+def get_word_indices(words, game_name, language="en"):
+    """
+    Row/column indices of words in the pattern grid.
+
+    Integer arrays are returned unchanged: convert a word list once, then
+    pass the indices to get_pattern_matrix, get_possible_words, etc.
+    """
+    if is_index_array(words):
+        return words
+    words_to_index = get_pattern_grid_data(game_name, language=language)["words_to_index"]
+    return np.fromiter((words_to_index[w] for w in words), dtype=np.intp, count=len(words))
+
+
+def get_index_words(indices, game_name, language="en"):
+    """Words at the given grid indices (inverse of get_word_indices)."""
+    words = get_pattern_grid_data(game_name, language=language)["words"]
+    return [str(w) for w in words[indices]]
+
+
+def get_pattern_matrix(words1, words2, game_name, language="en"):
+    """Patterns between two lists of words, or two arrays of grid indices."""
+    full_grid = get_pattern_grid_data(game_name, language=language)["grid"]
+    indices1 = get_word_indices(words1, game_name, language=language)
+    indices2 = get_word_indices(words2, game_name, language=language)
     return full_grid[np.ix_(indices1, indices2)]
 
 
 def get_pattern(guess, answer, game_name, language="en"):
+    if isinstance(guess, (int, np.integer)) and isinstance(answer, (int, np.integer)):
+        return get_pattern_grid_data(game_name, language=language)["grid"][guess, answer]
     if language in PATTERN_GRID_DATA:
         saved_words = PATTERN_GRID_DATA[language]["words_to_index"]
         if guess in saved_words and answer in saved_words:
-            return get_pattern_matrix([guess], [answer], game_name, language=language)[0, 0]
+            return PATTERN_GRID_DATA[language]["grid"][saved_words[guess], saved_words[answer]]
     return generate_pattern_matrix([guess], [answer])[0, 0]
 
 
@@ -77,13 +118,18 @@ def patterns_to_string(patterns):
 
 
 def get_possible_words(guess, pattern, word_list, game_name, language="en"):
-    all_patterns = get_pattern_matrix([guess], word_list, game_name, language=language).flatten()
+    """Words of word_list consistent with the pattern (indices in, indices out)."""
+    guesses = np.array([guess]) if isinstance(guess, (int, np.integer)) else [guess]
+    all_patterns = get_pattern_matrix(guesses, word_list, game_name, language=language).flatten()
+    if is_index_array(word_list):
+        return word_list[all_patterns == pattern]
     return [str(w) for w in np.array(word_list)[all_patterns == pattern]]
 
 
 def get_word_buckets(guess, possible_words, game_name, language="en"):
     buckets = [[] for _x in range(3**5)]
-    hashes = get_pattern_matrix([guess], possible_words, game_name, language=language).flatten()
+    guesses = np.array([guess]) if isinstance(guess, (int, np.integer)) else [guess]
+    hashes = get_pattern_matrix(guesses, possible_words, game_name, language=language).flatten()
     for index, word in zip(hashes, possible_words, strict=True):
         buckets[index].append(word)
     return buckets
@@ -1,5 +1,3 @@
-import itertools
-
 import numpy as np
 
 MISS = np.uint8(0)
@@ -8,7 +6,18 @@ EXACT = np.uint8(2)
 
 
 def words_to_int_arrays(words):
-    return np.array([[ord(c) for c in w] for w in words], dtype=np.uint8)
+    # uint32 so that letters beyond Latin-1 (Œ in the French lists) fit
+    return np.array([[ord(c) for c in w] for w in words], dtype=np.uint32)
+
+
+def pattern_dtype(word_length):
+    """Smallest unsigned dtype holding every pattern of words of this length."""
+    n_patterns = 3**word_length
+    if n_patterns <= 2**8:
+        return np.uint8
+    if n_patterns <= 2**16:
+        return np.uint16
+    return np.uint32
 
 
 def generate_pattern_matrix(words1, words2):
@@ -24,6 +33,10 @@ def generate_pattern_matrix(words1, words2):
     (perhaps at the expense of easier readability), and the result
     is saved to file so that this only needs to be evaluated once, and
     all remaining pattern matching is a lookup.
+
+    Letters are compared one pair of positions at a time, so the working
+    memory is one (nw1, nw2) boolean plane per letter plus a few scratch
+    planes, instead of a full (nw1, nw2, nl, nl) equality grid.
     """
 
     # Number of letters/words
@@ -33,46 +46,32 @@ def generate_pattern_matrix(words1, words2):
 
     # Convert word lists to integer arrays
     word_arr1, word_arr2 = map(words_to_int_arrays, (words1, words2))
+    dtype = pattern_dtype(nl)
 
-    # equality_grid keeps track of all equalities between all pairs
-    # of letters in words. Specifically, equality_grid[a, b, i, j]
-    # is true when words[i][a] == words[b][j]
-    equality_grid = np.zeros((nw1, nw2, nl, nl), dtype=bool)
-    for i, j in itertools.product(range(nl), range(nl)):
-        equality_grid[:, :, i, j] = np.equal.outer(word_arr1[:, i], word_arr2[:, j])
-
-    # full_pattern_matrix[a, b] should represent the 5-color pattern
-    # for guess a and answer b, with 0 -> grey, 1 -> yellow, 2 -> green
-    full_pattern_matrix = np.zeros((nw1, nw2, nl), dtype=np.uint8)
-
-    # Green pass
-    for i in range(nl):
-        matches = equality_grid[
-            :,
-            :,
-            i,
-            i,
-        ].flatten()  # matches[a, b] is true when words[a][i] = words[b][i]
-        full_pattern_matrix[:, :, i].flat[matches] = EXACT
-
-        for k in range(nl):
-            # If it's a match, mark all elements associated with
-            # that letter, both from the guess and answer, as covered.
-            # That way, it won't trigger the yellow pass.
-            equality_grid[:, :, k, i].flat[matches] = False
-            equality_grid[:, :, i, k].flat[matches] = False
-
-    # Yellow pass
-    for i, j in itertools.product(range(nl), range(nl)):
-        matches = equality_grid[:, :, i, j].flatten()
-        full_pattern_matrix[:, :, i].flat[matches] = MISPLACED
-        for k in range(nl):
-            # Similar to above, we want to mark this letter
-            # as taken care of, both for answer and guess
-            equality_grid[:, :, k, j].flat[matches] = False
-            equality_grid[:, :, i, k].flat[matches] = False
+    # used[j] is true when the answer letter at position j is already
+    # accounted for (green, or consumed by an earlier yellow)
+    used = [np.equal.outer(word_arr1[:, j], word_arr2[:, j]) for j in range(nl)]
 
     # Rather than representing a color pattern as a lists of integers,
     # store it as a single integer, whose ternary representations corresponds
     # to that list of integers.
-    return np.dot(full_pattern_matrix, (3 ** np.arange(nl)).astype(np.uint8))
+    patterns = np.zeros((nw1, nw2), dtype=dtype)
+    for i in range(nl):
+        weight = dtype(3**i)
+
+        # Green pass for this position
+        done = np.equal.outer(word_arr1[:, i], word_arr2[:, i])
+        patterns[done] += EXACT * weight
+
+        # Yellow pass: the first unused matching answer letter, in order
+        for j in range(nl):
+            if j == i:
+                continue
+            matches = np.equal.outer(word_arr1[:, i], word_arr2[:, j])
+            matches &= ~done
+            matches &= ~used[j]
+            patterns[matches] += MISPLACED * weight
+            used[j] |= matches
+            done |= matches
+
+    return patterns
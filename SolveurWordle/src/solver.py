@@ -7,7 +7,7 @@ from src.entropy import (
     get_entropies,
     get_pattern_distributions,
 )
-from src.pattern import get_pattern, get_possible_words, get_word_buckets
+from src.pattern import get_pattern, get_possible_words, get_word_buckets, get_word_indices
 from src.prior import get_word_list
 
 # Solvers
@@ -130,7 +130,7 @@ def get_score_lower_bounds(allowed_words, possible_words, game_name, language="e
     bucket_counts = get_bucket_counts(allowed_words, possible_words, game_name, language=language)
     n = len(possible_words)
     # Probabilities of getting it in 1
-    p1s = np.array([w in possible_words for w in allowed_words]) / n
+    p1s = np.isin(allowed_words, possible_words) / n
     # Probabilities of getting it in 2
     p2s = bucket_counts / n - p1s
     # Otherwise, assume it's gotten in 3 (which is optimistic)
@@ -202,12 +202,17 @@ def brute_force_optimal_guess(
     else:
         iterable = top_choices
 
+    # Play the games out on grid indices rather than word strings
+    all_indices = get_word_indices(all_words, game_name, language=language)
+    possible_indices = get_word_indices(possible_words, game_name, language=language)
+    word_to_index = dict(zip(all_words, all_indices.tolist(), strict=True))
+
     for next_guess in iterable:
         scores = []
-        for answer in possible_words:
+        for answer in possible_indices:
             score = 1
-            possibilities = list(possible_words)
-            guess = next_guess
+            possibilities = possible_indices
+            guess = word_to_index[next_guess]
             while guess != answer:
                 possibilities = get_possible_words(
                     guess,
@@ -220,7 +225,7 @@ def brute_force_optimal_guess(
                 # the next_guess map and pass it down in the recursive
                 # sub-calls
                 guess = optimal_guess(
-                    all_words,
+                    all_indices,
                     possibilities,
                     priors,
                     game_name=game_name,
@@ -4,22 +4,27 @@ Script de benchmarking complet pour comparer tous les solveurs.
 Compare les performances des différentes approches (simple, CSP, optimisé, supervisé, hybride).
 """
 
+import os
+import json
+import math
 import time
+import argparse
 import numpy as np
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple, Iterator
 from tqdm import tqdm
 import matplotlib.pyplot as plt
 from game.board import Board, GameState
 from solvers.simple_solver import SimpleSolver
 from solvers.ortools_solver import ORToolsSolver
 from solvers.optimized_solver import OptimizedSolver
-from solvers.supervised_solver import SupervisedSolver, HybridSolver
+from solvers.supervised_solver import SupervisedSolver, HybridSolver, BatchedGameRunner
 
 
 class SolverBenchmark:
     """Classe pour benchmarker les solveurs."""
     
-    def __init__(self, width: int, height: int, num_mines: int):
+    def __init__(self, width: int, height: int, num_mines: int, profile_dir: Optional[str] = None):
         """
         Initialise le benchmark.
         
@@ -27,10 +32,13 @@ class SolverBenchmark:
             width: Largeur des grilles
             height: Hauteur des grilles
             num_mines: Nombre de mines
+            profile_dir: Si fourni, instrumente les solveurs et écrit une
+                trace Chrome par partie dans ce dossier
         """
         self.width = width
         self.height = height
         self.num_mines = num_mines
+        self.profile_dir = profile_dir
     
     def run_single_game(self, solver_class, seed: int, **solver_kwargs) -> Dict:
         """
@@ -46,13 +54,14 @@ class SolverBenchmark:
         """
         board = Board(self.width, self.height, self.num_mines, seed=seed)
         solver = solver_class(board, **solver_kwargs)
+        profiler = solver.enable_profiling() if self.profile_dir else None
         
         start_time = time.time()
         move_times = []
         
         while board.game_state == GameState.ONGOING:
             move_start = time.time()
-            move = solver.get_next_move()
+            move = solver.profiled_next_move()
             move_time = time.time() - move_start
             move_times.append(move_time)
             
@@ -86,6 +95,16 @@ class SolverBenchmark:
                 result['num_components'] = comp_stats.get('num_components', 0)
                 result['avg_component_size'] = comp_stats.get('avg_size', 0)
         
+        # Temps par phase et trace de la partie
+        if profiler is not None:
+            summary = profiler.summary()
+            result['phase_ms'] = summary['phase_avg_ms']
+            result['max_component_size'] = summary['max_component_size']
+            profiler.save(os.path.join(
+                self.profile_dir,
+                f"{solver_class.__name__}_{self.width}x{self.height}_{self.num_mines}_seed{seed}.json"
+            ))
+        
         return result
     
     def benchmark_solver(
@@ -93,37 +112,78 @@ class SolverBenchmark:
         solver_class,
         num_games: int = 100,
         seed_start: int = 0,
+        num_workers: int = 1,
+        results_path: Optional[str] = None,
+        batched: bool = False,
         **solver_kwargs
     ) -> Dict:
         """
         Benchmark un solveur sur plusieurs parties.
         
+        Chaque partie ne dépend que de sa seed : les résultats par seed sont
+        identiques quel que soit le nombre de processus, et pour les solveurs
+        CNN, que les parties soient jouées en lot ou une par une.
+        
         Args:
             solver_class: Classe du solveur
             num_games: Nombre de parties
             seed_start: Seed de départ
+            num_workers: Nombre de processus (1 = exécution séquentielle)
+            results_path: Fichier JSONL où chaque partie est ajoutée dès
+                qu'elle se termine ; les seeds déjà présentes sont reprises
+                au lieu d'être rejouées
+            batched: Pour SupervisedSolver et HybridSolver, jouer les parties
+                ensemble avec BatchedGameRunner (une passe du réseau par coup
+                pour tout le lot) ; ignoré si le profilage est activé
             **solver_kwargs: Arguments du solveur
             
         Returns:
             Statistiques agrégées
         """
-        results = []
+        seeds = list(range(seed_start, seed_start + num_games))
+        record_key = self._record_key(solver_class, solver_kwargs)
+        
+        # Reprise : parties déjà jouées
+        results_by_seed = {}
+        if results_path:
+            results_by_seed = self._load_results(results_path, record_key, set(seeds))
+        
+        pending = [seed for seed in seeds if seed not in results_by_seed]
+        jobs = [
+            (self.width, self.height, self.num_mines, solver_class, seed, solver_kwargs, self.profile_dir)
+            for seed in pending
+        ]
         
-        for i in tqdm(range(num_games), desc=f"Testing {solver_class.__name__}"):
-            try:
-                result = self.run_single_game(solver_class, seed_start + i, **solver_kwargs)
-                results.append(result)
-            except Exception as e:
-                print(f"Erreur game {i}: {e}")
-                continue
+        output = self._open_results(results_path) if results_path else None
+        try:
+            if batched and solver_class in (SupervisedSolver, HybridSolver) and not self.profile_dir:
+                games = self._iter_batched_games(solver_class, pending, solver_kwargs)
+            else:
+                games = self._iter_games(jobs, num_workers)
+            for seed, result, error in tqdm(games, total=len(jobs), desc=f"Testing {solver_class.__name__}"):
+                if error is not None:
+                    print(f"Erreur game {seed - seed_start}: {error}")
+                    continue
+                
+                results_by_seed[seed] = result
+                if output is not None:
+                    output.write(json.dumps({**record_key, 'seed': seed, **result}) + '\n')
+                    output.flush()
+        finally:
+            if output is not None:
+                output.close()
+        
+        results = [results_by_seed[seed] for seed in seeds if seed in results_by_seed]
         
         # Agréger les résultats
         num_wins = sum(1 for r in results if r['won'])
+        ci_low, ci_high = self._wilson_interval(num_wins, len(results))
         
         aggregate = {
             'solver_name': solver_class.__name__,
             'num_games': len(results),
             'win_rate': 100 * num_wins / len(results) if results else 0,
+            'win_rate_ci': (100 * ci_low, 100 * ci_high),
             'avg_moves': np.mean([r['num_moves'] for r in results]),
             'avg_logical': np.mean([r['num_logical'] for r in results]),
             'avg_probabilistic': np.mean([r['num_probabilistic'] for r in results]),
@@ -138,13 +198,181 @@ class SolverBenchmark:
             aggregate['avg_components'] = np.mean([r['num_components'] for r in comp_results])
             aggregate['avg_component_size'] = np.mean([r['avg_component_size'] for r in comp_results])
         
+        # Temps moyen par coup et par phase si profilé
+        if any('phase_ms' in r for r in results):
+            phase_results = [r['phase_ms'] for r in results if 'phase_ms' in r]
+            phases = sorted({name for phase_ms in phase_results for name in phase_ms})
+            aggregate['phase_ms'] = {
+                name: np.mean([phase_ms.get(name, 0.0) for phase_ms in phase_results])
+                for name in phases
+            }
+        
         return aggregate
     
+    @staticmethod
+    def _iter_games(jobs: List[Tuple], num_workers: int) -> Iterator[Tuple]:
+        """
+        Exécute les parties, séquentiellement ou dans un pool de processus.
+        
+        Args:
+            jobs: Paramètres de chaque partie (voir _run_game_job)
+            num_workers: Nombre de processus
+            
+        Yields:
+            Tuples (seed, résultat, erreur) dans l'ordre de terminaison
+        """
+        if num_workers <= 1:
+            for job in jobs:
+                yield _run_game_job(job)
+            return
+        
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_run_game_job, job) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def _iter_batched_games(self, solver_class, seeds: List[int], solver_kwargs: Dict) -> Iterator[Tuple]:
+        """
+        Joue les parties d'un solveur CNN en lot avec BatchedGameRunner.
+        
+        Les parties sont jouées par paquets de la taille maximale d'un lot,
+        pour que les résultats soient enregistrés au fil de l'eau.
+        
+        Args:
+            solver_class: SupervisedSolver ou HybridSolver
+            seeds: Seeds des parties
+            solver_kwargs: Arguments du solveur (model_path, model_type...)
+            
+        Yields:
+            Tuples (seed, résultat, None) dans l'ordre des seeds
+        """
+        if not seeds:
+            return
+        
+        kwargs = dict(solver_kwargs)
+        runner = BatchedGameRunner(
+            kwargs.pop('model_path'),
+            self.width,
+            self.height,
+            self.num_mines,
+            hybrid=solver_class is HybridSolver,
+            **kwargs
+        )
+        for start in range(0, len(seeds), runner.max_batch_size):
+            chunk = seeds[start:start + runner.max_batch_size]
+            for seed, result in zip(chunk, runner.run(seeds=chunk)):
+                yield seed, result, None
+    
+    def _record_key(self, solver_class, solver_kwargs: Dict) -> Dict:
+        """
+        Identifie une configuration de benchmark dans le fichier de résultats.
+        
+        Args:
+            solver_class: Classe du solveur
+            solver_kwargs: Arguments du solveur
+            
+        Returns:
+            Dictionnaire des champs identifiant la configuration
+        """
+        return {
+            'solver': solver_class.__name__,
+            'solver_kwargs': repr(sorted(solver_kwargs.items())),
+            'width': self.width,
+            'height': self.height,
+            'num_mines': self.num_mines,
+        }
+    
+    @staticmethod
+    def _load_results(results_path: str, record_key: Dict, seeds: set) -> Dict[int, Dict]:
+        """
+        Charge les parties déjà enregistrées pour une configuration.
+        
+        Les lignes incomplètes (run interrompu pendant l'écriture) sont ignorées.
+        
+        Args:
+            results_path: Fichier JSONL
+            record_key: Champs identifiant la configuration
+            seeds: Seeds recherchées
+            
+        Returns:
+            Dictionnaire {seed: résultat}
+        """
+        results = {}
+        
+        if not os.path.exists(results_path):
+            return results
+        
+        with open(results_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                
+                if any(record.get(key) != value for key, value in record_key.items()):
+                    continue
+                if record.get('seed') not in seeds:
+                    continue
+                
+                result = {k: v for k, v in record.items() if k not in record_key and k != 'seed'}
+                results[record['seed']] = result
+        
+        return results
+    
+    @staticmethod
+    def _open_results(results_path: str):
+        """
+        Ouvre le fichier de résultats en ajout.
+        
+        Si un run précédent a été interrompu au milieu d'une ligne, un retour
+        à la ligne est ajouté pour ne pas corrompre la ligne suivante.
+        
+        Args:
+            results_path: Fichier JSONL
+            
+        Returns:
+            Fichier ouvert en ajout
+        """
+        needs_newline = False
+        if os.path.exists(results_path) and os.path.getsize(results_path) > 0:
+            with open(results_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b'\n'
+        
+        output = open(results_path, 'a', encoding='utf-8')
+        if needs_newline:
+            output.write('\n')
+        return output
+    
+    @staticmethod
+    def _wilson_interval(num_wins: int, num_games: int, z: float = 1.96) -> Tuple[float, float]:
+        """
+        Intervalle de confiance de Wilson (95% par défaut) sur le taux de victoire.
+        
+        Args:
+            num_wins: Nombre de victoires
+            num_games: Nombre de parties
+            z: Quantile de la loi normale
+            
+        Returns:
+            Tuple (borne basse, borne haute) entre 0 et 1
+        """
+        if num_games == 0:
+            return 0.0, 0.0
+        
+        p = num_wins / num_games
+        denominator = 1 + z ** 2 / num_games
+        center = (p + z ** 2 / (2 * num_games)) / denominator
+        margin = z * math.sqrt(p * (1 - p) / num_games + z ** 2 / (4 * num_games ** 2)) / denominator
+        return max(0.0, center - margin), min(1.0, center + margin)
+    
     def compare_solvers(
         self,
         solvers: List[Dict],
         num_games: int = 100,
-        seed_start: int = 0
+        seed_start: int = 0,
+        num_workers: int = 1,
+        results_path: Optional[str] = None
     ) -> List[Dict]:
         """
         Compare plusieurs solveurs.
@@ -153,10 +381,13 @@ class SolverBenchmark:
             solvers: Liste de dict {
                 'class': SolverClass,
                 'name': 'Display Name',
-                'kwargs': {...}
+                'kwargs': {...},
+                'batched': bool (optionnel, voir benchmark_solver)
             }
             num_games: Nombre de parties par solveur
             seed_start: Seed de départ
+            num_workers: Nombre de processus par solveur
+            results_path: Fichier JSONL de résultats (reprise possible)
             
         Returns:
             Liste des résultats agrégés
@@ -180,6 +411,9 @@ class SolverBenchmark:
                     solver_class,
                     num_games,
                     seed_start,
+                    num_workers=num_workers,
+                    results_path=results_path,
+                    batched=solver_config.get('batched', False),
                     **solver_kwargs
                 )
                 result['display_name'] = solver_name
@@ -224,7 +458,8 @@ class SolverBenchmark:
         
         for r in results_sorted:
             print(f"\n🤖 {r['display_name']}")
-            print(f"   Win Rate: {r['win_rate']:.1f}%")
+            print(f"   Win Rate: {r['win_rate']:.1f}% "
+                  f"(IC 95%: {r['win_rate_ci'][0]:.1f}-{r['win_rate_ci'][1]:.1f}%)")
             print(f"   Avg Moves: {r['avg_moves']:.1f}")
             print(f"   Logical: {r['avg_logical']:.1f} ({100*r['avg_logical']/r['avg_moves'] if r['avg_moves']>0 else 0:.1f}%)")
             print(f"   Probabilistic: {r['avg_probabilistic']:.1f}")
@@ -235,6 +470,11 @@ class SolverBenchmark:
             if 'avg_components' in r:
                 print(f"   Avg Components: {r['avg_components']:.1f}")
                 print(f"   Avg Component Size: {r['avg_component_size']:.1f}")
+            
+            if 'phase_ms' in r:
+                print("   Time per Move by Phase:")
+                for name, ms in sorted(r['phase_ms'].items(), key=lambda item: -item[1]):
+                    print(f"     {name:<25} {ms:>8.2f}ms")
     
     def plot_results(self, results: List[Dict], save_path: str = None):
         """
@@ -306,8 +546,45 @@ class SolverBenchmark:
         plt.show()
 
 
-def run_full_benchmark():
-    """Lance un benchmark complet sur toutes les difficultés."""
+def _run_game_job(job: Tuple) -> Tuple[int, Optional[Dict], Optional[str]]:
+    """
+    Joue une partie (fonction de module, exécutable dans un processus de travail).
+    
+    Args:
+        job: Tuple (width, height, num_mines, solver_class, seed, solver_kwargs,
+            profile_dir)
+        
+    Returns:
+        Tuple (seed, résultat JSON-sérialisable ou None, message d'erreur ou None)
+    """
+    width, height, num_mines, solver_class, seed, solver_kwargs, profile_dir = job
+    benchmark = SolverBenchmark(width, height, num_mines, profile_dir)
+    
+    try:
+        result = benchmark.run_single_game(solver_class, seed, **solver_kwargs)
+    except Exception as e:
+        return seed, None, str(e)
+    
+    # Types numpy -> types Python (JSON)
+    result = {key: value.item() if hasattr(value, 'item') else value for key, value in result.items()}
+    return seed, result, None
+
+
+def run_full_benchmark(
+    num_workers: int = 1,
+    results_dir: Optional[str] = None,
+    profile_dir: Optional[str] = None,
+    batched: bool = True
+):
+    """
+    Lance un benchmark complet sur toutes les difficultés.
+    
+    Args:
+        num_workers: Nombre de processus par solveur
+        results_dir: Dossier des fichiers JSONL de résultats (reprise possible)
+        profile_dir: Dossier des traces par partie (profilage activé si fourni)
+        batched: Jouer les parties des solveurs CNN en lot (BatchedGameRunner)
+    """
     
     # Configurations
     difficulties = {
@@ -358,13 +635,15 @@ def run_full_benchmark():
         solvers.append({
             'class': SupervisedSolver,
             'name': 'Supervisé (CNN)',
-            'kwargs': {'model_path': model_path_medium}
+            'kwargs': {'model_path': model_path_medium},
+            'batched': batched
         })
         
         solvers.append({
             'class': HybridSolver,
             'name': 'Hybride (CSP + CNN)',
-            'kwargs': {'model_path': model_path_medium}
+            'kwargs': {'model_path': model_path_medium},
+            'batched': batched
         })
     else:
         print(f"⚠️  Modèle CNN non trouvé: {model_path_medium}")
@@ -381,13 +660,24 @@ def run_full_benchmark():
         benchmark = SolverBenchmark(
             config['width'],
             config['height'],
-            config['num_mines']
+            config['num_mines'],
+            profile_dir=profile_dir
         )
         
+        results_path = None
+        if results_dir:
+            os.makedirs(results_dir, exist_ok=True)
+            results_path = os.path.join(
+                results_dir,
+                f"benchmark_{config['width']}x{config['height']}_{config['num_mines']}.jsonl"
+            )
+        
         results = benchmark.compare_solvers(
             solvers,
             num_games=config['num_games'],
-            seed_start=0
+            seed_start=0,
+            num_workers=num_workers,
+            results_path=results_path
         )
         
         benchmark.print_results(results)
@@ -403,5 +693,45 @@ def run_full_benchmark():
     print(f"{'='*80}\n")
 
 
+def main():
+    """Point d'entrée principal."""
+    parser = argparse.ArgumentParser(description='Benchmark complet des solveurs de démineur')
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Nombre de processus (défaut: nombre de coeurs, 1 = séquentiel)'
+    )
+    
+    parser.add_argument(
+        '--results-dir',
+        type=str,
+        default=None,
+        help='Dossier des résultats JSONL ; relancer avec le même dossier reprend le run'
+    )
+    
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        default=None,
+        help='Active le profilage par phase et écrit une trace Chrome par partie'
+    )
+    
+    parser.add_argument(
+        '--no-batch',
+        action='store_true',
+        help='Joue les parties des solveurs CNN une par une au lieu de les évaluer en lot'
+    )
+    
+    args = parser.parse_args()
+    run_full_benchmark(
+        num_workers=args.workers,
+        results_dir=args.results_dir,
+        profile_dir=args.profile_dir,
+        batched=not args.no_batch
+    )
+
+
 if __name__ == "__main__":
-    run_full_benchmark()
+    main()
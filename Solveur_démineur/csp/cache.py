@@ -0,0 +1,259 @@
+"""
+Cache de transposition des sous-problèmes de frontière.
+
+Les mêmes petites composantes reviennent sans cesse, au sein d'une partie
+comme d'une partie à l'autre : mêmes formes de contraintes, mêmes totaux, à
+une translation et une symétrie de la grille près. Chaque composante est
+ramenée à une forme canonique (la plus petite de ses 8 images par les
+symétries du carré, translatée à l'origine) qui sert de clé ; la valeur est
+la table des comptages par nombre de mines, stockée dans l'ordre canonique
+des variables.
+"""
+
+import os
+import pickle
+from collections import OrderedDict
+from typing import List, Tuple, Dict, Optional
+
+from csp.enumerator import CountResult
+
+
+# Les 8 symétries du carré appliquées à (row, col)
+SYMMETRIES = (
+    lambda r, c: (r, c),
+    lambda r, c: (r, -c),
+    lambda r, c: (-r, c),
+    lambda r, c: (-r, -c),
+    lambda r, c: (c, r),
+    lambda r, c: (c, -r),
+    lambda r, c: (-c, r),
+    lambda r, c: (-c, -r),
+)
+
+
+def canonicalize(
+    variables: List[Tuple[int, int]],
+    constraints: List
+) -> Tuple[Tuple, List[int]]:
+    """
+    Calcule la forme canonique d'une composante.
+
+    Args:
+        variables: Variables de la composante (positions)
+        constraints: Contraintes de somme sur ces variables
+
+    Returns:
+        Tuple (clé, mapping) où mapping[i] est l'indice canonique de
+        variables[i]
+    """
+    best_key, best_mapping = None, None
+
+    for transform in SYMMETRIES:
+        image = [transform(r, c) for r, c in variables]
+        min_r = min(r for r, _ in image)
+        min_c = min(c for _, c in image)
+        image = [(r - min_r, c - min_c) for r, c in image]
+
+        positions = sorted(image)
+        if best_key is not None and tuple(positions) > best_key[0]:
+            continue
+
+        canonical_index = {pos: i for i, pos in enumerate(positions)}
+        mapping = [canonical_index[pos] for pos in image]
+        original_index = dict(zip(variables, mapping))
+        shape = sorted(
+            (tuple(sorted(original_index[v] for v in constraint.variables if v in original_index)),
+             constraint.total)
+            for constraint in constraints
+        )
+
+        key = (tuple(positions), tuple(shape))
+        if best_key is None or key < best_key:
+            best_key, best_mapping = key, mapping
+
+    return best_key, best_mapping
+
+
+class TranspositionCache:
+    """
+    Cache LRU des comptages de solutions par forme canonique de composante.
+
+    Seuls les comptages complets (non interrompus) sont conservés. Un
+    comptage calculé avec une borne max_mines sert toutes les requêtes de
+    borne inférieure ou égale : il suffit d'en retirer les entrées au-delà.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100000,
+        path: Optional[str] = None,
+        min_variables: int = 8
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            max_entries: Nombre maximal d'entrées avant éviction LRU
+            path: Fichier de persistance (chargé s'il existe, voir save())
+            min_variables: Taille minimale des composantes mises en cache (en
+                dessous, la canonicalisation coûte plus que le comptage)
+        """
+        self.max_entries = max_entries
+        self.min_variables = min_variables
+        self.path = path
+        self.entries: OrderedDict = OrderedDict()
+        # Formes canoniques déjà calculées, par positions exactes : une
+        # composante inchangée d'un coup à l'autre évite la canonicalisation
+        self.canonical_forms: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def lookup(
+        self,
+        variables: List[Tuple[int, int]],
+        constraints: List,
+        max_mines: Optional[int] = None
+    ) -> Tuple[Optional[CountResult], Tuple]:
+        """
+        Cherche le comptage d'une composante.
+
+        Args:
+            variables: Variables de la composante
+            constraints: Contraintes de la composante
+            max_mines: Nombre maximal de mines (optionnel)
+
+        Returns:
+            Tuple (résultat ou None, handle à passer à store(), None si la
+            composante est trop petite pour être mise en cache)
+        """
+        if len(variables) < self.min_variables:
+            return None, None
+
+        exact_key = (
+            tuple(variables),
+            tuple((tuple(constraint.variables), constraint.total) for constraint in constraints)
+        )
+        handle = self.canonical_forms.get(exact_key)
+        if handle is None:
+            handle = canonicalize(variables, constraints)
+            self.canonical_forms[exact_key] = handle
+            while len(self.canonical_forms) > self.max_entries:
+                self.canonical_forms.popitem(last=False)
+        else:
+            self.canonical_forms.move_to_end(exact_key)
+        key, mapping = handle
+
+        entry = self.entries.get(key)
+        if entry is None or not _covers(entry[0], max_mines):
+            self.misses += 1
+            return None, handle
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+
+        _, solutions, mine_counts = entry
+        result = CountResult(variables)
+        for k, count in solutions.items():
+            if max_mines is not None and k > max_mines:
+                continue
+            canonical_counts = mine_counts[k]
+            result.solutions[k] = count
+            result.mine_counts[k] = [canonical_counts[i] for i in mapping]
+        return result, handle
+
+    def store(self, handle: Tuple, result: CountResult, max_mines: Optional[int] = None):
+        """
+        Enregistre le comptage d'une composante.
+
+        Args:
+            handle: Handle retourné par lookup()
+            result: Comptage obtenu
+            max_mines: Borne utilisée pour ce comptage
+        """
+        if handle is None or not result.complete:
+            return
+
+        key, mapping = handle
+        mine_counts = {}
+        for k, counts in result.mine_counts.items():
+            canonical_counts = [0] * len(mapping)
+            for i, count in zip(mapping, counts):
+                canonical_counts[i] = count
+            mine_counts[k] = canonical_counts
+
+        self.entries[key] = (max_mines, dict(result.solutions), mine_counts)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def save(self, path: Optional[str] = None):
+        """
+        Sauvegarde le cache sur disque (écriture atomique).
+
+        Args:
+            path: Fichier de destination (par défaut celui du constructeur)
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("Aucun fichier de persistance spécifié")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(list(self.entries.items()), f)
+        os.replace(path + '.tmp', path)
+
+    def load(self, path: str):
+        """
+        Charge des entrées depuis le disque (les plus récentes en dernier).
+
+        Args:
+            path: Fichier créé par save()
+        """
+        with open(path, 'rb') as f:
+            for key, entry in pickle.load(f):
+                self.entries[key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        """
+        Retourne les statistiques du cache.
+
+        Returns:
+            Dictionnaire (entries, hits, misses, hit_rate)
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def _covers(cached_max_mines: Optional[int], max_mines: Optional[int]) -> bool:
+    """Indique si un comptage borné par cached_max_mines sert la borne max_mines."""
+    if cached_max_mines is None:
+        return True
+    return max_mines is not None and max_mines <= cached_max_mines
+
+
+_default_cache = None
+
+
+def get_default_cache() -> TranspositionCache:
+    """
+    Retourne le cache partagé par les solveurs du processus.
+
+    Returns:
+        TranspositionCache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TranspositionCache()
+    return _default_cache
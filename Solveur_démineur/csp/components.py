@@ -65,6 +65,39 @@ class ComponentDetector:
         self.components = components
         return components
     
+    def find_components_from_frontier(
+        self,
+        frontier,
+        variables: List[Tuple[int, int]]
+    ) -> List[Dict]:
+        """
+        Récupère les composantes maintenues par une frontière incrémentale.
+        
+        Évite de reconstruire le graphe d'adjacence : les composantes de la
+        frontière sont déjà à jour (union-find). Les variables hors frontière
+        forment chacune une composante sans contrainte, comme dans
+        find_components.
+        
+        Args:
+            frontier: IncrementalFrontier attachée à la grille
+            variables: Liste des positions des variables (row, col)
+            
+        Returns:
+            Liste de dictionnaires au même format que find_components
+        """
+        components = list(frontier.get_components())
+        
+        constrained = set()
+        for comp in components:
+            constrained.update(comp['variables'])
+        
+        for var in variables:
+            if var not in constrained:
+                components.append({'variables': [var], 'constraints': []})
+        
+        self.components = components
+        return components
+    
     def _build_adjacency_graph(
         self,
         variables: List[Tuple[int, int]],
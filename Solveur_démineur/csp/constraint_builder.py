@@ -4,6 +4,7 @@ Construction de contraintes CSP pour le démineur.
 Transforme l'état du jeu en un problème de satisfaction de contraintes.
 """
 
+import numpy as np
 from typing import List, Tuple, Dict, Set
 from game.board import Board, CellState
 
@@ -29,14 +30,22 @@ class Constraint:
 class ConstraintBuilder:
     """Construit les contraintes CSP à partir de la grille."""
     
-    def __init__(self, board: Board):
+    def __init__(self, board: Board, incremental: bool = True):
         """
         Initialise le constructeur de contraintes.
         
         Args:
             board: Grille de démineur
+            incremental: Maintenir la frontière au fil des coups au lieu de
+                reconstruire toutes les contraintes à chaque appel
         """
         self.board = board
+        self.frontier = None
+        
+        if incremental:
+            # Importer ici pour éviter dépendance circulaire
+            from csp.frontier import IncrementalFrontier
+            self.frontier = IncrementalFrontier(board)
     
     def build_constraints(self) -> Tuple[List[Tuple[int, int]], List[Constraint]]:
         """
@@ -53,6 +62,10 @@ class ConstraintBuilder:
         if not variables:
             return [], []
         
+        # Frontière incrémentale : contraintes déjà à jour
+        if self.frontier is not None:
+            return variables, self.frontier.get_constraints()
+        
         # Contraintes à partir des cases révélées
         constraints = []
         
@@ -90,13 +103,9 @@ class ConstraintBuilder:
             Contrainte globale
         """
         # Compter les mines déjà révélées ou marquées
-        revealed_mines = 0
-        for r in range(self.board.height):
-            for c in range(self.board.width):
-                if self.board.cell_states[r, c] == CellState.REVEALED and self.board.mines[r, c]:
-                    revealed_mines += 1
-                elif self.board.cell_states[r, c] == CellState.FLAGGED:
-                    revealed_mines += 1
+        revealed_mask = self.board.cell_states == CellState.REVEALED
+        revealed_mines = int(np.count_nonzero(self.board.mines & revealed_mask))
+        revealed_mines += self.board.num_flagged
         
         remaining_mines = self.board.num_mines - revealed_mines
         return Constraint(variables, remaining_mines)
@@ -0,0 +1,330 @@
+"""
+Comptage exact des solutions d'un CSP de démineur.
+
+Backtracking dédié aux contraintes de somme : ordre de variables par
+parcours en largeur du graphe de contraintes, propagation des contraintes
+saturées (reste = 0 ou reste = nombre de cases inconnues), et comptage des
+solutions par nombre de mines sans jamais les stocker.
+"""
+
+import time
+from math import comb
+from collections import deque
+from typing import List, Tuple, Dict, Optional
+
+
+class CountResult:
+    """
+    Résultat d'un comptage de solutions.
+
+    Attributes:
+        variables: Variables comptées (positions), dans l'ordre d'origine
+        solutions: {nombre de mines k: nombre de solutions avec k mines}
+        mine_counts: {k: liste, par variable, du nombre de solutions à k
+            mines où la variable est une mine}
+        complete: False si le comptage a été interrompu (limite de temps)
+    """
+
+    def __init__(self, variables: List[Tuple[int, int]]):
+        """
+        Initialise un résultat vide.
+
+        Args:
+            variables: Variables du problème
+        """
+        self.variables = variables
+        self.solutions: Dict[int, int] = {}
+        self.mine_counts: Dict[int, List[int]] = {}
+        self.complete = True
+
+    def total(self) -> int:
+        """Retourne le nombre total de solutions."""
+        return sum(self.solutions.values())
+
+    def __repr__(self):
+        return f"CountResult({len(self.variables)} vars, {self.total()} solutions)"
+
+
+class SolutionCounter:
+    """Compte les solutions d'un ensemble de contraintes de somme."""
+
+    def __init__(self, time_limit: Optional[float] = None, cache=None):
+        """
+        Initialise le compteur.
+
+        Args:
+            time_limit: Durée maximale d'un comptage en secondes (None = exact,
+                sans limite)
+            cache: TranspositionCache consulté avant chaque comptage (optionnel)
+        """
+        self.time_limit = time_limit
+        self.cache = cache
+        self.num_nodes = 0
+
+    def count(
+        self,
+        variables: List[Tuple[int, int]],
+        constraints: List,
+        max_mines: Optional[int] = None
+    ) -> CountResult:
+        """
+        Compte les solutions, ventilées par nombre de mines.
+
+        Les variables n'apparaissant dans aucune contrainte ne sont pas
+        énumérées : leur contribution est ajoutée par coefficients binomiaux.
+
+        Args:
+            variables: Variables du CSP (positions)
+            constraints: Contraintes de somme (objets Constraint)
+            max_mines: Nombre maximal de mines dans une solution (optionnel)
+
+        Returns:
+            CountResult
+        """
+        self.num_nodes = 0
+        handle = None
+        if self.cache is not None:
+            cached, handle = self.cache.lookup(variables, constraints, max_mines)
+            if cached is not None:
+                return cached
+
+        result = CountResult(variables)
+        n = len(variables)
+        problem = _index_problem(variables, constraints)
+        if problem is None:
+            return result
+        cons_vars, totals, var_cons = problem
+
+        constrained = [i for i in range(n) if var_cons[i]]
+        free = [i for i in range(n) if not var_cons[i]]
+
+        # Énumération de la partie contrainte
+        search = _Search(n, cons_vars, totals, var_cons, max_mines, self.time_limit)
+        search.run(self._order(constrained, cons_vars, var_cons))
+        self.num_nodes = search.num_nodes
+        result.complete = not search.interrupted
+
+        # Ajout des variables libres (coefficients binomiaux)
+        f = len(free)
+        for k, count in search.solutions.items():
+            mines = search.mine_counts[k]
+            for j in range(f + 1):
+                total_mines = k + j
+                if max_mines is not None and total_mines > max_mines:
+                    break
+
+                ways = comb(f, j)
+                ways_free_mine = comb(f - 1, j - 1) if j > 0 else 0
+
+                result.solutions[total_mines] = result.solutions.get(total_mines, 0) + count * ways
+                per_var = result.mine_counts.setdefault(total_mines, [0] * n)
+                for i in constrained:
+                    if mines[i]:
+                        per_var[i] += mines[i] * ways
+                if ways_free_mine:
+                    for i in free:
+                        per_var[i] += count * ways_free_mine
+
+        if handle is not None:
+            self.cache.store(handle, result, max_mines)
+        return result
+
+    @staticmethod
+    def _order(
+        constrained: List[int],
+        cons_vars: List[List[int]],
+        var_cons: List[List[int]]
+    ) -> List[int]:
+        """
+        Ordonne les variables par parcours en largeur du graphe de contraintes.
+
+        Les contraintes se referment ainsi au plus tôt, ce qui déclenche la
+        propagation et l'élagage près de la racine.
+
+        Returns:
+            Liste d'indices de variables
+        """
+        order = []
+        seen = set()
+        for start in constrained:
+            if start in seen:
+                continue
+            seen.add(start)
+            queue = deque([start])
+            while queue:
+                i = queue.popleft()
+                order.append(i)
+                for c in var_cons[i]:
+                    for j in cons_vars[c]:
+                        if j not in seen:
+                            seen.add(j)
+                            queue.append(j)
+        return order
+
+
+def _index_problem(
+    variables: List[Tuple[int, int]],
+    constraints: List
+) -> Optional[Tuple[List[List[int]], List[int], List[List[int]]]]:
+    """
+    Traduit les contraintes en indices de variables.
+
+    Returns:
+        Tuple (cons_vars, totals, var_cons), ou None si une contrainte sans
+        variable du problème exige des mines
+    """
+    index = {var: i for i, var in enumerate(variables)}
+
+    cons_vars = []
+    totals = []
+    for constraint in constraints:
+        members = [index[v] for v in constraint.variables if v in index]
+        if not members:
+            if constraint.total != 0:
+                return None
+            continue
+        cons_vars.append(members)
+        totals.append(constraint.total)
+
+    var_cons = [[] for _ in range(len(variables))]
+    for c, members in enumerate(cons_vars):
+        for i in members:
+            var_cons[i].append(c)
+
+    return cons_vars, totals, var_cons
+
+
+class _Search:
+    """État mutable du backtracking (affectations, restes, trail)."""
+
+    def __init__(self, n, cons_vars, totals, var_cons, max_mines, time_limit):
+        self.cons_vars = cons_vars
+        self.var_cons = var_cons
+        self.max_mines = max_mines
+        self.value = [-1] * n
+        self.remaining = list(totals)
+        self.unknown = [len(members) for members in cons_vars]
+        self.mines = 0
+        self.trail = []
+
+        self.solutions = {}
+        self.mine_counts = {}
+        self.num_nodes = 0
+        self.interrupted = False
+        self.deadline = time.perf_counter() + time_limit if time_limit is not None else None
+
+    def feasible_at_root(self) -> bool:
+        """Vérifie que les totaux et la borne de mines sont atteignables."""
+        for c, members in enumerate(self.cons_vars):
+            if not 0 <= self.remaining[c] <= len(members):
+                return False
+        return self.max_mines is None or self.max_mines >= 0
+
+    def run(self, order: List[int]):
+        """Lance l'énumération selon l'ordre donné."""
+        if not self.feasible_at_root():
+            return
+        self.order = order
+        self._branch(0)
+
+    def _branch(self, pos: int):
+        """
+        Explore les affectations à partir de la position `pos`.
+
+        Parcours en profondeur avec une pile explicite (et non récursif) :
+        une composante de plusieurs milliers de cases atteint la limite de
+        temps au lieu de dépasser la profondeur de récursion de Python.
+        """
+        order, value = self.order, self.value
+        # Une entrée par variable de branchement : [position, prochaine valeur, marque du trail]
+        stack = []
+        while True:
+            while pos < len(order) and value[order[pos]] != -1:
+                pos += 1
+
+            if pos == len(order):
+                self._record()
+            else:
+                self.num_nodes += 1
+                if self.deadline is not None and self.num_nodes & 1023 == 0:
+                    if time.perf_counter() > self.deadline:
+                        self.interrupted = True
+                if self.interrupted:
+                    if stack:
+                        self._undo(stack[0][2])
+                    return
+                stack.append([pos, 0, len(self.trail)])
+
+            # Valeur suivante de la variable la plus profonde encore ouverte
+            while stack:
+                frame = stack[-1]
+                self._undo(frame[2])
+                if frame[1] > 1:
+                    stack.pop()
+                    continue
+                val = frame[1]
+                frame[1] += 1
+                if self._assign(order[frame[0]], val):
+                    pos = frame[0] + 1
+                    break
+            else:
+                return
+
+    def _assign(self, var: int, val: int) -> bool:
+        """
+        Affecte une variable puis propage les contraintes saturées.
+
+        Returns:
+            False si une contrainte devient impossible
+        """
+        stack = [(var, val)]
+        while stack:
+            var, val = stack.pop()
+            if self.value[var] != -1:
+                if self.value[var] != val:
+                    return False
+                continue
+
+            self.value[var] = val
+            self.trail.append(var)
+            self.mines += val
+            for c in self.var_cons[var]:
+                self.unknown[c] -= 1
+                self.remaining[c] -= val
+
+            if self.max_mines is not None and self.mines > self.max_mines:
+                return False
+
+            for c in self.var_cons[var]:
+                rem, unk = self.remaining[c], self.unknown[c]
+                if rem < 0 or rem > unk:
+                    return False
+                if unk and (rem == 0 or rem == unk):
+                    forced = 1 if rem else 0
+                    for other in self.cons_vars[c]:
+                        if self.value[other] == -1:
+                            stack.append((other, forced))
+        return True
+
+    def _undo(self, mark: int):
+        """Annule les affectations jusqu'à la marque donnée."""
+        trail, value = self.trail, self.value
+        while len(trail) > mark:
+            var = trail.pop()
+            val = value[var]
+            for c in self.var_cons[var]:
+                self.unknown[c] += 1
+                self.remaining[c] += val
+            self.mines -= val
+            value[var] = -1
+
+    def _record(self):
+        """Comptabilise la solution courante."""
+        k = self.mines
+        self.solutions[k] = self.solutions.get(k, 0) + 1
+        counts = self.mine_counts.get(k)
+        if counts is None:
+            counts = self.mine_counts[k] = [0] * len(self.value)
+        for var in self.order:
+            if self.value[var] == 1:
+                counts[var] += 1
@@ -0,0 +1,237 @@
+"""
+Frontière incrémentale du graphe de contraintes.
+
+Maintient les contraintes de la frontière (cases révélées ayant des voisins
+cachés) et les composantes connexes au fil des coups, en s'abonnant aux
+changements d'état de la grille. Seules les contraintes touchées par un
+coup sont recalculées, et les composantes sont suivies par union-find.
+"""
+
+from typing import List, Tuple, Dict, Set
+from game.board import Board, HIDDEN, REVEALED, FLAGGED
+from csp.constraint_builder import Constraint
+
+
+class UnionFind:
+    """Union-find avec suivi des membres de chaque composante."""
+
+    def __init__(self):
+        """Initialise une structure vide."""
+        self.parent = {}
+        self.members = {}
+
+    def __contains__(self, item) -> bool:
+        return item in self.parent
+
+    def add(self, item):
+        """Ajoute un élément isolé (sans effet s'il existe déjà)."""
+        if item not in self.parent:
+            self.parent[item] = item
+            self.members[item] = {item}
+
+    def find(self, item):
+        """Retourne le représentant de la composante (compression de chemin)."""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        """Fusionne les composantes de `a` et `b` (union par taille)."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if len(self.members[root_a]) < len(self.members[root_b]):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.members[root_a] |= self.members.pop(root_b)
+
+    def detach(self, root) -> Set:
+        """
+        Retire entièrement une composante de la structure.
+
+        Args:
+            root: Représentant de la composante
+
+        Returns:
+            Ensemble des éléments retirés
+        """
+        items = self.members.pop(root)
+        for item in items:
+            del self.parent[item]
+        return items
+
+
+class IncrementalFrontier:
+    """
+    Contraintes de frontière et composantes maintenues incrémentalement.
+
+    Une contrainte est indexée par la case révélée qui la porte (indice
+    linéaire). Après chaque coup, seules les contraintes des cases modifiées
+    et de leurs voisines révélées sont recalculées ; les composantes dont une
+    variable a perdu un lien sont reconstruites, les autres sont conservées.
+    """
+
+    def __init__(self, board: Board):
+        """
+        Initialise la frontière à partir de l'état courant de la grille.
+
+        Args:
+            board: Grille de démineur (la frontière s'abonne à ses changements)
+        """
+        self.board = board
+        self.width = board.width
+        self._neighbors = board._get_neighbor_table()
+
+        # Contraintes indexées par case révélée
+        self.constraints: Dict[int, Constraint] = {}
+        # Variable -> cases révélées dont elle fait partie de la contrainte
+        self._var_constraints: Dict[Tuple[int, int], Set[int]] = {}
+        self._components = UnionFind()
+        self._cached_components = None
+
+        initial = [r * self.width + c for r, c in board.get_revealed_cells()]
+        initial += [r * self.width + c for r, c in board.get_flagged_cells()]
+        self._on_board_change(initial)
+
+        board.add_listener(self._on_board_change)
+
+    def detach(self):
+        """Désabonne la frontière de la grille."""
+        self.board.remove_listener(self._on_board_change)
+
+    def _on_board_change(self, changed: List[int]):
+        """
+        Met à jour les contraintes touchées par un changement de la grille.
+
+        Args:
+            changed: Indices linéaires des cases dont l'état a changé
+        """
+        states = self.board.cell_states.reshape(-1)
+        mines = self.board.mines.reshape(-1)
+
+        # Contraintes à recalculer : cases modifiées et voisines révélées
+        touched = set()
+        for idx in changed:
+            for cell in [idx] + self._neighbors[idx]:
+                if states[cell] == REVEALED and not mines[cell]:
+                    touched.add(cell)
+
+        if not touched:
+            return
+
+        self._cached_components = None
+        unlinked = set()
+
+        for key in touched:
+            old = self.constraints.pop(key, None)
+            new = self._make_constraint(key)
+            old_vars = set(old.variables) if old else set()
+            new_vars = set(new.variables) if new else set()
+
+            for var in old_vars - new_vars:
+                self._var_constraints[var].discard(key)
+                unlinked.add(var)
+            for var in new_vars - old_vars:
+                self._var_constraints.setdefault(var, set()).add(key)
+
+            if new:
+                self.constraints[key] = new
+
+        # Reconstruire les composantes dont une variable a perdu un lien
+        dirty_vars = set()
+        dirty_roots = {self._components.find(v) for v in unlinked if v in self._components}
+        for root in dirty_roots:
+            dirty_vars |= self._components.detach(root)
+
+        for var in list(dirty_vars | unlinked):
+            if not self._var_constraints.get(var):
+                self._var_constraints.pop(var, None)
+                dirty_vars.discard(var)
+
+        relink = set(touched)
+        for var in dirty_vars:
+            relink |= self._var_constraints[var]
+
+        for key in relink:
+            constraint = self.constraints.get(key)
+            if constraint is None:
+                continue
+            first = constraint.variables[0]
+            self._components.add(first)
+            for var in constraint.variables[1:]:
+                self._components.add(var)
+                self._components.union(first, var)
+
+    def _make_constraint(self, key: int):
+        """
+        Construit la contrainte portée par une case révélée.
+
+        Args:
+            key: Indice linéaire de la case révélée
+
+        Returns:
+            Constraint, ou None si la case n'a pas de voisin caché
+        """
+        states = self.board.cell_states.reshape(-1)
+        w = self.width
+
+        hidden_neighbors = []
+        flagged_count = 0
+        for n in self._neighbors[key]:
+            if states[n] == HIDDEN:
+                hidden_neighbors.append(divmod(n, w))
+            elif states[n] == FLAGGED:
+                flagged_count += 1
+
+        if not hidden_neighbors:
+            return None
+
+        value = int(self.board.values.flat[key])
+        return Constraint(hidden_neighbors, value - flagged_count)
+
+    def get_variables(self) -> List[Tuple[int, int]]:
+        """
+        Retourne les variables de la frontière (cases cachées contraintes).
+
+        Returns:
+            Liste triée des positions (row, col)
+        """
+        return sorted(self._var_constraints)
+
+    def get_constraints(self) -> List[Constraint]:
+        """
+        Retourne les contraintes courantes, dans l'ordre des cases révélées.
+
+        Les objets Constraint sont remplacés (jamais modifiés) lors des mises
+        à jour : ils peuvent être conservés par l'appelant.
+
+        Returns:
+            Liste des contraintes
+        """
+        return [self.constraints[key] for key in sorted(self.constraints)]
+
+    def get_components(self) -> List[Dict]:
+        """
+        Retourne les composantes connexes de la frontière.
+
+        Returns:
+            Liste de dictionnaires {'variables': [...], 'constraints': [...]},
+            au même format que ComponentDetector.find_components
+        """
+        if self._cached_components is not None:
+            return self._cached_components
+
+        grouped = {}
+        for root, members in self._components.members.items():
+            grouped[root] = {'variables': sorted(members), 'constraints': []}
+
+        for key in sorted(self.constraints):
+            constraint = self.constraints[key]
+            root = self._components.find(constraint.variables[0])
+            grouped[root]['constraints'].append(constraint)
+
+        components = sorted(grouped.values(), key=lambda comp: comp['variables'][0])
+        self._cached_components = components
+        return components
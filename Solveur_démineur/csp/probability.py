@@ -5,6 +5,7 @@ Calcul de probabilités exactes pour le démineur.
 la probabilité qu'une case contienne une mine.
 """
 
+from math import comb
 from typing import List, Dict, Tuple, Set
 from collections import defaultdict
 
@@ -46,6 +47,111 @@ class ProbabilityCalculator:
         
         return probabilities
     
+    @staticmethod
+    def calculate_probabilities_from_counts(counts) -> Dict[Tuple[int, int], float]:
+        """
+        Calcule les probabilités à partir d'un comptage de solutions.
+        
+        Args:
+            counts: CountResult (csp.enumerator) avec comptages par nombre de mines
+            
+        Returns:
+            Dictionnaire {position: probabilité}
+        """
+        total = counts.total()
+        
+        if total == 0:
+            # Aucune solution trouvée, probabilité uniforme
+            return {var: 0.5 for var in counts.variables}
+        
+        # Sommer les comptages de chaque variable sur tous les nombres de mines
+        mine_counts = [0] * len(counts.variables)
+        for per_var in counts.mine_counts.values():
+            for i, count in enumerate(per_var):
+                mine_counts[i] += count
+        
+        return {
+            var: mine_counts[i] / total
+            for i, var in enumerate(counts.variables)
+        }
+    
+    @staticmethod
+    def combine_component_counts(component_counts: List, 
+                                 interior: List[Tuple[int, int]],
+                                 remaining_mines: int) -> Dict[Tuple[int, int], float]:
+        """
+        Combine les comptages de composantes indépendantes en probabilités globales.
+        
+        Les polynômes "nombre de solutions par nombre de mines" des composantes
+        sont convolués, puis chaque total m de mines de frontière est pondéré
+        par C(U, M - m) : le nombre de façons de placer les mines restantes
+        parmi les U cases intérieures (non contraintes).
+        
+        Args:
+            component_counts: CountResult de chaque composante de frontière
+            interior: Cases cachées hors frontière
+            remaining_mines: Nombre de mines restantes M
+            
+        Returns:
+            Dictionnaire {position: probabilité}, vide si aucune configuration
+        """
+        num_interior = len(interior)
+        
+        def weight(frontier_mines: int) -> int:
+            interior_mines = remaining_mines - frontier_mines
+            if 0 <= interior_mines <= num_interior:
+                return comb(num_interior, interior_mines)
+            return 0
+        
+        polynomials = [
+            {k: count for k, count in counts.solutions.items() if count}
+            for counts in component_counts
+        ]
+        
+        # Produits préfixes / suffixes pour exclure une composante en O(C)
+        prefix = [{0: 1}]
+        for poly in polynomials:
+            prefix.append(_convolve(prefix[-1], poly))
+        suffix = [{0: 1}]
+        for poly in reversed(polynomials):
+            suffix.append(_convolve(suffix[-1], poly))
+        suffix.reverse()
+        
+        full = prefix[-1]
+        total = sum(count * weight(m) for m, count in full.items())
+        
+        if total == 0:
+            return {}
+        
+        probabilities = {}
+        
+        for i, counts in enumerate(component_counts):
+            others = _convolve(prefix[i], suffix[i + 1])
+            mine_weights = [0] * len(counts.variables)
+            
+            for k, per_var in counts.mine_counts.items():
+                factor = sum(count * weight(k + m) for m, count in others.items())
+                if factor:
+                    for j, count in enumerate(per_var):
+                        mine_weights[j] += count * factor
+            
+            for j, var in enumerate(counts.variables):
+                probabilities[var] = mine_weights[j] / total
+        
+        if num_interior:
+            # Configurations où une case intérieure donnée est une mine
+            interior_weight = 0
+            for m, count in full.items():
+                interior_mines = remaining_mines - m
+                if 1 <= interior_mines <= num_interior:
+                    interior_weight += count * comb(num_interior - 1, interior_mines - 1)
+            
+            interior_probability = interior_weight / total
+            for var in interior:
+                probabilities[var] = interior_probability
+        
+        return probabilities
+    
     @staticmethod
     def find_best_move(probabilities: Dict[Tuple[int, int], float]) -> Tuple[int, int]:
         """
@@ -87,3 +193,12 @@ class ProbabilityCalculator:
                 certain_mines.add(pos)
         
         return certain_safe, certain_mines
+
+
+def _convolve(a: Dict[int, int], b: Dict[int, int]) -> Dict[int, int]:
+    """Produit de deux polynômes {nombre de mines: nombre de solutions}."""
+    result = defaultdict(int)
+    for ka, ca in a.items():
+        for kb, cb in b.items():
+            result[ka + kb] += ca * cb
+    return dict(result)
@@ -0,0 +1,196 @@
+"""
+Estimation des comptages de solutions par échantillonnage.
+
+Pour les composantes trop grandes pour une énumération exacte dans le temps
+imparti. Chaque échantillon descend l'arbre de recherche du compteur exact
+(même ordre de variables, même propagation) en choisissant au hasard parmi
+les valeurs encore possibles ; son poids est le produit du nombre de choix
+rencontrés (estimateur de Knuth). Les sommes pondérées sont des estimateurs
+sans biais des comptages par nombre de mines, utilisables tels quels par la
+combinaison globale des composantes.
+"""
+
+import math
+import random
+import time
+from typing import List, Tuple, Dict, Optional
+
+from csp.enumerator import CountResult, SolutionCounter, _Search, _index_problem
+
+
+class SampleResult(CountResult):
+    """
+    Comptage estimé par échantillonnage.
+
+    Les comptages sont normalisés (leur somme vaut 1) : seules leurs
+    proportions comptent pour le calcul des probabilités.
+
+    Attributes:
+        num_samples: Nombre d'échantillons tirés
+        num_valid: Nombre d'échantillons aboutissant à une solution
+        std_errors: Erreur standard de la probabilité de chaque variable
+    """
+
+    def __init__(self, variables: List[Tuple[int, int]]):
+        super().__init__(variables)
+        self.complete = False
+        self.num_samples = 0
+        self.num_valid = 0
+        self.std_errors: List[float] = [0.0] * len(variables)
+
+    def confidence_intervals(self, z: float = 1.96) -> Dict[Tuple[int, int], Tuple[float, float]]:
+        """
+        Intervalles de confiance des probabilités de la composante.
+
+        Args:
+            z: Quantile de la loi normale (1.96 pour 95%)
+
+        Returns:
+            Dictionnaire {position: (borne basse, borne haute)}
+        """
+        totals = [0.0] * len(self.variables)
+        for per_var in self.mine_counts.values():
+            for i, count in enumerate(per_var):
+                totals[i] += count
+
+        intervals = {}
+        for i, var in enumerate(self.variables):
+            margin = z * self.std_errors[i]
+            intervals[var] = (max(0.0, totals[i] - margin), min(1.0, totals[i] + margin))
+        return intervals
+
+    def __repr__(self):
+        return f"SampleResult({len(self.variables)} vars, {self.num_valid}/{self.num_samples} samples)"
+
+
+class SolutionSampler:
+    """Estime les comptages de solutions d'une composante par échantillonnage."""
+
+    def __init__(
+        self,
+        num_samples: int = 5000,
+        time_limit: Optional[float] = 1.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialise l'échantillonneur.
+
+        Args:
+            num_samples: Nombre maximal d'échantillons par composante
+            time_limit: Durée maximale par composante en secondes (None = pas
+                de limite)
+            seed: Graine du générateur aléatoire
+        """
+        self.num_samples = num_samples
+        self.time_limit = time_limit
+        self.rng = random.Random(seed)
+
+    def sample(
+        self,
+        variables: List[Tuple[int, int]],
+        constraints: List,
+        max_mines: Optional[int] = None
+    ) -> SampleResult:
+        """
+        Estime les comptages par nombre de mines.
+
+        Args:
+            variables: Variables du CSP (positions)
+            constraints: Contraintes de somme (objets Constraint)
+            max_mines: Nombre maximal de mines dans une solution (optionnel)
+
+        Returns:
+            SampleResult (vide si aucun échantillon n'a abouti)
+        """
+        result = SampleResult(variables)
+        n = len(variables)
+        problem = _index_problem(variables, constraints)
+        if problem is None:
+            return result
+        cons_vars, totals, var_cons = problem
+
+        search = _Search(n, cons_vars, totals, var_cons, max_mines, None)
+        if not search.feasible_at_root():
+            return result
+
+        constrained = [i for i in range(n) if var_cons[i]]
+        free = [i for i in range(n) if not var_cons[i]]
+        order = SolutionCounter._order(constrained, cons_vars, var_cons) + free
+
+        # Sommes pondérées : poids, poids², et par variable (mine) w et w²
+        weight_by_k: Dict[int, float] = {}
+        mines_by_k: Dict[int, List[float]] = {}
+        sum_w = sum_w2 = 0.0
+        sum_w2_x = [0.0] * n
+
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+        while result.num_samples < self.num_samples:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            result.num_samples += 1
+
+            weight = self._descend(search, order)
+            if weight:
+                result.num_valid += 1
+                k = search.mines
+                weight_by_k[k] = weight_by_k.get(k, 0.0) + weight
+                per_var = mines_by_k.get(k)
+                if per_var is None:
+                    per_var = mines_by_k[k] = [0.0] * n
+                w2 = weight * weight
+                sum_w += weight
+                sum_w2 += w2
+                for i in search.trail:
+                    if search.value[i] == 1:
+                        per_var[i] += weight
+                        sum_w2_x[i] += w2
+            search._undo(0)
+
+        if not sum_w:
+            return result
+
+        for k, weight in weight_by_k.items():
+            result.solutions[k] = weight / sum_w
+            result.mine_counts[k] = [w / sum_w for w in mines_by_k[k]]
+
+        # Erreur standard de l'estimateur par ratio p = Σ w x / Σ w
+        num = result.num_samples
+        if num > 1:
+            probabilities = [0.0] * n
+            for per_var in result.mine_counts.values():
+                for i, p in enumerate(per_var):
+                    probabilities[i] += p
+            mean_w = sum_w / num
+            for i, p in enumerate(probabilities):
+                residual = sum_w2_x[i] * (1 - 2 * p) + p * p * sum_w2
+                variance = max(residual, 0.0) / (num * (num - 1) * mean_w * mean_w)
+                result.std_errors[i] = math.sqrt(variance)
+
+        return result
+
+    def _descend(self, search: _Search, order: List[int]) -> float:
+        """
+        Tire une affectation complète en suivant l'ordre donné.
+
+        Returns:
+            Poids de l'échantillon (produit du nombre de valeurs possibles à
+            chaque choix), 0 si la descente aboutit à une impasse
+        """
+        weight = 1.0
+        value = search.value
+        for var in order:
+            if value[var] != -1:
+                continue
+
+            feasible = []
+            for val in (0, 1):
+                mark = len(search.trail)
+                if search._assign(var, val):
+                    feasible.append(val)
+                search._undo(mark)
+
+            if not feasible:
+                return 0.0
+            weight *= len(feasible)
+            search._assign(var, self.rng.choice(feasible))
+        return weight
@@ -3,15 +3,25 @@ Classe Board - Logique du jeu de démineur.
 
 Gère la grille, la génération des mines, la révélation des cases,
 et la détection de fin de partie.
+
+Les états des cases sont stockés dans un tableau compact int8 et les
+ensembles de cases cachées / révélées / marquées sont maintenus de manière
+incrémentale, ce qui rend les requêtes des solveurs indépendantes de la
+taille de la grille.
 """
 
 import numpy as np
-from typing import Tuple, Set, List
-from enum import Enum
+from typing import Callable, Tuple, Set, List
+from enum import Enum, IntEnum
 
 
-class CellState(Enum):
-    """États possibles d'une case."""
+class CellState(IntEnum):
+    """
+    États possibles d'une case.
+    
+    IntEnum pour pouvoir être comparé directement aux codes int8
+    stockés dans `Board.cell_states`.
+    """
     HIDDEN = 0
     REVEALED = 1
     FLAGGED = 2
@@ -24,6 +34,17 @@ class GameState(Enum):
     LOST = 2
 
 
+# Codes int8 utilisés dans les boucles internes (évite les accès à l'Enum)
+HIDDEN, REVEALED, FLAGGED = int(CellState.HIDDEN), int(CellState.REVEALED), int(CellState.FLAGGED)
+
+# Offsets des 8 voisins
+NEIGHBOR_OFFSETS = [
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1)
+]
+
+
 class Board:
     """Représente une grille de démineur."""
     
@@ -45,11 +66,11 @@ class Board:
         # Grille des mines (True = mine)
         self.mines = np.zeros((height, width), dtype=bool)
         
-        # État des cases (HIDDEN, REVEALED, FLAGGED)
-        self.cell_states = np.full((height, width), CellState.HIDDEN)
+        # État des cases (codes int8 de CellState)
+        self.cell_states = np.full((height, width), CellState.HIDDEN, dtype=np.int8)
         
         # Valeurs des cases (nombre de mines adjacentes)
-        self.values = np.zeros((height, width), dtype=int)
+        self.values = np.zeros((height, width), dtype=np.int8)
         
         # État du jeu
         self.game_state = GameState.ONGOING
@@ -58,6 +79,46 @@ class Board:
         self.num_revealed = 0
         self.first_click = True
         
+        # Index incrémentaux (indices linéaires r * width + c)
+        self._hidden = set(range(width * height))
+        self._revealed = set()
+        self._flagged = set()
+        
+        # Positions triées par état, invalidées dans _set_state
+        self._positions = {}
+        
+        # Table des voisins, calculée à la demande
+        self._neighbors = None
+        
+        # Abonnés aux changements d'état (voir add_listener)
+        self._listeners = []
+        self._changes = []
+    
+    def add_listener(self, callback: Callable[[List[int]], None]):
+        """
+        Abonne une fonction aux changements d'état des cases.
+        
+        Après chaque `reveal` ou `flag`, le callback reçoit la liste des
+        indices linéaires (r * width + c) des cases dont l'état a changé.
+        
+        Args:
+            callback: Fonction appelée avec la liste des indices modifiés
+        """
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[List[int]], None]):
+        """Désabonne une fonction précédemment ajoutée."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self):
+        """Transmet les changements accumulés aux abonnés."""
+        if not self._changes:
+            return
+        changes, self._changes = self._changes, []
+        for callback in self._listeners:
+            callback(changes)
+    
     def generate_mines(self, safe_row: int, safe_col: int):
         """
         Génère les mines en évitant la case cliquée et ses voisins.
@@ -70,37 +131,30 @@ class Board:
             np.random.seed(self.seed)
         
         # Cases à éviter (case cliquée + voisins)
-        safe_cells = set()
-        safe_cells.add((safe_row, safe_col))
-        for dr, dc in self._get_neighbor_offsets():
-            nr, nc = safe_row + dr, safe_col + dc
-            if self._is_valid(nr, nc):
-                safe_cells.add((nr, nc))
+        safe_mask = np.zeros((self.height, self.width), dtype=bool)
+        safe_mask[max(safe_row - 1, 0):safe_row + 2, max(safe_col - 1, 0):safe_col + 2] = True
         
-        # Toutes les cases possibles
-        all_cells = [(r, c) for r in range(self.height) for c in range(self.width)]
-        available_cells = [cell for cell in all_cells if cell not in safe_cells]
+        # Cases disponibles, dans l'ordre ligne par ligne
+        available_cells = np.flatnonzero(~safe_mask)
         
         # Placer les mines aléatoirement
         mine_positions = np.random.choice(len(available_cells), self.num_mines, replace=False)
-        for idx in mine_positions:
-            r, c = available_cells[idx]
-            self.mines[r, c] = True
+        self.mines.flat[available_cells[mine_positions]] = True
         
         # Calculer les valeurs (nombre de mines adjacentes)
         self._calculate_values()
     
     def _calculate_values(self):
-        """Calcule le nombre de mines adjacentes pour chaque case."""
-        for r in range(self.height):
-            for c in range(self.width):
-                if not self.mines[r, c]:
-                    count = 0
-                    for dr, dc in self._get_neighbor_offsets():
-                        nr, nc = r + dr, c + dc
-                        if self._is_valid(nr, nc) and self.mines[nr, nc]:
-                            count += 1
-                    self.values[r, c] = count
+        """Calcule le nombre de mines adjacentes pour chaque case (sommes de tranches)."""
+        h, w = self.height, self.width
+        padded = np.pad(self.mines.astype(np.int8), 1)
+        
+        counts = np.zeros((h, w), dtype=np.int8)
+        for dr, dc in NEIGHBOR_OFFSETS:
+            counts += padded[1 + dr:1 + dr + h, 1 + dc:1 + dc + w]
+        
+        counts[self.mines] = 0
+        self.values = counts
     
     def reveal(self, row: int, col: int) -> bool:
         """
@@ -126,8 +180,9 @@ class Board:
         
         # Mine touchée
         if self.mines[row, col]:
-            self.cell_states[row, col] = CellState.REVEALED
+            self._set_state(row * self.width + col, CellState.REVEALED)
             self.game_state = GameState.LOST
+            self._notify()
             return False
         
         # Révéler la case
@@ -135,38 +190,69 @@ class Board:
         
         # Vérifier la victoire
         self._check_win()
+        self._notify()
         
         return True
     
     def _reveal_recursive(self, row: int, col: int):
-        """Révèle récursivement les cases vides (flood fill)."""
-        if not self._is_valid(row, col):
-            return
+        """Révèle les cases vides par propagation (flood fill itératif)."""
+        neighbors = self._get_neighbor_table()
+        states = self.cell_states.reshape(-1)
+        mines = self.mines.reshape(-1)
+        values = self.values.reshape(-1)
         
-        if self.cell_states[row, col] != CellState.HIDDEN:
-            return
+        stack = [row * self.width + col]
         
-        if self.mines[row, col]:
-            return
-        
-        # Révéler cette case
-        self.cell_states[row, col] = CellState.REVEALED
-        self.num_revealed += 1
-        
-        # Si case vide (0 mines autour), révéler les voisins
-        if self.values[row, col] == 0:
-            for dr, dc in self._get_neighbor_offsets():
-                self._reveal_recursive(row + dr, col + dc)
+        while stack:
+            idx = stack.pop()
+            
+            if states[idx] != HIDDEN or mines[idx]:
+                continue
+            
+            # Révéler cette case
+            self._set_state(idx, REVEALED)
+            self.num_revealed += 1
+            
+            # Si case vide (0 mines autour), révéler les voisins
+            if values[idx] == 0:
+                stack.extend(n for n in neighbors[idx] if states[n] == HIDDEN)
     
     def flag(self, row: int, col: int):
         """Marque/démarque une case avec un drapeau."""
         if not self._is_valid(row, col):
             return
         
+        idx = row * self.width + col
         if self.cell_states[row, col] == CellState.HIDDEN:
-            self.cell_states[row, col] = CellState.FLAGGED
+            self._set_state(idx, CellState.FLAGGED)
         elif self.cell_states[row, col] == CellState.FLAGGED:
-            self.cell_states[row, col] = CellState.HIDDEN
+            self._set_state(idx, CellState.HIDDEN)
+        self._notify()
+    
+    def _set_state(self, idx: int, state: CellState):
+        """
+        Change l'état d'une case et met à jour les index incrémentaux.
+        
+        Args:
+            idx: Indice linéaire de la case
+            state: Nouvel état
+        """
+        previous = self.cell_states.flat[idx]
+        self._index_for(previous).discard(idx)
+        self._index_for(state).add(idx)
+        self._positions.pop(int(previous), None)
+        self._positions.pop(int(state), None)
+        self.cell_states.flat[idx] = state
+        if self._listeners:
+            self._changes.append(idx)
+    
+    def _index_for(self, state: int) -> Set[int]:
+        """Retourne l'ensemble d'indices correspondant à un état."""
+        if state == HIDDEN:
+            return self._hidden
+        if state == REVEALED:
+            return self._revealed
+        return self._flagged
     
     def _check_win(self):
         """Vérifie si le joueur a gagné."""
@@ -175,40 +261,69 @@ class Board:
         if self.num_revealed == total_safe_cells:
             self.game_state = GameState.WON
     
+    @property
+    def num_hidden(self) -> int:
+        """Nombre de cases cachées."""
+        return len(self._hidden)
+    
+    @property
+    def num_flagged(self) -> int:
+        """Nombre de cases marquées d'un drapeau."""
+        return len(self._flagged)
+    
     def get_hidden_cells(self) -> List[Tuple[int, int]]:
-        """Retourne la liste des cases cachées."""
-        hidden = []
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.cell_states[r, c] == CellState.HIDDEN:
-                    hidden.append((r, c))
-        return hidden
+        """Retourne la liste des cases cachées (ordre ligne par ligne)."""
+        return self._to_positions(HIDDEN)
     
     def get_revealed_cells(self) -> List[Tuple[int, int]]:
-        """Retourne la liste des cases révélées."""
-        revealed = []
-        for r in range(self.height):
-            for c in range(self.width):
-                if self.cell_states[r, c] == CellState.REVEALED:
-                    revealed.append((r, c))
-        return revealed
+        """Retourne la liste des cases révélées (ordre ligne par ligne)."""
+        return self._to_positions(REVEALED)
+    
+    def get_flagged_cells(self) -> List[Tuple[int, int]]:
+        """Retourne la liste des cases marquées (ordre ligne par ligne)."""
+        return self._to_positions(FLAGGED)
+    
+    def _to_positions(self, state: int) -> List[Tuple[int, int]]:
+        """
+        Retourne les positions (row, col) triées des cases dans un état.
+        
+        Le tri n'est refait qu'après un changement d'état ; l'appelant reçoit
+        une copie de la liste en cache.
+        """
+        positions = self._positions.get(state)
+        if positions is None:
+            w = self.width
+            positions = [divmod(idx, w) for idx in sorted(self._index_for(state))]
+            self._positions[state] = positions
+        return list(positions)
     
     def get_neighbors(self, row: int, col: int) -> List[Tuple[int, int]]:
         """Retourne les voisins valides d'une case."""
-        neighbors = []
-        for dr, dc in self._get_neighbor_offsets():
-            nr, nc = row + dr, col + dc
-            if self._is_valid(nr, nc):
-                neighbors.append((nr, nc))
-        return neighbors
+        w = self.width
+        return [divmod(idx, w) for idx in self._get_neighbor_table()[row * w + col]]
+    
+    def _get_neighbor_table(self) -> List[List[int]]:
+        """
+        Retourne la table des voisins (indices linéaires) de chaque case.
+        
+        Calculée une seule fois par grille.
+        """
+        if self._neighbors is None:
+            h, w = self.height, self.width
+            table = []
+            for r in range(h):
+                for c in range(w):
+                    table.append([
+                        (r + dr) * w + (c + dc)
+                        for dr, dc in NEIGHBOR_OFFSETS
+                        if 0 <= r + dr < h and 0 <= c + dc < w
+                    ])
+            self._neighbors = table
+        return self._neighbors
     
     def _get_neighbor_offsets(self) -> List[Tuple[int, int]]:
         """Retourne les offsets des 8 voisins."""
-        return [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
+        return list(NEIGHBOR_OFFSETS)
     
     def _is_valid(self, row: int, col: int) -> bool:
         """Vérifie si une position est valide."""
@@ -5,6 +5,7 @@ Classe abstraite pour tous les solveurs de démineur.
 from abc import ABC, abstractmethod
 from typing import Tuple, Optional, Dict
 from game.board import Board
+from solvers.profiling import MoveProfiler, NULL_PHASE
 
 
 class BaseSolver(ABC):
@@ -21,6 +22,7 @@ class BaseSolver(ABC):
         self.num_moves = 0
         self.num_logical_deductions = 0
         self.num_probability_guesses = 0
+        self.profiler: Optional[MoveProfiler] = None
     
     @abstractmethod
     def get_next_move(self) -> Optional[Tuple[int, int]]:
@@ -56,6 +58,48 @@ class BaseSolver(ABC):
         self.num_moves += 1
         return self.board.reveal(row, col)
     
+    def enable_profiling(self, profiler: Optional[MoveProfiler] = None) -> MoveProfiler:
+        """
+        Active l'instrumentation par phase.
+        
+        Args:
+            profiler: Profileur à utiliser (un nouveau par défaut)
+            
+        Returns:
+            Profileur actif
+        """
+        self.profiler = profiler or MoveProfiler(type(self).__name__)
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Désactive l'instrumentation."""
+        self.profiler = None
+    
+    def profiled_next_move(self) -> Optional[Tuple[int, int]]:
+        """
+        Appelle get_next_move en délimitant le coup pour le profileur.
+        
+        Returns:
+            Tuple (row, col) de la case à révéler, ou None si aucun coup possible
+        """
+        if self.profiler is None:
+            return self.get_next_move()
+        
+        with self.profiler.move() as record:
+            record['move'] = self.get_next_move()
+        return record['move']
+    
+    def _phase(self, name: str):
+        """
+        Contexte mesurant une phase (sans effet si le profilage est désactivé).
+        
+        Args:
+            name: Nom de la phase
+        """
+        if self.profiler is None:
+            return NULL_PHASE
+        return self.profiler.phase(name)
+    
     def reset_stats(self):
         """Réinitialise les statistiques."""
         self.num_moves = 0
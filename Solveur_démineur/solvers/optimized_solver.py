@@ -12,28 +12,60 @@ from solvers.base_solver import BaseSolver
 from csp.constraint_builder import ConstraintBuilder
 from csp.probability import ProbabilityCalculator
 from csp.components import ComponentDetector
+from csp.enumerator import SolutionCounter
+from csp.cache import TranspositionCache, get_default_cache
+from csp.sampler import SolutionSampler
 
 
 class OptimizedSolver(BaseSolver):
     """Solveur CSP optimisé avec décomposition en composantes connexes."""
     
-    def __init__(self, board: Board, max_solutions: int = 10000, max_component_size: int = 20):
+    def __init__(
+        self,
+        board: Board,
+        max_solutions: int = 10000,
+        max_component_size: int = 20,
+        engine: str = 'native',
+        use_cache: bool = False,
+        cache: Optional[TranspositionCache] = None,
+        time_limit: float = 5.0,
+        sample_budget: int = 5000,
+        sample_time_limit: float = 1.0
+    ):
         """
         Initialise le solveur optimisé.
         
         Args:
             board: Grille de démineur
             max_solutions: Nombre maximum de solutions à énumérer par composante
+                (moteur 'cpsat' uniquement)
             max_component_size: Taille max pour énumération complète
+            engine: 'native' (comptage exact par backtracking) ou 'cpsat'
+                (collecte de solutions OR-Tools)
+            use_cache: Réutiliser les comptages des composantes déjà vues
+                (moteur 'native' ; utile surtout avec un cache persistant
+                partagé entre parties)
+            cache: Cache de transposition à utiliser (par défaut, le cache
+                partagé du processus)
+            time_limit: Durée maximale du comptage exact d'une composante ;
+                au-delà, la composante est estimée par échantillonnage
+            sample_budget: Nombre maximal d'échantillons par composante
+            sample_time_limit: Durée maximale de l'échantillonnage d'une
+                composante en secondes
         """
         super().__init__(board)
         self.max_solutions = max_solutions
         self.max_component_size = max_component_size
+        self.engine = engine
+        self.cache = (cache or get_default_cache()) if use_cache else None
+        self.counter = SolutionCounter(time_limit=time_limit, cache=self.cache)
+        self.sampler = SolutionSampler(sample_budget, sample_time_limit, seed=board.seed)
         self.constraint_builder = ConstraintBuilder(board)
         self.prob_calculator = ProbabilityCalculator()
         self.component_detector = ComponentDetector()
         self.last_probabilities = {}
         self.last_component_stats = {}
+        self.last_confidence_intervals = {}
     
     def get_next_move(self) -> Optional[Tuple[int, int]]:
         """
@@ -42,15 +74,19 @@ class OptimizedSolver(BaseSolver):
         Returns:
             Position (row, col) à révéler, ou None si impossible
         """
+        self.last_confidence_intervals = {}
+        
         # Construire les contraintes
-        variables, constraints = self.constraint_builder.build_constraints()
+        with self._phase('constraint_build'):
+            variables, constraints = self.constraint_builder.build_constraints()
         
         if not variables:
             return None
         
         # Simplifier d'abord (trouver cases évidentes)
-        variables, constraints, certain_mines, certain_safe = \
-            self.constraint_builder.simplify_constraints(variables, constraints)
+        with self._phase('simplification'):
+            variables, constraints, certain_mines, certain_safe = \
+                self.constraint_builder.simplify_constraints(variables, constraints)
         
         if certain_safe:
             self.num_logical_deductions += 1
@@ -67,11 +103,21 @@ class OptimizedSolver(BaseSolver):
             return self._choose_first_cell()
         
         # OPTIMISATION : Décomposer en composantes connexes
-        components = self.component_detector.find_components(variables, constraints)
+        with self._phase('component_detection'):
+            if self.constraint_builder.frontier is not None:
+                components = self.component_detector.find_components_from_frontier(
+                    self.constraint_builder.frontier, variables
+                )
+            else:
+                components = self.component_detector.find_components(variables, constraints)
         
         # Statistiques
         self.last_component_stats = self.component_detector.get_statistics()
         
+        # Moteur natif : combinaison globale, y compris pour une seule composante
+        if self.engine == 'native':
+            return self._solve_multiple_components(components)
+        
         # Si une seule composante, utiliser l'approche classique
         if len(components) == 1:
             return self._solve_single_component(variables, constraints)
@@ -94,20 +140,15 @@ class OptimizedSolver(BaseSolver):
         Returns:
             Meilleur coup à jouer
         """
-        # Limiter l'énumération si trop de variables
-        if len(variables) > self.max_component_size:
-            solutions = self._solve_csp_limited(variables, constraints)
-        else:
-            solutions = self._solve_csp_complete(variables, constraints)
+        # Calculer probabilités
+        probabilities = self._component_probabilities(variables, constraints)
         
-        if not solutions:
+        if not probabilities:
             if variables:
                 self.num_probability_guesses += 1
                 return variables[0]
             return None
         
-        # Calculer probabilités
-        probabilities = self.prob_calculator.calculate_probabilities(variables, solutions)
         self.last_probabilities = probabilities
         
         certain_safe, _ = self.prob_calculator.get_certain_cells(probabilities)
@@ -126,12 +167,95 @@ class OptimizedSolver(BaseSolver):
         """
         Résout plusieurs composantes indépendamment et combine les résultats.
         
+        Avec le moteur natif, les comptages par nombre de mines de chaque
+        composante sont combinés avec le nombre de mines restantes, ce qui
+        donne des probabilités globales exactes (cases intérieures comprises).
+        
         Args:
             components: Liste des composantes avec leurs variables/contraintes
             
         Returns:
             Meilleur coup à jouer global
         """
+        if self.engine == 'native':
+            all_probabilities = self._combine_components(components)
+        else:
+            all_probabilities = self._solve_components_independently(components)
+        
+        self.last_probabilities = all_probabilities
+        
+        # Chercher cases certaines
+        certain_safe, _ = self.prob_calculator.get_certain_cells(all_probabilities)
+        
+        if certain_safe:
+            self.num_logical_deductions += 1
+            return list(certain_safe)[0]
+        
+        # Choisir la case avec probabilité minimale
+        self.num_probability_guesses += 1
+        return self.prob_calculator.find_best_move(all_probabilities)
+    
+    def _combine_components(self, components: List[Dict]) -> Dict[Tuple[int, int], float]:
+        """
+        Compte les solutions de chaque composante et les combine globalement.
+        
+        Les composantes sans contrainte forment l'intérieur (cases non
+        contraintes), pondéré par coefficients binomiaux.
+        
+        Args:
+            components: Liste des composantes avec leurs variables/contraintes
+            
+        Returns:
+            Dictionnaire {position: probabilité} pour toutes les variables
+        """
+        remaining_mines = self._get_remaining_mines()
+        max_mines = remaining_mines if remaining_mines >= 0 else None
+        
+        component_counts = []
+        interior = []
+        with self._phase('enumeration'):
+            for comp in components:
+                if comp['constraints']:
+                    counts = self.counter.count(comp['variables'], comp['constraints'], max_mines=max_mines)
+                    method = 'exact'
+                    if not counts.complete:
+                        # Comptage exact interrompu : estimation sans biais
+                        counts = self.sampler.sample(comp['variables'], comp['constraints'], max_mines)
+                        self.last_confidence_intervals.update(counts.confidence_intervals())
+                        method = 'sampled'
+                    if self.profiler is not None:
+                        num_solutions = counts.total() if method == 'exact' else counts.num_valid
+                        self.profiler.record_component(len(comp['variables']), num_solutions, method)
+                    component_counts.append(counts)
+                else:
+                    interior.extend(comp['variables'])
+        
+        with self._phase('probability_aggregation'):
+            probabilities = self.prob_calculator.combine_component_counts(
+                component_counts, interior, remaining_mines
+            )
+        
+        if not probabilities:
+            # Pas de solution : probabilité uniforme
+            for comp in components:
+                for var in comp['variables']:
+                    probabilities[var] = 0.5
+        
+        return probabilities
+    
+    def _solve_components_independently(
+        self,
+        components: List[Dict]
+    ) -> Dict[Tuple[int, int], float]:
+        """
+        Résout chaque composante indépendamment (moteur CP-SAT).
+        
+        Args:
+            components: Liste des composantes avec leurs variables/contraintes
+            
+        Returns:
+            Dictionnaire {position: probabilité}
+        """
         all_probabilities = {}
         
         # Résoudre chaque composante
@@ -139,34 +263,47 @@ class OptimizedSolver(BaseSolver):
             comp_vars = comp['variables']
             comp_constraints = comp['constraints']
             
-            # Petite composante : énumération complète
-            if len(comp_vars) <= self.max_component_size:
-                solutions = self._solve_csp_complete(comp_vars, comp_constraints)
-            else:
-                # Grande composante : échantillonnage
-                solutions = self._solve_csp_limited(comp_vars, comp_constraints)
+            # Calculer probabilités pour cette composante
+            probs = self._component_probabilities(comp_vars, comp_constraints)
             
-            if solutions:
-                # Calculer probabilités pour cette composante
-                probs = self.prob_calculator.calculate_probabilities(comp_vars, solutions)
+            if probs:
                 all_probabilities.update(probs)
             else:
                 # Pas de solution : probabilité uniforme
                 for var in comp_vars:
                     all_probabilities[var] = 0.5
         
-        self.last_probabilities = all_probabilities
+        return all_probabilities
+    
+    def _component_probabilities(
+        self,
+        variables: List[Tuple[int, int]],
+        constraints: List[Dict]
+    ) -> Dict[Tuple[int, int], float]:
+        """
+        Calcule les probabilités d'une composante avec CP-SAT.
         
-        # Chercher cases certaines
-        certain_safe, _ = self.prob_calculator.get_certain_cells(all_probabilities)
+        Args:
+            variables: Variables de la composante
+            constraints: Contraintes de la composante
+            
+        Returns:
+            Dictionnaire {position: probabilité}, vide si aucune solution
+        """
+        # Grande composante : échantillonnage
+        if len(variables) > self.max_component_size:
+            return self._solve_csp_limited(variables, constraints)
         
-        if certain_safe:
-            self.num_logical_deductions += 1
-            return list(certain_safe)[0]
+        # Petite composante : énumération complète
+        with self._phase('enumeration'):
+            solutions = self._solve_csp_complete(variables, constraints)
+        if self.profiler is not None:
+            self.profiler.record_component(len(variables), len(solutions), 'cpsat')
         
-        # Choisir la case avec probabilité minimale
-        self.num_probability_guesses += 1
-        return self.prob_calculator.find_best_move(all_probabilities)
+        if not solutions:
+            return {}
+        with self._phase('probability_aggregation'):
+            return self.prob_calculator.calculate_probabilities(variables, solutions)
     
     def _solve_csp_complete(
         self,
@@ -217,19 +354,32 @@ class OptimizedSolver(BaseSolver):
         self,
         variables: List[Tuple[int, int]],
         constraints: List[Dict]
-    ) -> List[Dict[Tuple[int, int], int]]:
+    ) -> Dict[Tuple[int, int], float]:
         """
-        Échantillonne des solutions d'un CSP trop large.
+        Estime les probabilités d'un CSP trop large par échantillonnage.
+        
+        Contrairement à une énumération tronquée à max_solutions, l'estimation
+        n'est pas biaisée vers les premières solutions trouvées.
         
         Args:
             variables: Variables du CSP
             constraints: Contraintes du CSP
             
         Returns:
-            Liste d'échantillons de solutions
+            Dictionnaire {position: probabilité}, vide si aucune solution
         """
-        # Pour les grandes composantes, on limite l'énumération
-        return self._solve_csp_complete(variables, constraints)
+        remaining_mines = self._get_remaining_mines()
+        max_mines = remaining_mines if remaining_mines >= 0 else None
+        
+        with self._phase('enumeration'):
+            counts = self.sampler.sample(variables, constraints, max_mines)
+        if self.profiler is not None:
+            self.profiler.record_component(len(variables), counts.num_valid, 'sampled')
+        if not counts.total():
+            return {}
+        
+        self.last_confidence_intervals.update(counts.confidence_intervals())
+        return self.prob_calculator.calculate_probabilities_from_counts(counts)
     
     def _get_remaining_mines(self) -> int:
         """
@@ -238,12 +388,7 @@ class OptimizedSolver(BaseSolver):
         Returns:
             Nombre de mines restantes
         """
-        flagged_count = 0
-        for r in range(self.board.height):
-            for c in range(self.board.width):
-                if self.board.cell_states[r, c] == CellState.FLAGGED:
-                    flagged_count += 1
-        return self.board.num_mines - flagged_count
+        return self.board.num_mines - self.board.num_flagged
     
     def _choose_first_cell(self) -> Tuple[int, int]:
         """
@@ -265,6 +410,19 @@ class OptimizedSolver(BaseSolver):
         """Retourne les probabilités du dernier calcul."""
         return self.last_probabilities.copy()
     
+    def get_confidence_intervals(self) -> Dict[Tuple[int, int], Tuple[float, float]]:
+        """
+        Retourne les intervalles de confiance (95%) des cases dont la
+        composante a été estimée par échantillonnage au dernier calcul.
+        
+        Les intervalles portent sur la probabilité au sein de la composante,
+        avant pondération par les cases intérieures.
+        
+        Returns:
+            Dictionnaire {position: (borne basse, borne haute)}
+        """
+        return self.last_confidence_intervals.copy()
+    
     def get_component_stats(self) -> Dict:
         """
         Retourne les statistiques sur les composantes.
@@ -272,7 +430,10 @@ class OptimizedSolver(BaseSolver):
         Returns:
             Dictionnaire de statistiques
         """
-        return self.last_component_stats.copy()
+        stats = self.last_component_stats.copy()
+        if self.cache is not None:
+            stats['cache'] = self.cache.get_stats()
+        return stats
 
 
 class SolutionCollector(cp_model.CpSolverSolutionCallback):
@@ -11,21 +11,28 @@ from game.board import Board, CellState
 from solvers.base_solver import BaseSolver
 from csp.constraint_builder import ConstraintBuilder
 from csp.probability import ProbabilityCalculator
+from csp.enumerator import SolutionCounter
+from csp.sampler import SolutionSampler
 
 
 class ORToolsSolver(BaseSolver):
     """Solveur CSP avec OR-Tools CP-SAT."""
     
-    def __init__(self, board: Board, max_solutions: int = 1000):
+    def __init__(self, board: Board, max_solutions: int = 1000, engine: str = 'native'):
         """
         Initialise le solveur OR-Tools.
         
         Args:
             board: Grille de démineur
-            max_solutions: Nombre maximum de solutions à énumérer
+            max_solutions: Nombre maximum de solutions à énumérer (moteur 'cpsat')
+            engine: 'native' (comptage exact par backtracking) ou 'cpsat'
+                (collecte de solutions OR-Tools)
         """
         super().__init__(board)
         self.max_solutions = max_solutions
+        self.engine = engine
+        self.counter = SolutionCounter(time_limit=1.0)
+        self.sampler = SolutionSampler(seed=board.seed)
         self.constraint_builder = ConstraintBuilder(board)
         self.prob_calculator = ProbabilityCalculator()
         self.last_probabilities = {}
@@ -38,15 +45,17 @@ class ORToolsSolver(BaseSolver):
             Position (row, col) à révéler, ou None si impossible
         """
         # Construire les contraintes
-        variables, constraints = self.constraint_builder.build_constraints()
+        with self._phase('constraint_build'):
+            variables, constraints = self.constraint_builder.build_constraints()
         
         if not variables:
             # Aucune case cachée, jeu terminé
             return None
         
         # Simplifier et trouver les cases évidentes
-        variables, constraints, certain_mines, certain_safe = \
-            self.constraint_builder.simplify_constraints(variables, constraints)
+        with self._phase('simplification'):
+            variables, constraints, certain_mines, certain_safe = \
+                self.constraint_builder.simplify_constraints(variables, constraints)
         
         # Si des cases sûres sont trouvées, en choisir une
         if certain_safe:
@@ -65,10 +74,35 @@ class ORToolsSolver(BaseSolver):
             self.num_probability_guesses += 1
             return self._choose_first_cell()
         
-        # Résoudre le CSP et énumérer les solutions
-        solutions = self._solve_csp(variables, constraints)
-        
-        if not solutions:
+        # Résoudre le CSP et calculer les probabilités
+        probabilities = None
+        if self.engine == 'native':
+            remaining_mines = self.board.num_mines - self.board.num_flagged
+            max_mines = remaining_mines if remaining_mines >= 0 else None
+            with self._phase('enumeration'):
+                counts = self.counter.count(variables, constraints, max_mines=max_mines)
+                method = 'exact'
+                if not counts.complete:
+                    # Comptage exact interrompu : un comptage partiel peut faire
+                    # croire à des cases sûres, on estime par échantillonnage
+                    counts = self.sampler.sample(variables, constraints, max_mines)
+                    method = 'sampled'
+            if self.profiler is not None:
+                num_solutions = counts.total() if method == 'exact' else counts.num_valid
+                self.profiler.record_component(len(variables), num_solutions, method)
+            if counts.total() > 0:
+                with self._phase('probability_aggregation'):
+                    probabilities = self.prob_calculator.calculate_probabilities_from_counts(counts)
+        else:
+            with self._phase('enumeration'):
+                solutions = self._solve_csp(variables, constraints)
+            if self.profiler is not None:
+                self.profiler.record_component(len(variables), len(solutions), 'cpsat')
+            if solutions:
+                with self._phase('probability_aggregation'):
+                    probabilities = self.prob_calculator.calculate_probabilities(variables, solutions)
+        
+        if not probabilities:
             # Aucune solution trouvée, problème incohérent
             # Prendre une case au hasard parmi les restantes
             if variables:
@@ -76,8 +110,6 @@ class ORToolsSolver(BaseSolver):
                 return variables[0]
             return None
         
-        # Calculer les probabilités
-        probabilities = self.prob_calculator.calculate_probabilities(variables, solutions)
         self.last_probabilities = probabilities
         
         # Trouver la meilleure case (probabilité minimale)
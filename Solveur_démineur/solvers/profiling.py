@@ -0,0 +1,215 @@
+"""
+Instrumentation des solveurs : temps par phase, composantes et traces.
+
+Désactivée par défaut : un solveur sans profileur n'exécute qu'un test
+`self.profiler is None` par phase. Une fois activée (BaseSolver.enable_profiling),
+chaque coup est enregistré avec la durée de ses phases (construction des
+contraintes, simplification, détection des composantes, énumération,
+agrégation des probabilités) et la taille / le nombre de solutions de chaque
+composante résolue. Les traces s'exportent en JSON ou au format Chrome
+(chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+# Contexte vide partagé, retourné quand le profilage est désactivé
+NULL_PHASE = nullcontext()
+
+# Phases instrumentées par les solveurs (CSP, puis réseaux)
+PHASES = (
+    'constraint_build',
+    'simplification',
+    'component_detection',
+    'enumeration',
+    'probability_aggregation',
+    'encoding',
+    'inference',
+)
+
+
+class MoveProfiler:
+    """Enregistre les temps par phase et les composantes de chaque coup."""
+
+    def __init__(self, name: str = 'solver'):
+        """
+        Initialise le profileur.
+
+        Args:
+            name: Nom du solveur (affiché dans les traces)
+        """
+        self.name = name
+        self.moves: List[Dict] = []
+        self._current: Optional[Dict] = None
+        self._origin = time.perf_counter_ns()
+
+    def _now_us(self) -> float:
+        """Temps écoulé depuis la création du profileur, en microsecondes."""
+        return (time.perf_counter_ns() - self._origin) / 1000.0
+
+    def _open_move(self) -> Dict:
+        """Commence l'enregistrement d'un coup."""
+        self._current = {
+            'index': len(self.moves),
+            'start_us': self._now_us(),
+            'duration_us': 0.0,
+            'move': None,
+            'phases': [],
+            'components': [],
+        }
+        return self._current
+
+    def _close_move(self, move: Optional[Tuple[int, int]] = None):
+        """Termine l'enregistrement du coup courant."""
+        record = self._current
+        if record is None:
+            return
+        record['duration_us'] = self._now_us() - record['start_us']
+        if move is not None:
+            record['move'] = [int(move[0]), int(move[1])]
+        self.moves.append(record)
+        self._current = None
+
+    @contextmanager
+    def move(self):
+        """
+        Délimite un coup (autour de get_next_move).
+
+        Yields:
+            Enregistrement du coup ; y affecter 'move' pour le tracer
+        """
+        self._close_move()
+        record = self._open_move()
+        try:
+            yield record
+        finally:
+            self._close_move(record['move'])
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Mesure une phase du coup courant.
+
+        Args:
+            name: Nom de la phase (voir PHASES)
+        """
+        record = self._current or self._open_move()
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            record['phases'].append((name, start, self._now_us() - start))
+
+    def record_component(self, size: int, num_solutions, method: str = 'exact'):
+        """
+        Enregistre une composante résolue pendant le coup courant.
+
+        Args:
+            size: Nombre de variables
+            num_solutions: Nombre de solutions (estimé si échantillonné)
+            method: 'exact', 'sampled' ou 'cpsat'
+        """
+        record = self._current or self._open_move()
+        record['components'].append({
+            'size': size,
+            'solutions': float(num_solutions),
+            'method': method,
+        })
+
+    def summary(self) -> Dict:
+        """
+        Résume les coups enregistrés.
+
+        Returns:
+            Dictionnaire avec le nombre de coups, le temps total et moyen par
+            phase (ms) et les statistiques de composantes
+        """
+        phase_totals: Dict[str, float] = {}
+        for record in self.moves:
+            for name, _, duration in record['phases']:
+                phase_totals[name] = phase_totals.get(name, 0.0) + duration / 1000.0
+
+        num_moves = len(self.moves)
+        components = [c for record in self.moves for c in record['components']]
+        sizes = [c['size'] for c in components]
+
+        return {
+            'num_moves': num_moves,
+            'total_ms': sum(r['duration_us'] for r in self.moves) / 1000.0,
+            'phase_total_ms': phase_totals,
+            'phase_avg_ms': {
+                name: total / num_moves for name, total in phase_totals.items()
+            } if num_moves else {},
+            'num_components': len(components),
+            'max_component_size': max(sizes) if sizes else 0,
+            'avg_component_size': sum(sizes) / len(sizes) if sizes else 0.0,
+            'num_sampled': sum(1 for c in components if c['method'] == 'sampled'),
+        }
+
+    def to_dict(self) -> Dict:
+        """Retourne les enregistrements bruts (JSON-sérialisables)."""
+        self._close_move()
+        return {
+            'solver': self.name,
+            'moves': [
+                {**record, 'phases': [
+                    {'name': name, 'start_us': start, 'duration_us': duration}
+                    for name, start, duration in record['phases']
+                ]}
+                for record in self.moves
+            ],
+            'summary': self.summary(),
+        }
+
+    def to_chrome_trace(self, pid: int = 0) -> Dict:
+        """
+        Convertit les enregistrements au format Chrome trace (événements 'X').
+
+        Args:
+            pid: Identifiant de processus affiché dans la trace
+
+        Returns:
+            Dictionnaire {'traceEvents': [...]}
+        """
+        self._close_move()
+        events = []
+        for record in self.moves:
+            events.append({
+                'name': f"move {record['index']}",
+                'cat': self.name,
+                'ph': 'X',
+                'ts': record['start_us'],
+                'dur': record['duration_us'],
+                'pid': pid,
+                'tid': 0,
+                'args': {'move': record['move'], 'components': record['components']},
+            })
+            for name, start, duration in record['phases']:
+                events.append({
+                    'name': name,
+                    'cat': self.name,
+                    'ph': 'X',
+                    'ts': start,
+                    'dur': duration,
+                    'pid': pid,
+                    'tid': 0,
+                })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save(self, path: str, trace_format: str = 'chrome'):
+        """
+        Écrit la trace sur disque.
+
+        Args:
+            path: Fichier de destination
+            trace_format: 'chrome' (chrome://tracing) ou 'json' (enregistrements bruts)
+        """
+        data = self.to_chrome_trace() if trace_format == 'chrome' else self.to_dict()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
@@ -43,7 +43,8 @@ class SimpleSolver(BaseSolver):
             return self._choose_first_cell()
         
         # Chercher les cases évidentes avec règles AFN/AMN
-        safe_cells, mine_cells = self._apply_simple_rules()
+        with self._phase('simplification'):
+            safe_cells, mine_cells = self._apply_simple_rules()
         
         # Si des cases sûres sont trouvées, en choisir une
         if safe_cells:
@@ -56,7 +57,8 @@ class SimpleSolver(BaseSolver):
             self.board.flag(row, col)
         
         # Calculer les probabilités naïves pour les cases restantes
-        probabilities = self._calculate_naive_probabilities()
+        with self._phase('probability_aggregation'):
+            probabilities = self._calculate_naive_probabilities()
         self.last_probabilities = probabilities
         
         if not probabilities:
@@ -172,9 +174,7 @@ class SimpleSolver(BaseSolver):
                 # Aucune info, probabilité basée sur la densité globale
                 total_hidden = len(hidden_cells)
                 total_mines = self.board.num_mines
-                flagged = sum(1 for r in range(self.board.height) for c in range(self.board.width)
-                            if self.board.cell_states[r, c] == CellState.FLAGGED)
-                mines_remaining = total_mines - flagged
+                mines_remaining = total_mines - self.board.num_flagged
                 
                 if total_hidden > 0:
                     probabilities[(hidden_row, hidden_col)] = mines_remaining / total_hidden
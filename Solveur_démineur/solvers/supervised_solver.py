@@ -4,15 +4,113 @@ Solveur utilisant l'apprentissage supervisé (CNN).
 Utilise un modèle CNN entraîné pour prédire les meilleurs coups.
 """
 
+import time
 import torch
 import numpy as np
-from typing import Optional, Tuple, Dict
-from game.board import Board, CellState
+from typing import Optional, Tuple, Dict, List
+from game.board import Board, GameState
 from solvers.base_solver import BaseSolver
 from training.model import MinesweeperCNN, MinesweeperResNet
+from training.encoding import encode_state, encode_states, valid_masks
 import os
 
 
+def load_model(
+    model_path: str,
+    height: int,
+    width: int,
+    model_type: str = 'cnn',
+    device: torch.device = torch.device('cpu'),
+    verbose: bool = True
+) -> torch.nn.Module:
+    """
+    Charge un modèle entraîné en mode évaluation.
+    
+    Args:
+        model_path: Chemin du checkpoint (.pth)
+        height: Hauteur de la grille
+        width: Largeur de la grille
+        model_type: 'cnn' ou 'resnet'
+        device: Device cible
+        verbose: Afficher les informations du checkpoint
+        
+    Returns:
+        Modèle chargé
+    """
+    # Créer l'architecture
+    if model_type == 'resnet':
+        model = MinesweeperResNet(height, width)
+    else:
+        model = MinesweeperCNN(height, width)
+    
+    # Charger les poids
+    if os.path.exists(model_path):
+        checkpoint = torch.load(model_path, map_location=device)
+        model.load_state_dict(checkpoint['model_state_dict'])
+        if verbose:
+            print(f"✅ Modèle chargé: {model_path}")
+            print(f"   Epoch: {checkpoint.get('epoch', '?')}")
+            print(f"   Val Loss: {checkpoint.get('val_loss', '?'):.4f}")
+            print(f"   Val Acc: {checkpoint.get('val_acc', '?'):.2f}%")
+    elif verbose:
+        print(f"⚠️  Modèle non trouvé: {model_path}")
+        print(f"   Utilisation d'un modèle non entraîné")
+    
+    model = model.to(device)
+    model.eval()
+    return model
+
+
+def compile_for_inference(model: torch.nn.Module, height: int, width: int) -> torch.nn.Module:
+    """
+    Compile un modèle en TorchScript figé pour l'inférence CPU.
+    
+    Les BatchNorm sont fusionnées dans les convolutions et le dropout est
+    supprimé (mode évaluation).
+    
+    Args:
+        model: Modèle en mode évaluation
+        height: Hauteur de la grille
+        width: Largeur de la grille
+        
+    Returns:
+        Module TorchScript optimisé
+    """
+    device = next(model.parameters()).device
+    example = torch.zeros((1, 4, height, width), device=device)
+    
+    with torch.inference_mode():
+        traced = torch.jit.trace(model.eval(), example)
+        traced = torch.jit.freeze(traced)
+        return torch.jit.optimize_for_inference(traced)
+
+
+def predict_scores(
+    model: torch.nn.Module,
+    states: np.ndarray,
+    device: torch.device,
+    max_batch_size: int = 256
+) -> np.ndarray:
+    """
+    Évalue le modèle sur un lot d'états encodés.
+    
+    Args:
+        model: Modèle en mode évaluation
+        states: Array (N, 4, H, W) float32
+        device: Device du modèle
+        max_batch_size: Taille maximale d'un lot envoyé au modèle
+        
+    Returns:
+        Scores (N, H*W) sur CPU
+    """
+    outputs = []
+    with torch.inference_mode():
+        for start in range(0, len(states), max_batch_size):
+            batch = torch.from_numpy(states[start:start + max_batch_size]).to(device)
+            outputs.append(model(batch).float().cpu().numpy())
+    return np.concatenate(outputs)
+
+
 class SupervisedSolver(BaseSolver):
     """Solveur basé sur l'apprentissage supervisé."""
     
@@ -21,7 +119,9 @@ class SupervisedSolver(BaseSolver):
         board: Board,
         model_path: str,
         model_type: str = 'cnn',
-        device: str = 'cuda'
+        device: str = 'cuda',
+        jit: bool = False,
+        model: Optional[torch.nn.Module] = None
     ):
         """
         Initialise le solveur supervisé.
@@ -31,6 +131,8 @@ class SupervisedSolver(BaseSolver):
             model_path: Chemin vers le modèle entraîné (.pth)
             model_type: 'cnn' ou 'resnet'
             device: 'cuda' ou 'cpu'
+            jit: Compiler le modèle en TorchScript figé (inférence CPU)
+            model: Modèle déjà chargé à partager entre solveurs (optionnel)
         """
         super().__init__(board)
         
@@ -39,7 +141,16 @@ class SupervisedSolver(BaseSolver):
         
         # Charger le modèle
         self.model_type = model_type
-        self.model = self._load_model(model_path)
+        if model is None:
+            model = self._load_model(model_path)
+            if jit:
+                model = compile_for_inference(model, board.height, board.width)
+        else:
+            # Les modules TorchScript figés n'exposent plus de paramètres
+            params = list(model.parameters())
+            if params:
+                self.device = params[0].device
+        self.model = model
         self.model.eval()
         
         # Cache des prédictions
@@ -56,25 +167,13 @@ class SupervisedSolver(BaseSolver):
         Returns:
             Modèle chargé
         """
-        # Créer l'architecture
-        if self.model_type == 'resnet':
-            model = MinesweeperResNet(self.board.height, self.board.width)
-        else:
-            model = MinesweeperCNN(self.board.height, self.board.width)
-        
-        # Charger les poids
-        if os.path.exists(model_path):
-            checkpoint = torch.load(model_path, map_location=self.device)
-            model.load_state_dict(checkpoint['model_state_dict'])
-            print(f"✅ Modèle chargé: {model_path}")
-            print(f"   Epoch: {checkpoint.get('epoch', '?')}")
-            print(f"   Val Loss: {checkpoint.get('val_loss', '?'):.4f}")
-            print(f"   Val Acc: {checkpoint.get('val_acc', '?'):.2f}%")
-        else:
-            print(f"⚠️  Modèle non trouvé: {model_path}")
-            print(f"   Utilisation d'un modèle non entraîné")
-        
-        return model.to(self.device)
+        return load_model(
+            model_path,
+            self.board.height,
+            self.board.width,
+            model_type=self.model_type,
+            device=self.device
+        )
     
     def get_next_move(self) -> Optional[Tuple[int, int]]:
         """
@@ -83,37 +182,44 @@ class SupervisedSolver(BaseSolver):
         Returns:
             Position (row, col) à révéler
         """
-        # Encoder l'état actuel
-        state = self._encode_state()
+        if self.board.num_hidden == 0:
+            return None  # Aucun coup valide
+        
+        # Encoder l'état actuel et prédire
+        with self._phase('encoding'):
+            state = self._encode_state()
+        with self._phase('inference'):
+            scores = predict_scores(self.model, state[np.newaxis], self.device)[0]
+        
+        return self.choose_move(scores)
+    
+    def choose_move(self, scores_flat: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Choisit le coup à partir des scores du réseau (calculés éventuellement
+        en lot par BatchedGameRunner).
         
+        Args:
+            scores_flat: Scores linéarisés (H*W,)
+            
+        Returns:
+            Position (row, col) à révéler
+        """
         # Masque des coups valides (cases cachées)
-        valid_mask = self._get_valid_mask()
+        valid_flat = self._get_valid_mask().reshape(-1)
         
-        if valid_mask.sum() == 0:
+        if valid_flat.sum() == 0:
             return None  # Aucun coup valide
         
-        # Prédiction du modèle
-        with torch.no_grad():
-            # Forward
-            state_tensor = torch.from_numpy(state).unsqueeze(0).to(self.device)
-            valid_tensor = torch.from_numpy(valid_mask).to(self.device)
-            
-            scores = self.model(state_tensor).squeeze(0)  # (H*W,)
-            
-            # Appliquer le masque
-            scores_flat = scores.cpu().numpy()
-            valid_flat = valid_mask.flatten()
-            
-            # Masquer les cases invalides
-            scores_masked = np.where(valid_flat, scores_flat, -1e9)
-            
-            # Trouver le meilleur coup
-            best_idx = scores_masked.argmax()
-            row = best_idx // self.board.width
-            col = best_idx % self.board.width
-            
-            # Sauvegarder pour visualisation
-            self._save_scores(scores_flat, valid_flat)
+        # Masquer les cases invalides
+        scores_masked = np.where(valid_flat, scores_flat, -1e9)
+        
+        # Trouver le meilleur coup
+        best_idx = int(scores_masked.argmax())
+        row = best_idx // self.board.width
+        col = best_idx % self.board.width
+        
+        # Sauvegarder pour visualisation
+        self._save_scores(scores_flat, valid_flat)
         
         self.num_moves += 1
         return (row, col)
@@ -150,49 +256,7 @@ class SupervisedSolver(BaseSolver):
         Returns:
             Array (4, H, W)
         """
-        h, w = self.board.height, self.board.width
-        state = np.zeros((4, h, w), dtype=np.float32)
-        
-        # Channel 0: Valeurs normalisées
-        for r in range(h):
-            for c in range(w):
-                if self.board.cell_states[r, c] == CellState.REVEALED:
-                    state[0, r, c] = self.board.values[r, c] / 8.0
-        
-        # Channel 1: Masque révélé
-        for r in range(h):
-            for c in range(w):
-                if self.board.cell_states[r, c] == CellState.REVEALED:
-                    state[1, r, c] = 1.0
-        
-        # Channel 2: Drapeaux
-        for r in range(h):
-            for c in range(w):
-                if self.board.cell_states[r, c] == CellState.FLAGGED:
-                    state[2, r, c] = 1.0
-        
-        # Channel 3: Frontière
-        for r in range(h):
-            for c in range(w):
-                if self.board.cell_states[r, c] == CellState.HIDDEN:
-                    # Vérifier voisins révélés
-                    has_revealed = False
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue
-                            nr, nc = r + dr, c + dc
-                            if 0 <= nr < h and 0 <= nc < w:
-                                if self.board.cell_states[nr, nc] == CellState.REVEALED:
-                                    has_revealed = True
-                                    break
-                        if has_revealed:
-                            break
-                    
-                    if has_revealed:
-                        state[3, r, c] = 1.0
-        
-        return state
+        return encode_state(self.board)
     
     def _get_valid_mask(self) -> np.ndarray:
         """
@@ -201,15 +265,7 @@ class SupervisedSolver(BaseSolver):
         Returns:
             Array (H, W) binaire
         """
-        h, w = self.board.height, self.board.width
-        mask = np.zeros((h, w), dtype=np.float32)
-        
-        for r in range(h):
-            for c in range(w):
-                if self.board.cell_states[r, c] == CellState.HIDDEN:
-                    mask[r, c] = 1.0
-        
-        return mask
+        return valid_masks([self.board])[0]
     
     def _save_scores(self, scores_flat: np.ndarray, valid_flat: np.ndarray):
         """
@@ -231,15 +287,9 @@ class SupervisedSolver(BaseSolver):
             probabilities = exp_scores / exp_scores.sum()
             
             # Reconstruire
-            prob_idx = 0
-            for idx in range(len(scores_flat)):
-                row = idx // self.board.width
-                col = idx % self.board.width
-                
-                if valid_flat[idx] > 0:
-                    self.last_scores[(row, col)] = float(scores_flat[idx])
-                    self.last_probabilities[(row, col)] = float(probabilities[prob_idx])
-                    prob_idx += 1
+            positions = [divmod(int(idx), self.board.width) for idx in np.flatnonzero(valid_flat)]
+            self.last_scores = dict(zip(positions, valid_scores.tolist()))
+            self.last_probabilities = dict(zip(positions, probabilities.tolist()))
 
 
 class HybridSolver(BaseSolver):
@@ -255,7 +305,8 @@ class HybridSolver(BaseSolver):
         board: Board,
         model_path: str,
         model_type: str = 'cnn',
-        certainty_threshold: float = 0.1
+        certainty_threshold: float = 0.1,
+        model: Optional[torch.nn.Module] = None
     ):
         """
         Initialise le solveur hybride.
@@ -265,6 +316,7 @@ class HybridSolver(BaseSolver):
             model_path: Chemin du modèle CNN
             model_type: Type de modèle
             certainty_threshold: Seuil pour utiliser CSP vs CNN
+            model: Modèle déjà chargé à partager entre solveurs (optionnel)
         """
         super().__init__(board)
         
@@ -272,7 +324,7 @@ class HybridSolver(BaseSolver):
         from solvers.ortools_solver import ORToolsSolver
         
         self.csp_solver = ORToolsSolver(board)
-        self.cnn_solver = SupervisedSolver(board, model_path, model_type)
+        self.cnn_solver = SupervisedSolver(board, model_path, model_type, model=model)
         self.threshold = certainty_threshold
         self.last_solver_used = None
     
@@ -283,7 +335,25 @@ class HybridSolver(BaseSolver):
         Returns:
             Position (row, col) à révéler
         """
-        # Essayer d'abord le CSP
+        move = self.get_csp_move()
+        if move is not None:
+            return move
+        
+        # Sinon, utiliser le CNN pour les situations ambiguës
+        self.last_solver_used = 'cnn'
+        self.num_probability_guesses += 1
+        move = self.cnn_solver.get_next_move()
+        if move is not None:
+            self.num_moves += 1
+        return move
+    
+    def get_csp_move(self) -> Optional[Tuple[int, int]]:
+        """
+        Retourne le coup CSP s'il est quasi-certain.
+        
+        Returns:
+            Position (row, col), ou None si la situation est ambiguë
+        """
         move = self.csp_solver.get_next_move()
         probs = self.csp_solver.get_probabilities()
         
@@ -294,12 +364,40 @@ class HybridSolver(BaseSolver):
             if prob <= self.threshold:
                 self.last_solver_used = 'csp'
                 self.num_logical_deductions += 1
+                self.num_moves += 1
                 return move
         
-        # Sinon, utiliser le CNN pour les situations ambiguës
+        return None
+    
+    def choose_cnn_move(self, scores_flat: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Joue le coup CNN à partir de scores calculés en lot.
+        
+        Args:
+            scores_flat: Scores linéarisés (H*W,)
+            
+        Returns:
+            Position (row, col) à révéler
+        """
         self.last_solver_used = 'cnn'
         self.num_probability_guesses += 1
-        return self.cnn_solver.get_next_move()
+        move = self.cnn_solver.choose_move(scores_flat)
+        if move is not None:
+            self.num_moves += 1
+        return move
+    
+    def enable_profiling(self, profiler=None):
+        """Active l'instrumentation, partagée avec les solveurs CSP et CNN."""
+        profiler = super().enable_profiling(profiler)
+        self.csp_solver.enable_profiling(profiler)
+        self.cnn_solver.enable_profiling(profiler)
+        return profiler
+    
+    def disable_profiling(self):
+        """Désactive l'instrumentation."""
+        super().disable_profiling()
+        self.csp_solver.disable_profiling()
+        self.cnn_solver.disable_profiling()
     
     def get_probabilities(self) -> Dict[Tuple[int, int], float]:
         """Retourne les probabilités du dernier solveur utilisé."""
@@ -313,6 +411,154 @@ class HybridSolver(BaseSolver):
         return self.last_solver_used or 'none'
 
 
+class BatchedGameRunner:
+    """
+    Fait avancer plusieurs parties en parallèle avec une seule passe du
+    réseau par coup.
+    
+    À chaque étape, les grilles de toutes les parties en cours qui ont besoin
+    du CNN sont encodées ensemble et évaluées en un lot, au lieu d'un forward
+    de taille 1 par partie.
+    """
+    
+    def __init__(
+        self,
+        model_path: str,
+        width: int = 16,
+        height: int = 16,
+        num_mines: int = 40,
+        model_type: str = 'cnn',
+        device: str = 'cuda',
+        hybrid: bool = False,
+        jit: bool = False,
+        max_batch_size: int = 256,
+        certainty_threshold: float = 0.1
+    ):
+        """
+        Initialise le runner.
+        
+        Args:
+            model_path: Chemin du modèle entraîné
+            width: Largeur des grilles
+            height: Hauteur des grilles
+            num_mines: Nombre de mines
+            model_type: 'cnn' ou 'resnet'
+            device: 'cuda' ou 'cpu'
+            hybrid: Utiliser HybridSolver (CSP puis CNN) au lieu du CNN seul
+            jit: Compiler le modèle en TorchScript figé
+            max_batch_size: Taille maximale d'un lot
+            certainty_threshold: Seuil CSP de HybridSolver
+        """
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self.model_path = model_path
+        self.model_type = model_type
+        self.hybrid = hybrid
+        self.max_batch_size = max_batch_size
+        self.certainty_threshold = certainty_threshold
+        
+        self.device = torch.device(device if torch.cuda.is_available() else 'cpu')
+        self.model = load_model(model_path, height, width, model_type, self.device)
+        if jit:
+            self.model = compile_for_inference(self.model, height, width)
+    
+    def _create_solver(self, board: Board) -> BaseSolver:
+        """Crée le solveur d'une partie en partageant le modèle."""
+        if self.hybrid:
+            return HybridSolver(
+                board, self.model_path, self.model_type,
+                certainty_threshold=self.certainty_threshold, model=self.model
+            )
+        return SupervisedSolver(board, self.model_path, self.model_type, model=self.model)
+    
+    def run(
+        self,
+        num_games: int = 0,
+        seed_offset: int = 0,
+        max_moves: int = 1000,
+        seeds: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """
+        Joue `num_games` parties en parallèle.
+        
+        Args:
+            num_games: Nombre de parties
+            seed_offset: Graine de la première partie (graines consécutives)
+            max_moves: Nombre maximal de coups par partie
+            seeds: Graines des parties (remplace num_games et seed_offset)
+            
+        Returns:
+            Liste de résultats par partie (won, num_moves, num_logical,
+            num_probabilistic, total_time, avg_move_time, max_move_time),
+            dans l'ordre des graines. Le temps d'une passe du réseau est
+            réparti entre les parties du lot.
+        """
+        if seeds is None:
+            seeds = [seed_offset + i for i in range(num_games)]
+        num_games = len(seeds)
+        boards = [Board(self.width, self.height, self.num_mines, seed=seed) for seed in seeds]
+        solvers = [self._create_solver(board) for board in boards]
+        moves = [0] * num_games
+        move_times = [[] for _ in range(num_games)]
+        active = list(range(num_games))
+        
+        while active:
+            # Coups CSP quasi-certains, sans passer par le réseau
+            pending = []
+            csp_times = {}
+            for i in active:
+                solver = solvers[i]
+                start = time.perf_counter()
+                move = solver.get_csp_move() if self.hybrid else None
+                elapsed = time.perf_counter() - start
+                if move is None:
+                    pending.append(i)
+                    csp_times[i] = elapsed
+                else:
+                    move_times[i].append(elapsed)
+                    boards[i].reveal(*move)
+                    moves[i] += 1
+            
+            # Une passe du réseau pour toutes les parties restantes
+            if pending:
+                start = time.perf_counter()
+                states = encode_states([boards[i] for i in pending])
+                scores = predict_scores(self.model, states, self.device, self.max_batch_size)
+                batch_time = (time.perf_counter() - start) / len(pending)
+                for i, scores_flat in zip(pending, scores):
+                    solver = solvers[i]
+                    start = time.perf_counter()
+                    if self.hybrid:
+                        move = solver.choose_cnn_move(scores_flat)
+                    else:
+                        move = solver.choose_move(scores_flat)
+                    move_times[i].append(csp_times[i] + batch_time + time.perf_counter() - start)
+                    if move is None:
+                        moves[i] = max_moves
+                        continue
+                    boards[i].reveal(*move)
+                    moves[i] += 1
+            
+            active = [
+                i for i in active
+                if boards[i].game_state == GameState.ONGOING and moves[i] < max_moves
+            ]
+        
+        results = []
+        for board, solver, num_moves, times in zip(boards, solvers, moves, move_times):
+            results.append({
+                'won': board.game_state == GameState.WON,
+                'num_moves': num_moves,
+                'num_logical': solver.num_logical_deductions,
+                'num_probabilistic': solver.num_probability_guesses,
+                'total_time': float(sum(times)),
+                'avg_move_time': float(np.mean(times)) if times else 0.0,
+                'max_move_time': float(np.max(times)) if times else 0.0
+            })
+        return results
+
+
 def create_solver(
     board: Board,
     solver_type: str = 'supervised',
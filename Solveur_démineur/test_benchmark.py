@@ -0,0 +1,109 @@
+"""
+Test de la reprise des benchmarks et de l'intervalle de confiance.
+"""
+
+import json
+import os
+import tempfile
+import torch
+from benchmark_all_solvers import SolverBenchmark, _run_game_job
+from solvers.simple_solver import SimpleSolver
+from solvers.supervised_solver import SupervisedSolver, HybridSolver
+from training.model import MinesweeperCNN
+
+
+def _read_records(path):
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def test_wilson_interval_known_values():
+    """Valeurs de référence de l'intervalle de Wilson à 95%."""
+    low, high = SolverBenchmark._wilson_interval(5, 10)
+    assert abs(low - 0.2366) < 1e-4 and abs(high - 0.7634) < 1e-4
+
+    low, high = SolverBenchmark._wilson_interval(0, 10)
+    assert low == 0.0 and abs(high - 0.2775) < 1e-4
+
+    low, high = SolverBenchmark._wilson_interval(10, 10)
+    assert abs(low - 0.7225) < 1e-4 and high == 1.0
+
+    assert SolverBenchmark._wilson_interval(0, 0) == (0.0, 0.0)
+
+
+def test_run_game_job_is_json_serializable():
+    """Le résultat d'un worker ne contient que des types Python."""
+    seed, result, error = _run_game_job((9, 9, 10, SimpleSolver, 3, {}, None))
+    assert seed == 3 and error is None
+    assert json.loads(json.dumps(result)) == result
+
+
+def test_benchmark_resumes_from_partial_results():
+    """Une relance ne rejoue que les seeds absentes du fichier JSONL."""
+    benchmark = SolverBenchmark(9, 9, 10)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.jsonl')
+        benchmark.benchmark_solver(SimpleSolver, num_games=3, results_path=path)
+
+        # Run interrompu au milieu de l'écriture d'une ligne
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"solver": "SimpleSolver", "seed": 3, "won"')
+
+        record_key = benchmark._record_key(SimpleSolver, {})
+        loaded = SolverBenchmark._load_results(path, record_key, set(range(5)))
+        assert sorted(loaded) == [0, 1, 2]
+
+        aggregate = benchmark.benchmark_solver(SimpleSolver, num_games=5, results_path=path)
+        assert aggregate['num_games'] == 5
+
+        seeds = [record['seed'] for record in _read_records(path)]
+        assert sorted(seeds) == [0, 1, 2, 3, 4]
+
+        # Une autre configuration ne réutilise pas ces parties
+        other = SolverBenchmark(9, 9, 12)
+        assert other._load_results(path, other._record_key(SimpleSolver, {}), set(range(5))) == {}
+
+
+def test_batched_cnn_benchmark_matches_serial():
+    """Les solveurs CNN joués en lot donnent les mêmes parties qu'une par une."""
+    benchmark = SolverBenchmark(9, 9, 10)
+    played = ('won', 'num_moves', 'num_logical', 'num_probabilistic')
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Checkpoint d'un modèle aléatoire, partagé par les deux modes
+        torch.manual_seed(0)
+        model_path = os.path.join(directory, 'model.pth')
+        torch.save({
+            'model_state_dict': MinesweeperCNN(9, 9).state_dict(),
+            'epoch': 0, 'val_loss': 0.0, 'val_acc': 0.0
+        }, model_path)
+
+        for solver_class in (SupervisedSolver, HybridSolver):
+            records = {}
+            for batched in (False, True):
+                path = os.path.join(directory, f'{solver_class.__name__}_{batched}.jsonl')
+                benchmark.benchmark_solver(
+                    solver_class, num_games=4, results_path=path, batched=batched,
+                    model_path=model_path
+                )
+                records[batched] = {
+                    record['seed']: tuple(record[key] for key in played)
+                    for record in _read_records(path)
+                }
+            assert sorted(records[True]) == [0, 1, 2, 3]
+            assert records[True] == records[False]
+
+
+if __name__ == "__main__":
+    test_wilson_interval_known_values()
+    test_run_game_job_is_json_serializable()
+    test_benchmark_resumes_from_partial_results()
+    test_batched_cnn_benchmark_matches_serial()
+    print("✅ Test benchmark OK")
@@ -0,0 +1,70 @@
+"""
+Tests de la grille (Board) : valeurs, propagation et index incrémentaux.
+"""
+
+import numpy as np
+from game.board import Board, CellState, GameState
+
+
+def _brute_force_values(board: Board) -> np.ndarray:
+    """Recalcule les valeurs case par case (référence)."""
+    values = np.zeros((board.height, board.width), dtype=int)
+    for r in range(board.height):
+        for c in range(board.width):
+            if not board.mines[r, c]:
+                values[r, c] = sum(board.mines[nr, nc] for nr, nc in board.get_neighbors(r, c))
+    return values
+
+
+def test_values_and_first_click():
+    """Les valeurs correspondent au comptage naïf et le premier clic est sûr."""
+    for seed in range(20):
+        board = Board(width=30, height=16, num_mines=99, seed=seed)
+        assert board.reveal(8, 15)
+        assert board.mines.sum() == 99
+        assert not board.mines[7:10, 14:17].any()
+        assert (board.values == _brute_force_values(board)).all()
+
+
+def test_incremental_indices():
+    """Les ensembles incrémentaux restent cohérents avec cell_states."""
+    board = Board(width=16, height=16, num_mines=40, seed=3)
+    board.reveal(0, 0)
+    hidden = board.get_hidden_cells()
+    board.flag(*hidden[0])
+    board.flag(*hidden[1])
+    board.flag(*hidden[1])  # Démarquer
+
+    assert board.num_flagged == 1
+    assert board.get_flagged_cells() == [hidden[0]]
+    assert board.get_hidden_cells() == [
+        (r, c) for r in range(16) for c in range(16)
+        if board.cell_states[r, c] == CellState.HIDDEN
+    ]
+    assert board.get_revealed_cells() == [
+        (r, c) for r in range(16) for c in range(16)
+        if board.cell_states[r, c] == CellState.REVEALED
+    ]
+    assert board.num_revealed == len(board.get_revealed_cells())
+
+    # Les listes renvoyées sont des copies du cache
+    board.get_flagged_cells().clear()
+    assert board.get_flagged_cells() == [hidden[0]]
+
+
+def test_win_detection():
+    """Révéler toutes les cases sûres termine la partie sur une victoire."""
+    board = Board(width=9, height=9, num_mines=10, seed=1)
+    board.reveal(4, 4)
+    for r, c in board.get_hidden_cells():
+        if not board.mines[r, c]:
+            board.reveal(r, c)
+    assert board.game_state == GameState.WON
+    assert board.num_hidden == 10
+
+
+if __name__ == "__main__":
+    test_values_and_first_click()
+    test_incremental_indices()
+    test_win_detection()
+    print("✅ Tests Board OK")
@@ -0,0 +1,85 @@
+"""
+Test du cache de transposition : les comptages obtenus par symétrie doivent
+être identiques à un comptage direct.
+"""
+
+import os
+import random
+import tempfile
+from csp.constraint_builder import Constraint
+from csp.enumerator import SolutionCounter
+from csp.cache import TranspositionCache, SYMMETRIES
+
+
+def _random_component(rng):
+    """Petite composante : cases d'une bande 2xN contraintes par des cases révélées."""
+    width = rng.randint(2, 6)
+    variables = [(r, c) for r in range(2) for c in range(width)]
+    layout = {v: rng.random() < 0.4 for v in variables}
+    constraints = []
+    for c in range(width):
+        members = [v for v in variables if abs(v[1] - c) <= 1]
+        constraints.append(Constraint(members, sum(layout[v] for v in members)))
+    return variables, constraints
+
+
+def _transform(variables, constraints, transform, dr, dc):
+    moved = {v: (transform(*v)[0] + dr, transform(*v)[1] + dc) for v in variables}
+    return (
+        [moved[v] for v in reversed(variables)],
+        [Constraint([moved[v] for v in c.variables], c.total) for c in constraints]
+    )
+
+
+def test_symmetric_components_hit_cache():
+    """Une composante transformée par symétrie est servie par le cache."""
+    counter = SolutionCounter()
+    for seed in range(40):
+        rng = random.Random(seed)
+        cache = TranspositionCache(min_variables=0)
+        cached_counter = SolutionCounter(cache=cache)
+        variables, constraints = _random_component(rng)
+        cached_counter.count(variables, constraints)
+
+        for transform in SYMMETRIES:
+            vs, cs = _transform(variables, constraints, transform, rng.randint(0, 9), rng.randint(0, 9))
+            max_mines = rng.choice([None, rng.randint(0, len(vs))])
+            expected = counter.count(vs, cs, max_mines=max_mines)
+            result = cached_counter.count(vs, cs, max_mines=max_mines)
+            assert {k: v for k, v in result.solutions.items() if v} == \
+                {k: v for k, v in expected.solutions.items() if v}
+            for k, count in expected.solutions.items():
+                if count:
+                    assert result.mine_counts[k] == expected.mine_counts[k]
+
+        assert cache.misses == 1
+        assert cache.hits == 8
+
+
+def test_lru_eviction_and_persistence():
+    """Éviction des entrées les plus anciennes et rechargement depuis le disque."""
+    counter = SolutionCounter()
+    cache = TranspositionCache(max_entries=2, min_variables=0)
+    components = [
+        ([(0, i) for i in range(n)], [Constraint([(0, i) for i in range(n)], 1)])
+        for n in (1, 2, 3)
+    ]
+    for variables, constraints in components:
+        _, handle = cache.lookup(variables, constraints)
+        cache.store(handle, counter.count(variables, constraints))
+    assert len(cache.entries) == 2
+    assert cache.lookup(*components[0])[0] is None
+    assert cache.lookup(*components[2])[0] is not None
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache.pkl')
+        cache.save(path)
+        reloaded = TranspositionCache(path=path, min_variables=0)
+        result, _ = reloaded.lookup(*components[1])
+        assert result.solutions == {1: 2}
+
+
+if __name__ == "__main__":
+    test_symmetric_components_hit_cache()
+    test_lru_eviction_and_persistence()
+    print("✅ Test cache OK")
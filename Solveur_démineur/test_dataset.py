@@ -0,0 +1,61 @@
+"""
+Test du dataset shardé (génération parallèle et lecture en memmap).
+"""
+
+import os
+import tempfile
+import numpy as np
+from game.board import Board
+from training.encoding import encode_states, pack_states, unpack_states
+from training.generate_dataset import DatasetGenerator, load_shard_index
+from training.train import ShardedMinesweeperDataset
+
+
+def test_pack_states_round_trip():
+    """pack_states puis unpack_states redonne exactement les états encodés."""
+    boards = []
+    for seed in range(4):
+        board = Board(width=9, height=9, num_mines=10, seed=seed)
+        board.reveal(4, 4)
+        board.flag(*board.get_hidden_cells()[0])
+        boards.append(board)
+    states = encode_states(boards)
+
+    packed = pack_states(states)
+    assert packed.dtype == np.uint8
+    assert (unpack_states(packed) == states).all()
+
+
+def test_generate_shards_and_read_back():
+    """Deux shards écrits par deux workers, relus par ShardedMinesweeperDataset."""
+    with tempfile.TemporaryDirectory() as directory:
+        generator = DatasetGenerator(width=6, height=6, num_mines=4, save_dir=directory)
+        index = generator.generate_shards(num_games=4, name='shards', games_per_shard=2, num_workers=2)
+        dataset_dir = os.path.join(directory, 'shards')
+
+        # Index écrit de manière atomique : aucun fichier temporaire ne reste
+        assert not [name for name in os.listdir(dataset_dir) if name.endswith('.tmp')]
+        assert load_shard_index(dataset_dir) == index
+        assert [shard['seed_start'] for shard in index['shards']] == [0, 2]
+
+        dataset = ShardedMinesweeperDataset(dataset_dir)
+        assert len(dataset) == sum(shard['num_examples'] for shard in index['shards']) > 0
+
+        # Dernier exemple : lu dans le second shard
+        last = index['shards'][-1]
+        prefix = os.path.join(dataset_dir, last['prefix'])
+        states = np.load(f"{prefix}_states.npy")
+        moves = np.load(f"{prefix}_moves.npy")
+        state, target, valid_mask = dataset[len(dataset) - 1]
+        assert (state.numpy() == unpack_states(states[-1:])[0]).all()
+        assert int(target) == moves[-1]
+        assert (valid_mask.numpy() == (state[1].numpy() == 0)).all()
+
+        # Relance : les shards présents ne sont pas rejoués
+        assert generator.generate_shards(num_games=4, name='shards', games_per_shard=2, num_workers=2) == index
+
+
+if __name__ == "__main__":
+    test_pack_states_round_trip()
+    test_generate_shards_and_read_back()
+    print("✅ Test dataset shardé OK")
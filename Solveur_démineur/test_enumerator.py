@@ -0,0 +1,99 @@
+"""
+Test du compteur de solutions natif contre une énumération exhaustive.
+"""
+
+import itertools
+import random
+from game.board import Board
+from csp.constraint_builder import Constraint
+from csp.enumerator import SolutionCounter
+from solvers.optimized_solver import OptimizedSolver
+
+
+def _brute_force(variables, constraints, max_mines=None):
+    """Compte les solutions par nombre de mines en testant toutes les affectations."""
+    solutions, mine_counts = {}, {}
+    for assignment in itertools.product([0, 1], repeat=len(variables)):
+        values = dict(zip(variables, assignment))
+        k = sum(assignment)
+        if max_mines is not None and k > max_mines:
+            continue
+        if all(sum(values[v] for v in c.variables) == c.total for c in constraints):
+            solutions[k] = solutions.get(k, 0) + 1
+            counts = mine_counts.setdefault(k, [0] * len(variables))
+            for i, value in enumerate(assignment):
+                counts[i] += value
+    return solutions, mine_counts
+
+
+def test_counter_matches_brute_force():
+    """Comptages par nombre de mines identiques à l'énumération exhaustive."""
+    for seed in range(200):
+        rng = random.Random(seed)
+        variables = [(0, i) for i in range(rng.randint(1, 11))]
+        layout = [rng.random() < 0.4 for _ in variables]
+
+        constraints = []
+        for _ in range(rng.randint(0, 6)):
+            subset = rng.sample(variables, rng.randint(1, min(5, len(variables))))
+            total = sum(layout[c] for _, c in subset)
+            constraints.append(Constraint(subset, total))
+
+        max_mines = rng.choice([None, rng.randint(0, len(variables))])
+        expected, expected_counts = _brute_force(variables, constraints, max_mines)
+
+        result = SolutionCounter().count(variables, constraints, max_mines=max_mines)
+        assert {k: v for k, v in result.solutions.items() if v} == expected
+        for k in expected:
+            assert result.mine_counts[k] == expected_counts[k]
+
+
+def test_global_probabilities_match_brute_force():
+    """Probabilités globales (frontière + intérieur) exactes sur petites grilles."""
+    checked = 0
+    for seed in range(60):
+        board = Board(width=6, height=5, num_mines=4 + seed % 4, seed=seed)
+        solver = OptimizedSolver(board)
+        board.reveal(2, 2)
+        hidden = board.get_hidden_cells()
+        if board.is_game_over() or len(hidden) > 20:
+            continue
+
+        # Placements des mines compatibles avec les cases révélées
+        revealed = board.get_revealed_cells()
+        total, mine_counts = 0, {cell: 0 for cell in hidden}
+        for placement in itertools.combinations(hidden, board.num_mines):
+            mines = set(placement)
+            if all(sum(n in mines for n in board.get_neighbors(r, c)) == board.values[r, c]
+                   for r, c in revealed):
+                total += 1
+                for cell in mines:
+                    mine_counts[cell] += 1
+
+        variables, _ = solver.constraint_builder.build_constraints()
+        components = solver.component_detector.find_components_from_frontier(
+            solver.constraint_builder.frontier, variables
+        )
+        probabilities = solver._combine_components(components)
+        for cell in hidden:
+            assert abs(probabilities[cell] - mine_counts[cell] / total) < 1e-12
+        checked += 1
+
+    assert checked > 0
+
+
+def test_large_component_hits_time_limit():
+    """Une composante plus profonde que la limite de récursion est interrompue proprement."""
+    variables = [(0, i) for i in range(4000)]
+    # Paires indépendantes (une mine sur deux cases) : 2000 niveaux de branchement
+    constraints = [Constraint([variables[i], variables[i + 1]], 1) for i in range(0, len(variables), 2)]
+
+    result = SolutionCounter(time_limit=0.2).count(variables, constraints)
+    assert not result.complete
+
+
+if __name__ == "__main__":
+    test_counter_matches_brute_force()
+    test_global_probabilities_match_brute_force()
+    test_large_component_hits_time_limit()
+    print("✅ Test compteur OK")
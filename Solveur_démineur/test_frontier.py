@@ -0,0 +1,47 @@
+"""
+Test de la frontière incrémentale : elle doit rester identique à une
+reconstruction complète des contraintes et des composantes.
+"""
+
+import random
+from game.board import Board
+from csp.constraint_builder import ConstraintBuilder
+from csp.components import ComponentDetector
+
+
+def _as_tuples(constraints):
+    return [(c.variables, c.total) for c in constraints]
+
+
+def test_frontier_matches_full_rebuild():
+    """Contraintes et composantes identiques après révélations et drapeaux."""
+    for seed in range(15):
+        rng = random.Random(seed)
+        board = Board(width=16, height=16, num_mines=40, seed=seed)
+        builder = ConstraintBuilder(board)
+
+        for _ in range(40):
+            hidden = board.get_hidden_cells()
+            row, col = rng.choice(hidden + board.get_flagged_cells())
+            if rng.random() < 0.3 and not board.first_click:
+                board.flag(row, col)
+            elif not board.mines[row, col]:
+                board.reveal(row, col)
+            if board.is_game_over():
+                break
+
+            reference = ConstraintBuilder(board, incremental=False)
+            variables, constraints = reference.build_constraints()
+            inc_variables, inc_constraints = builder.build_constraints()
+            assert variables == inc_variables
+            assert _as_tuples(constraints) == _as_tuples(inc_constraints)
+
+            frontier_vars = builder.frontier.get_variables()
+            expected = ComponentDetector().find_components(frontier_vars, constraints)
+            assert sorted(sorted(c['variables']) for c in expected) == \
+                sorted(c['variables'] for c in builder.frontier.get_components())
+
+
+if __name__ == "__main__":
+    test_frontier_matches_full_rebuild()
+    print("✅ Test frontière OK")
@@ -0,0 +1,59 @@
+"""
+Test de l'instrumentation par phase des solveurs.
+"""
+
+import json
+import os
+import tempfile
+from game.board import Board
+from solvers.optimized_solver import OptimizedSolver
+
+
+def _play(solver, board):
+    while not board.is_game_over():
+        move = solver.profiled_next_move()
+        if move is None:
+            break
+        board.reveal(*move)
+
+
+def test_profiling_records_phases_and_components():
+    """Chaque coup est enregistré avec ses phases et ses composantes."""
+    board = Board(width=16, height=16, num_mines=40, seed=3)
+    solver = OptimizedSolver(board)
+    profiler = solver.enable_profiling()
+    _play(solver, board)
+
+    summary = profiler.summary()
+    assert summary['num_moves'] == len(profiler.moves) > 0
+    assert {'constraint_build', 'simplification'} <= set(summary['phase_total_ms'])
+    assert summary['num_components'] > 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'trace.json')
+        profiler.save(path)
+        with open(path) as f:
+            events = json.load(f)['traceEvents']
+        assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+        assert sum(event['name'].startswith('move') for event in events) == summary['num_moves']
+
+
+def test_profiling_disabled_by_default():
+    """Sans profileur, les coups sont identiques et rien n'est enregistré."""
+    moves = []
+    for profile in (False, True):
+        board = Board(width=9, height=9, num_mines=10, seed=1)
+        solver = OptimizedSolver(board)
+        if profile:
+            solver.enable_profiling()
+        else:
+            assert solver.profiler is None
+        _play(solver, board)
+        moves.append(board.cell_states.copy())
+    assert (moves[0] == moves[1]).all()
+
+
+if __name__ == "__main__":
+    test_profiling_records_phases_and_components()
+    test_profiling_disabled_by_default()
+    print("✅ Test profilage OK")
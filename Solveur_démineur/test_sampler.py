@@ -0,0 +1,54 @@
+"""
+Test de l'échantillonneur : estimations compatibles avec le comptage exact.
+"""
+
+from game.board import Board
+from csp.constraint_builder import ConstraintBuilder
+from csp.enumerator import SolutionCounter
+from csp.sampler import SolutionSampler
+from csp.probability import ProbabilityCalculator
+
+
+def test_sampler_matches_exact_counts():
+    """Probabilités estimées dans leurs intervalles de confiance (à quelques exceptions près)."""
+    calculator = ProbabilityCalculator()
+    inside = total = 0
+    for seed in range(10):
+        board = Board(width=30, height=16, num_mines=99, seed=seed)
+        board.reveal(8, 15)
+        if board.is_game_over():
+            continue
+        variables, constraints = ConstraintBuilder(board).build_constraints()
+        frontier = sorted({v for c in constraints for v in c.variables})
+        if not frontier:
+            continue
+
+        exact = calculator.calculate_probabilities_from_counts(
+            SolutionCounter().count(frontier, constraints)
+        )
+        estimate = SolutionSampler(num_samples=3000, time_limit=None, seed=seed).sample(
+            frontier, constraints
+        )
+        assert abs(estimate.total() - 1.0) < 1e-9
+
+        for var, (low, high) in estimate.confidence_intervals(z=3.0).items():
+            total += 1
+            inside += low - 1e-9 <= exact[var] <= high + 1e-9
+
+    assert total > 0
+    assert inside >= 0.95 * total
+
+
+def test_sampler_without_solution():
+    """Aucune solution : résultat vide."""
+    from csp.constraint_builder import Constraint
+    variables = [(0, 0), (0, 1)]
+    constraints = [Constraint(variables, 1), Constraint([(0, 0)], 1), Constraint([(0, 1)], 1)]
+    result = SolutionSampler(num_samples=100, seed=0).sample(variables, constraints)
+    assert result.total() == 0
+
+
+if __name__ == "__main__":
+    test_sampler_matches_exact_counts()
+    test_sampler_without_solution()
+    print("✅ Test échantillonneur OK")
@@ -71,5 +71,33 @@ def test_simple_game():
     return board.game_state == GameState.WON
 
 
+def test_truncated_count_falls_back_to_sampler():
+    """Un comptage interrompu n'est pas utilisé tel quel : estimation par échantillonnage."""
+    board = Board(width=9, height=9, num_mines=10, seed=1)
+    solver = ORToolsSolver(board)
+    profiler = solver.enable_profiling()
+    
+    count = solver.counter.count
+    bounds = []
+    
+    def truncated_count(variables, constraints, max_mines=None):
+        bounds.append(max_mines)
+        result = count(variables, constraints, max_mines=max_mines)
+        result.complete = False
+        return result
+    
+    solver.counter.count = truncated_count
+    while not board.is_game_over():
+        move = solver.profiled_next_move()
+        if move is None:
+            break
+        board.reveal(*move)
+    
+    methods = {c['method'] for move in profiler.moves for c in move['components']}
+    assert methods == {'sampled'}
+    assert bounds and all(bound is not None for bound in bounds)
+
+
 if __name__ == "__main__":
     test_simple_game()
+    test_truncated_count_falls_back_to_sampler()
@@ -0,0 +1,97 @@
+"""
+Test de l'inférence en lot du solveur supervisé (BatchedGameRunner).
+"""
+
+import numpy as np
+import torch
+from game.board import Board, GameState
+from solvers.supervised_solver import (
+    BatchedGameRunner, HybridSolver, SupervisedSolver, predict_scores
+)
+from training.encoding import encode_states
+
+WIDTH, HEIGHT, MINES = 9, 9, 10
+NUM_GAMES = 4
+MAX_MOVES = 100
+
+
+def _make_runner(hybrid: bool, jit: bool) -> BatchedGameRunner:
+    # Pas de checkpoint : modèle aléatoire, reproductible grâce à la graine
+    torch.manual_seed(0)
+    return BatchedGameRunner(
+        'modele_inexistant.pth', width=WIDTH, height=HEIGHT, num_mines=MINES,
+        device='cpu', hybrid=hybrid, jit=jit
+    )
+
+
+def _play_one(runner: BatchedGameRunner, seed: int) -> dict:
+    """Joue une partie seule, un forward de taille 1 par coup."""
+    board = Board(WIDTH, HEIGHT, MINES, seed=seed)
+    if runner.hybrid:
+        solver = HybridSolver(board, runner.model_path, model=runner.model)
+    else:
+        solver = SupervisedSolver(board, runner.model_path, device='cpu', model=runner.model)
+
+    num_moves = 0
+    while board.game_state == GameState.ONGOING and num_moves < MAX_MOVES:
+        move = solver.get_next_move()
+        if move is None:
+            num_moves = MAX_MOVES
+            break
+        board.reveal(*move)
+        num_moves += 1
+    assert solver.num_moves == num_moves
+
+    return {
+        'won': board.game_state == GameState.WON,
+        'num_moves': num_moves,
+        'num_logical': solver.num_logical_deductions,
+        'num_probabilistic': solver.num_probability_guesses
+    }
+
+
+def _check_batched_matches_single(hybrid: bool, jit: bool):
+    runner = _make_runner(hybrid, jit)
+    seeds = [7, 8, 11, 12]
+    batched = runner.run(seeds=seeds, max_moves=MAX_MOVES)
+    single = [_play_one(runner, seed) for seed in seeds]
+    # Les durées ne sont pas comparables : seuls les coups joués doivent coïncider
+    assert [{key: r[key] for key in s} for r, s in zip(batched, single)] == single
+    assert all(r['total_time'] >= r['max_move_time'] >= r['avg_move_time'] > 0 for r in batched)
+
+
+def test_batched_scores_match_single():
+    """Les scores d'un lot sont ceux des forwards de taille 1 (modèle eager et TorchScript)."""
+    boards = []
+    for seed in range(NUM_GAMES):
+        board = Board(WIDTH, HEIGHT, MINES, seed=seed)
+        board.reveal(seed % HEIGHT, seed % WIDTH)
+        boards.append(board)
+    states = encode_states(boards)
+
+    for jit in (False, True):
+        runner = _make_runner(hybrid=False, jit=jit)
+        device = torch.device('cpu')
+        batched = predict_scores(runner.model, states, device, max_batch_size=3)
+        single = np.concatenate([predict_scores(runner.model, s[np.newaxis], device) for s in states])
+        assert batched.shape == (NUM_GAMES, WIDTH * HEIGHT)
+        np.testing.assert_allclose(batched, single, rtol=1e-5, atol=1e-5)
+
+
+def test_batched_runner_matches_single_games():
+    """BatchedGameRunner joue les mêmes coups que le solveur partie par partie."""
+    for jit in (False, True):
+        _check_batched_matches_single(hybrid=False, jit=jit)
+
+
+def test_batched_hybrid_runner_matches_single_games():
+    """Idem avec HybridSolver (coups CSP puis CNN)."""
+    for jit in (False, True):
+        _check_batched_matches_single(hybrid=True, jit=jit)
+
+
+if __name__ == "__main__":
+    test_batched_scores_match_single()
+    test_batched_runner_matches_single_games()
+    test_batched_hybrid_runner_matches_single_games()
+    print("✅ Tests d'inférence en lot réussis")
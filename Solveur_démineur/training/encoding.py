@@ -0,0 +1,104 @@
+"""
+Encodage vectorisé des grilles pour le réseau.
+
+Channels:
+0: Cases révélées (valeurs 0-8 normalisées)
+1: Masque binaire (révélé=1, caché=0)
+2: Mines marquées (drapeaux)
+3: Frontière (cases cachées adjacentes à cases révélées)
+"""
+
+import numpy as np
+from typing import List
+from game.board import Board, NEIGHBOR_OFFSETS, HIDDEN, REVEALED, FLAGGED
+
+
+def encode_states(boards: List[Board]) -> np.ndarray:
+    """
+    Encode un lot de grilles de même taille.
+
+    Args:
+        boards: Grilles à encoder
+
+    Returns:
+        Array float32 (N, 4, H, W)
+    """
+    states = np.stack([board.cell_states for board in boards])
+    values = np.stack([board.values for board in boards])
+    n, h, w = states.shape
+
+    revealed = states == REVEALED
+    encoded = np.zeros((n, 4, h, w), dtype=np.float32)
+
+    # Channels 0-2: valeurs, masque révélé, drapeaux
+    encoded[:, 0] = np.where(revealed, values / 8.0, 0.0)
+    encoded[:, 1] = revealed
+    encoded[:, 2] = states == FLAGGED
+
+    # Channel 3: cases cachées avec au moins un voisin révélé
+    padded = np.pad(revealed, ((0, 0), (1, 1), (1, 1)))
+    has_revealed_neighbor = np.zeros((n, h, w), dtype=bool)
+    for dr, dc in NEIGHBOR_OFFSETS:
+        has_revealed_neighbor |= padded[:, 1 + dr:1 + dr + h, 1 + dc:1 + dc + w]
+    encoded[:, 3] = (states == HIDDEN) & has_revealed_neighbor
+
+    return encoded
+
+
+def encode_state(board: Board) -> np.ndarray:
+    """
+    Encode une grille.
+
+    Args:
+        board: Grille de jeu
+
+    Returns:
+        Array float32 (4, H, W)
+    """
+    return encode_states([board])[0]
+
+
+def valid_masks(boards: List[Board]) -> np.ndarray:
+    """
+    Masques des coups valides (cases cachées) d'un lot de grilles.
+
+    Args:
+        boards: Grilles de même taille
+
+    Returns:
+        Array float32 (N, H, W)
+    """
+    return np.stack([board.cell_states == HIDDEN for board in boards]).astype(np.float32)
+
+
+def pack_states(states: np.ndarray) -> np.ndarray:
+    """
+    Compacte des états encodés en uint8 pour le stockage sur disque.
+
+    Le channel 0 (valeurs / 8) est ramené aux entiers 0-8, les autres
+    channels sont binaires.
+
+    Args:
+        states: Array float32 (N, 4, H, W)
+
+    Returns:
+        Array uint8 (N, 4, H, W)
+    """
+    packed = np.rint(states).astype(np.uint8)
+    packed[:, 0] = np.rint(states[:, 0] * 8.0)
+    return packed
+
+
+def unpack_states(packed: np.ndarray) -> np.ndarray:
+    """
+    Inverse de pack_states.
+
+    Args:
+        packed: Array uint8 (N, 4, H, W)
+
+    Returns:
+        Array float32 (N, 4, H, W)
+    """
+    states = packed.astype(np.float32)
+    states[:, 0] /= 8.0
+    return states
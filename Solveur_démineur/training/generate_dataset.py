@@ -6,16 +6,21 @@ Utilise le solveur CSP expert pour générer des exemples (état, meilleur coup)
 
 import numpy as np
 import pickle
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Ajouter le dossier racine au path pour permettre les imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import List, Tuple, Dict
 from tqdm import tqdm
-from game.board import Board, CellState, GameState
+from game.board import Board, GameState
 from solvers.optimized_solver import OptimizedSolver
+from training.encoding import encode_state, pack_states
+
+INDEX_FILENAME = "index.json"
 
 
 class DatasetGenerator:
@@ -141,49 +146,7 @@ class DatasetGenerator:
         Returns:
             Tensor numpy (4, height, width)
         """
-        h, w = board.height, board.width
-        state = np.zeros((4, h, w), dtype=np.float32)
-        
-        # Channel 0: Valeurs normalisées
-        for r in range(h):
-            for c in range(w):
-                if board.cell_states[r, c] == CellState.REVEALED:
-                    state[0, r, c] = board.values[r, c] / 8.0
-        
-        # Channel 1: Masque révélé
-        for r in range(h):
-            for c in range(w):
-                if board.cell_states[r, c] == CellState.REVEALED:
-                    state[1, r, c] = 1.0
-        
-        # Channel 2: Drapeaux
-        for r in range(h):
-            for c in range(w):
-                if board.cell_states[r, c] == CellState.FLAGGED:
-                    state[2, r, c] = 1.0
-        
-        # Channel 3: Frontière (cases cachées avec voisin révélé)
-        for r in range(h):
-            for c in range(w):
-                if board.cell_states[r, c] == CellState.HIDDEN:
-                    # Vérifier si adjacent à une case révélée
-                    has_revealed_neighbor = False
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue
-                            nr, nc = r + dr, c + dc
-                            if 0 <= nr < h and 0 <= nc < w:
-                                if board.cell_states[nr, nc] == CellState.REVEALED:
-                                    has_revealed_neighbor = True
-                                    break
-                        if has_revealed_neighbor:
-                            break
-                    
-                    if has_revealed_neighbor:
-                        state[3, r, c] = 1.0
-        
-        return state
+        return encode_state(board)
     
     def save_dataset(self, dataset: List[Dict], filename: str):
         """
@@ -237,6 +200,152 @@ class DatasetGenerator:
         print(f"  - Total exemples: {len(dataset)}")
         print(f"  - Coups certains: {certain_moves} ({100*certain_moves/len(dataset):.1f}%)")
         print(f"  - Coups probabilistes: {len(dataset)-certain_moves} ({100*(len(dataset)-certain_moves)/len(dataset):.1f}%)")
+    
+    def generate_shards(
+        self,
+        num_games: int = 1000,
+        name: str = "dataset",
+        seed_start: int = 0,
+        games_per_shard: int = 100,
+        num_workers: int = None
+    ) -> Dict:
+        """
+        Génère un dataset shardé en parallèle, directement sur disque.
+        
+        Chaque shard regroupe les exemples de `games_per_shard` parties
+        consécutives et est écrit par un worker sous forme de fichiers .npy
+        de forme fixe (lisibles en memmap). Le fichier index.json est mis à
+        jour après chaque shard terminé : une génération interrompue reprend
+        en ne rejouant que les shards manquants.
+        
+        Args:
+            num_games: Nombre de parties
+            name: Nom du dossier du dataset (dans save_dir)
+            seed_start: Seed de départ
+            games_per_shard: Nombre de parties par shard
+            num_workers: Nombre de processus (None = nombre de CPU)
+            
+        Returns:
+            Index du dataset
+        """
+        dataset_dir = os.path.join(self.save_dir, name)
+        os.makedirs(dataset_dir, exist_ok=True)
+        
+        index = load_shard_index(dataset_dir)
+        config = {'width': self.width, 'height': self.height, 'num_mines': self.num_mines}
+        if index is None or any(index[key] != value for key, value in config.items()):
+            index = {**config, 'shards': []}
+        done = {shard['seed_start'] for shard in index['shards']}
+        
+        jobs = []
+        for shard_seed in range(seed_start, seed_start + num_games, games_per_shard):
+            if shard_seed in done:
+                continue
+            shard_games = min(games_per_shard, seed_start + num_games - shard_seed)
+            jobs.append((
+                self.width, self.height, self.num_mines,
+                dataset_dir, shard_seed, shard_games
+            ))
+        
+        print(f"🎮 Génération de {num_games} parties en {len(jobs)} shards "
+              f"({len(done)} déjà présents)...")
+        
+        num_workers = num_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_generate_shard, job) for job in jobs]
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                index['shards'].append(future.result())
+                index['shards'].sort(key=lambda shard: shard['seed_start'])
+                _write_shard_index(dataset_dir, index)
+        
+        total = sum(shard['num_examples'] for shard in index['shards'])
+        print(f"✅ {total} exemples dans {dataset_dir}")
+        return index
+
+
+def _generate_shard(job: Tuple) -> Dict:
+    """
+    Joue les parties d'un shard et l'écrit sur disque (exécuté dans un worker).
+    
+    Fichiers écrits (préfixe shard_<seed_start>):
+    - _states.npy: uint8 (N, 4, H, W), voir encoding.pack_states
+    - _moves.npy: int32 (N,), coup linéarisé row * width + col
+    - _probs.npy: float32 (N, H*W), probabilités du solveur (NaN si inconnue)
+    - _certain.npy: bool (N,)
+    
+    Args:
+        job: (width, height, num_mines, dataset_dir, seed_start, num_games)
+        
+    Returns:
+        Entrée d'index du shard
+    """
+    width, height, num_mines, dataset_dir, seed_start, num_games = job
+    generator = DatasetGenerator(width, height, num_mines, save_dir=dataset_dir)
+    
+    examples = []
+    for seed in range(seed_start, seed_start + num_games):
+        board = Board(width, height, num_mines, seed=seed)
+        solver = OptimizedSolver(board)
+        examples.extend(generator._play_and_record(board, solver))
+    
+    n = len(examples)
+    states = np.zeros((n, 4, height, width), dtype=np.float32)
+    moves = np.zeros(n, dtype=np.int32)
+    probs = np.full((n, height * width), np.nan, dtype=np.float32)
+    certain = np.zeros(n, dtype=bool)
+    for i, example in enumerate(examples):
+        states[i] = example['state']
+        moves[i] = example['move'][0] * width + example['move'][1]
+        for (r, c), p in example['probabilities'].items():
+            probs[i, r * width + c] = p
+        certain[i] = example['is_certain']
+    
+    prefix = f"shard_{seed_start:08d}"
+    arrays = {
+        'states': pack_states(states),
+        'moves': moves,
+        'probs': probs,
+        'certain': certain
+    }
+    for key, array in arrays.items():
+        # Écriture atomique: un shard est complet ou absent
+        path = os.path.join(dataset_dir, f"{prefix}_{key}.npy")
+        with open(path + '.tmp', 'wb') as f:
+            np.save(f, array)
+        os.replace(path + '.tmp', path)
+    
+    return {
+        'prefix': prefix,
+        'seed_start': seed_start,
+        'num_games': num_games,
+        'num_examples': n,
+        'num_certain': int(certain.sum())
+    }
+
+
+def load_shard_index(dataset_dir: str) -> Dict:
+    """
+    Charge l'index d'un dataset shardé.
+    
+    Args:
+        dataset_dir: Dossier du dataset
+        
+    Returns:
+        Index, ou None s'il n'existe pas
+    """
+    path = os.path.join(dataset_dir, INDEX_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_shard_index(dataset_dir: str, index: Dict):
+    """Écrit l'index de manière atomique."""
+    path = os.path.join(dataset_dir, INDEX_FILENAME)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(path + '.tmp', path)
 
 
 def generate_multiple_datasets():
@@ -247,21 +356,21 @@ def generate_multiple_datasets():
     print("🔰 NIVEAU DÉBUTANT")
     print("="*60)
     gen_easy = DatasetGenerator(width=9, height=9, num_mines=10)
-    gen_easy.generate_and_save(num_games=500, filename="dataset_easy.pkl", seed_start=0)
+    gen_easy.generate_shards(num_games=500, name="dataset_easy", seed_start=0)
     
     # Dataset intermédiaire (16x16, 40 mines)
     print("\n" + "="*60)
     print("⚡ NIVEAU INTERMÉDIAIRE")
     print("="*60)
     gen_medium = DatasetGenerator(width=16, height=16, num_mines=40)
-    gen_medium.generate_and_save(num_games=1000, filename="dataset_medium.pkl", seed_start=1000)
+    gen_medium.generate_shards(num_games=1000, name="dataset_medium", seed_start=1000)
     
     # Dataset expert (30x16, 99 mines)
     print("\n" + "="*60)
     print("💀 NIVEAU EXPERT")
     print("="*60)
     gen_hard = DatasetGenerator(width=30, height=16, num_mines=99)
-    gen_hard.generate_and_save(num_games=500, filename="dataset_hard.pkl", seed_start=2000)
+    gen_hard.generate_shards(num_games=500, name="dataset_hard", seed_start=2000)
 
 
 if __name__ == "__main__":
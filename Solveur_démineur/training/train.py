@@ -7,7 +7,7 @@ Optimisé pour RTX 3060 avec support CUDA et mixed precision training.
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, Subset
 from torch.cuda.amp import GradScaler, autocast
 import numpy as np
 import pickle
@@ -21,6 +21,8 @@ from typing import List, Dict, Tuple
 from tqdm import tqdm
 import matplotlib.pyplot as plt
 from training.model import create_model, count_parameters
+from training.encoding import unpack_states
+from training.generate_dataset import load_shard_index
 
 
 class MinesweeperDataset(Dataset):
@@ -66,6 +68,75 @@ class MinesweeperDataset(Dataset):
         return state, target, valid_mask
 
 
+class ShardedMinesweeperDataset(Dataset):
+    """
+    Dataset PyTorch lisant paresseusement un dataset shardé
+    (voir DatasetGenerator.generate_shards).
+    
+    Les shards sont ouverts en memmap au premier accès, séparément dans
+    chaque worker du DataLoader : seuls les exemples lus sont chargés en RAM.
+    """
+    
+    def __init__(self, dataset_dir: str):
+        """
+        Initialise le dataset.
+        
+        Args:
+            dataset_dir: Dossier contenant index.json et les shards
+        """
+        index = load_shard_index(dataset_dir)
+        if index is None:
+            raise FileNotFoundError(f"Index introuvable dans {dataset_dir}")
+        
+        self.dataset_dir = dataset_dir
+        self.height = index['height']
+        self.width = index['width']
+        self.shards = [shard for shard in index['shards'] if shard['num_examples'] > 0]
+        
+        # Position de départ de chaque shard dans la numérotation globale
+        sizes = [shard['num_examples'] for shard in self.shards]
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self._arrays = {}
+    
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+    
+    def _shard_arrays(self, shard_idx: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Ouvre (une seule fois) les memmaps d'un shard."""
+        arrays = self._arrays.get(shard_idx)
+        if arrays is None:
+            prefix = os.path.join(self.dataset_dir, self.shards[shard_idx]['prefix'])
+            arrays = (
+                np.load(f"{prefix}_states.npy", mmap_mode='r'),
+                np.load(f"{prefix}_moves.npy", mmap_mode='r')
+            )
+            self._arrays[shard_idx] = arrays
+        return arrays
+    
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Récupère un exemple.
+        
+        Returns:
+            Tuple (state, target_move, valid_mask)
+        """
+        shard_idx = int(np.searchsorted(self.offsets, idx, side='right')) - 1
+        states, moves = self._shard_arrays(shard_idx)
+        local_idx = idx - self.offsets[shard_idx]
+        
+        state = torch.from_numpy(unpack_states(states[local_idx:local_idx + 1])[0])
+        target = torch.tensor(int(moves[local_idx]), dtype=torch.long)
+        valid_mask = (state[1, :, :] == 0).float()  # Channel 1 = masque révélé
+        
+        return state, target, valid_mask
+    
+    def __getstate__(self):
+        # Les memmaps ne sont pas transmis aux workers du DataLoader
+        state = self.__dict__.copy()
+        state['_arrays'] = {}
+        return state
+
+
 def load_datasets(data_dir: str = "training/data") -> Dict[str, List[Dict]]:
     """
     Charge tous les datasets.
@@ -74,7 +145,7 @@ def load_datasets(data_dir: str = "training/data") -> Dict[str, List[Dict]]:
         data_dir: Dossier des données
         
     Returns:
-        Dictionnaire {difficulty: examples}
+        Dictionnaire {difficulty: examples ou ShardedMinesweeperDataset}
     """
     datasets = {}
     
@@ -86,7 +157,13 @@ def load_datasets(data_dir: str = "training/data") -> Dict[str, List[Dict]]:
     
     for difficulty, filename in files.items():
         filepath = os.path.join(data_dir, filename)
-        if os.path.exists(filepath):
+        shard_dir = os.path.join(data_dir, os.path.splitext(filename)[0])
+        if load_shard_index(shard_dir) is not None:
+            # Dataset shardé: lecture paresseuse
+            data = ShardedMinesweeperDataset(shard_dir)
+            datasets[difficulty] = data
+            print(f"📂 {difficulty}: {len(data)} exemples ({len(data.shards)} shards)")
+        elif os.path.exists(filepath):
             with open(filepath, 'rb') as f:
                 data = pickle.load(f)
             datasets[difficulty] = data
@@ -148,6 +225,64 @@ def create_dataloaders(
     return train_loader, val_loader
 
 
+def create_sharded_dataloaders(
+    dataset: ShardedMinesweeperDataset,
+    batch_size: int = 64,
+    train_split: float = 0.8,
+    seed: int = 0
+) -> Tuple[DataLoader, DataLoader]:
+    """
+    Crée les dataloaders train/val d'un dataset shardé.
+    
+    La séparation se fait par shard (donc par groupes de parties) pour que
+    les positions d'une même partie ne se retrouvent pas dans les deux
+    ensembles, et pour garder des lectures locales sur disque.
+    
+    Args:
+        dataset: Dataset shardé
+        batch_size: Taille des batchs
+        train_split: Proportion du train
+        seed: Graine du mélange des shards
+        
+    Returns:
+        Tuple (train_loader, val_loader)
+    """
+    if len(dataset.shards) < 2:
+        raise ValueError("Au moins deux shards sont nécessaires pour séparer train et val")
+    
+    rng = np.random.default_rng(seed)
+    shard_order = rng.permutation(len(dataset.shards))
+    split_idx = min(max(1, int(len(shard_order) * train_split)), len(shard_order) - 1)
+    
+    def _indices(shards):
+        return np.concatenate([
+            np.arange(dataset.offsets[i], dataset.offsets[i + 1]) for i in sorted(shards)
+        ] or [np.zeros(0, dtype=np.int64)]).tolist()
+    
+    train_dataset = Subset(dataset, _indices(shard_order[:split_idx]))
+    val_dataset = Subset(dataset, _indices(shard_order[split_idx:]))
+    
+    train_loader = DataLoader(
+        train_dataset,
+        batch_size=batch_size,
+        shuffle=True,
+        num_workers=4,
+        pin_memory=True,
+        persistent_workers=True
+    )
+    
+    val_loader = DataLoader(
+        val_dataset,
+        batch_size=batch_size,
+        shuffle=False,
+        num_workers=4,
+        pin_memory=True,
+        persistent_workers=True
+    )
+    
+    return train_loader, val_loader
+
+
 class Trainer:
     """Entraîneur pour le modèle CNN."""
     
@@ -413,9 +548,13 @@ def train_model(
     examples = datasets[difficulty]
     
     # Créer dataloaders
-    train_loader, val_loader = create_dataloaders(
-        examples, height, width, batch_size
-    )
+    if isinstance(examples, ShardedMinesweeperDataset):
+        height, width = examples.height, examples.width
+        train_loader, val_loader = create_sharded_dataloaders(examples, batch_size)
+    else:
+        train_loader, val_loader = create_dataloaders(
+            examples, height, width, batch_size
+        )
     
     print(f"\n📊 Dataset:")
     print(f"  Train: {len(train_loader.dataset)} exemples")
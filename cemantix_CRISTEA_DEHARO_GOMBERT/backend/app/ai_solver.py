@@ -3,21 +3,56 @@ Module d'IA pour résoudre automatiquement le jeu Cemantix
 """
 from typing import List, Dict, Tuple, Optional
 import numpy as np
-import spacy
-from sklearn.metrics.pairwise import cosine_similarity
 
 # Le modèle spaCy est déjà chargé dans game.py
 # On l'importe depuis là
-from .game import nlp
+from .game import get_nlp
+from .neighbors import ExactIndex, build_index
 
 
 class AISolver:
     """IA qui résout le jeu Cemantix en utilisant la similarité sémantique"""
     
-    def __init__(self, vocab: List[str], vocab_vectors: np.ndarray):
+    def __init__(self, vocab: List[str], vocab_vectors: np.ndarray, index: Optional[ExactIndex] = None,
+                 seed: Optional[int] = None, word_to_index: Optional[Dict[str, int]] = None):
         self.vocab = vocab
         self.vocab_vectors = vocab_vectors
+        # Index des plus proches voisins et table mot -> ligne (partagés avec le GameManager si fournis)
+        self.index = index if index is not None else build_index(vocab_vectors)
+        if word_to_index is None:
+            word_to_index = {}
+            for i, word in enumerate(vocab):
+                word_to_index.setdefault(word, i)
+        self.word_to_index = word_to_index
         self.used_words = set()
+        # Générateur des tirages parmi les meilleurs candidats (seed fixe : parties reproductibles)
+        self.rng = np.random.default_rng(seed)
+    
+    def _used_mask(self) -> np.ndarray:
+        """Masque des mots déjà utilisés (exclus des recherches)"""
+        mask = np.zeros(len(self.vocab), dtype=bool)
+        for word in self.used_words:
+            idx = self.word_to_index.get(word)
+            if idx is not None:
+                mask[idx] = True
+        return mask
+    
+    def _word_vector(self, word: str) -> Optional[np.ndarray]:
+        """Vecteur normalisé d'un mot (spaCy seulement hors vocabulaire)"""
+        idx = self.word_to_index.get(word)
+        if idx is not None:
+            return self.index.vector(idx)
+        doc = get_nlp()(word)
+        if not doc.has_vector or doc.vector_norm == 0:
+            return None
+        return doc.vector / doc.vector_norm
+    
+    def _pick_near(self, query: np.ndarray, k: int, exclude: np.ndarray) -> Optional[str]:
+        """Tire un mot au hasard parmi les k plus proches du vecteur (hors mots utilisés)"""
+        top_indices, _ = self.index.search(query, k, exclude=exclude)
+        if len(top_indices) == 0:
+            return None
+        return self.vocab[self.rng.choice(top_indices)]
     
     def find_best_guess(self, history: List[Dict]) -> Optional[str]:
         """
@@ -29,46 +64,31 @@ class AISolver:
         3. Si score > 70% : chercher dans un rayon restreint autour du meilleur guess
         4. Sinon : utiliser triangulation sémantique avec les meilleurs guesses
         """
-        # Filtrer les mots déjà utilisés
-        available_vocab = [w for w in self.vocab if w not in self.used_words]
-        if not available_vocab:
-            return None
-        
-        vocab_to_index = {w: i for i, w in enumerate(self.vocab)}
-        available_indices = [vocab_to_index[w] for w in available_vocab if w in vocab_to_index]
-        
-        if not available_indices:
+        # Filtrer les mots déjà utilisés (masque sur les lignes de l'index)
+        used_mask = self._used_mask()
+        available_indices = np.flatnonzero(~used_mask)
+        if len(available_indices) == 0:
             return None
         
-        available_vectors = self.vocab_vectors[available_indices]
-        
         # Si pas d'historique, commencer avec un mot commun et représentatif
         if not history:
             # Stratégie : choisir un mot qui est sémantiquement "central" 
             # (proche de beaucoup d'autres mots dans l'espace sémantique)
             # On prend quelques mots communs et on choisit celui qui est le plus "central"
-            candidates = available_vocab[:min(50, len(available_vocab))]
+            candidate_indices = available_indices[:50]
             
-            if len(candidates) > 10:
-                # Calculer la similarité moyenne de chaque candidat avec tous les autres
-                candidate_indices = [vocab_to_index[w] for w in candidates if w in vocab_to_index]
-                if candidate_indices:
-                    candidate_vectors = self.vocab_vectors[candidate_indices]
-                    # Pour chaque candidat, calculer sa similarité moyenne avec les autres
-                    avg_similarities = []
-                    for i, vec in enumerate(candidate_vectors):
-                        vec_reshaped = vec.reshape(1, -1)
-                        sims = cosine_similarity(vec_reshaped, candidate_vectors)[0]
-                        # Moyenne sans compter la similarité avec soi-même (qui est 1.0)
-                        avg_sim = (np.sum(sims) - 1.0) / (len(sims) - 1) if len(sims) > 1 else 0
-                        avg_similarities.append(avg_sim)
-                    
-                    # Prendre le mot le plus "central" (haute similarité moyenne)
-                    best_central_idx = np.argmax(avg_similarities)
-                    return candidates[best_central_idx]
+            if len(candidate_indices) > 10:
+                # Similarité moyenne de chaque candidat avec les autres (un seul produit matriciel)
+                candidate_vectors = np.asarray(self.index.vectors[candidate_indices], dtype=np.float32)
+                sims = candidate_vectors @ candidate_vectors.T
+                # Moyenne sans compter la similarité avec soi-même (qui est 1.0)
+                avg_similarities = (sims.sum(axis=1) - 1.0) / (len(candidate_indices) - 1)
+                
+                # Prendre le mot le plus "central" (haute similarité moyenne)
+                return self.vocab[candidate_indices[np.argmax(avg_similarities)]]
             
             # Fallback simple
-            return np.random.choice(candidates)
+            return self.vocab[self.rng.choice(candidate_indices)]
         
         # Analyser l'historique
         best_guess = max(history, key=lambda h: h.get('score', 0))
@@ -76,29 +96,21 @@ class AISolver:
         best_word = best_guess.get('guess', '')
         best_rank = best_guess.get('rank', 999999)
         
-        best_word_doc = nlp(best_word)
-        if not best_word_doc.has_vector:
-            return np.random.choice(available_vocab)
-        
-        best_vec = best_word_doc.vector.reshape(1, -1)
+        best_vec = self._word_vector(best_word)
+        if best_vec is None:
+            return self.vocab[self.rng.choice(available_indices)]
         
         # STRATÉGIE 1 : Score très élevé (>90%) - Convergence agressive
         if best_score > 0.9:
             # Chercher les mots les plus proches du meilleur guess
-            similarities = cosine_similarity(best_vec, available_vectors)[0]
             # Prendre le meilleur (ou top 2 pour un peu de variété)
-            top_2_indices = np.argsort(similarities)[::-1][:2]
-            best_idx = top_2_indices[0] if len(top_2_indices) == 1 else np.random.choice(top_2_indices)
-            return available_vocab[best_idx]
+            return self._pick_near(best_vec, 2, used_mask)
         
         # STRATÉGIE 2 : Score élevé (>70%) - Recherche ciblée
         if best_score > 0.7:
             # Chercher les mots proches, mais avec un peu plus de variété
-            similarities = cosine_similarity(best_vec, available_vectors)[0]
             # Prendre parmi les top 5
-            top_5_indices = np.argsort(similarities)[::-1][:5]
-            best_idx = np.random.choice(top_5_indices)
-            return available_vocab[best_idx]
+            return self._pick_near(best_vec, 5, used_mask)
         
         # STRATÉGIE 3 : Score moyen (>40%) - Triangulation sémantique
         if best_score > 0.4 and len(history) >= 2:
@@ -111,14 +123,12 @@ class AISolver:
                 score1 = top_2_guesses[0].get('score', 0) / 100
                 score2 = top_2_guesses[1].get('score', 0) / 100
                 
-                doc1 = nlp(word1)
-                doc2 = nlp(word2)
+                vec1 = self._word_vector(word1)
+                vec2 = self._word_vector(word2)
                 
-                if doc1.has_vector and doc2.has_vector:
+                if vec1 is not None and vec2 is not None:
                     # Calculer un vecteur interpolé entre les deux meilleurs guesses
                     # Plus le score est élevé, plus on lui donne de poids
-                    vec1 = doc1.vector
-                    vec2 = doc2.vector
                     
                     # Poids basés sur les scores (favoriser le meilleur)
                     weight1 = score1 ** 1.5
@@ -126,13 +136,9 @@ class AISolver:
                     total_weight = weight1 + weight2
                     
                     if total_weight > 0:
-                        interpolated_vec = ((vec1 * weight1 + vec2 * weight2) / total_weight).reshape(1, -1)
-                        similarities = cosine_similarity(interpolated_vec, available_vectors)[0]
-                        
+                        interpolated_vec = (vec1 * weight1 + vec2 * weight2) / total_weight
                         # Prendre parmi les top 10
-                        top_10_indices = np.argsort(similarities)[::-1][:10]
-                        best_idx = np.random.choice(top_10_indices)
-                        return available_vocab[best_idx]
+                        return self._pick_near(interpolated_vec, 10, used_mask)
         
         # STRATÉGIE 4 : Score faible ou peu d'historique - Vecteur moyen pondéré
         if len(history) >= 2:
@@ -143,37 +149,34 @@ class AISolver:
             for guess_data in history:
                 word = guess_data.get('guess', '')
                 score = guess_data.get('score', 0) / 100
-                word_doc = nlp(word)
+                word_vec = self._word_vector(word)
                 
-                if word_doc.has_vector:
+                if word_vec is not None:
                     # Poids exponentiel : les bons scores comptent beaucoup plus
                     weight = (score ** 2) if score > 0.3 else (score * 0.5)
                     if direction_vector is None:
-                        direction_vector = word_doc.vector * weight
+                        direction_vector = word_vec * weight
                     else:
-                        direction_vector += word_doc.vector * weight
+                        direction_vector += word_vec * weight
                     total_weight += weight
             
             if direction_vector is not None and total_weight > 0:
-                direction_vector = (direction_vector / total_weight).reshape(1, -1)
-                similarities = cosine_similarity(direction_vector, available_vectors)[0]
-                
+                direction_vector = direction_vector / total_weight
                 # Prendre parmi les top 15
-                top_15_indices = np.argsort(similarities)[::-1][:15]
-                best_idx = np.random.choice(top_15_indices)
-                return available_vocab[best_idx]
+                return self._pick_near(direction_vector, 15, used_mask)
         
         # STRATÉGIE 5 : Fallback - Chercher proche du meilleur guess
-        similarities = cosine_similarity(best_vec, available_vectors)[0]
         # Prendre parmi les top 20
-        top_20_indices = np.argsort(similarities)[::-1][:20]
-        best_idx = np.random.choice(top_20_indices)
-        return available_vocab[best_idx]
+        return self._pick_near(best_vec, 20, used_mask)
     
-    def solve_game(self, game_manager, game_id: str, max_iterations: int = 6) -> Dict:
+    def solve_game(self, game_manager, game_id: str, max_iterations: int = 6, seed: Optional[int] = None) -> Dict:
         """
         Résout automatiquement une partie de Cemantix
         
+        Args:
+            max_iterations: Nombre maximal de tentatives
+            seed: Graine des tirages aléatoires (None : on garde le générateur courant)
+        
         Returns:
             Dict avec le résultat : {'success': bool, 'guesses': List, 'target': str}
         """
@@ -187,6 +190,8 @@ class AISolver:
         
         # Réinitialiser les mots utilisés
         self.used_words = set()
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
         
         guesses_made = []
         
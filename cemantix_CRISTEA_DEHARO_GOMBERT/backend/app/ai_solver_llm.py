@@ -12,6 +12,7 @@ Options local :
 from typing import List, Dict, Optional
 import os
 import json
+import numpy as np
 
 # Option 1 : Utiliser OpenAI API (cloud, payant)
 try:
@@ -49,17 +50,26 @@ except ImportError:
 class LLMSolver:
     """IA qui résout le Cemantix en utilisant un LLM pour raisonner"""
     
-    def __init__(self, vocab: List[str], vocab_vectors=None, model_type: str = "ollama"):
+    def __init__(self, vocab: List[str], vocab_vectors=None, model_type: str = "ollama", index=None,
+                 word_to_index: Optional[Dict[str, int]] = None):
         """
         Args:
             vocab: Liste des mots du vocabulaire
             vocab_vectors: Vecteurs du vocabulaire (optionnel, pour fallback)
+            index: Index des plus proches voisins sur vocab_vectors (optionnel, construit à la demande)
+            word_to_index: Table mot -> ligne du vocabulaire (optionnel, partagée avec le GameManager)
             model_type: 
                 Local (pas de clé API): "ollama" (par défaut), "huggingface"
                 Cloud (nécessite clé API): "hf_inference", "gemini", "openai"
         """
         self.vocab = vocab
         self.vocab_vectors = vocab_vectors
+        self.index = index
+        if word_to_index is None:
+            word_to_index = {}
+            for i, word in enumerate(vocab):
+                word_to_index.setdefault(word, i)
+        self.word_to_index = word_to_index
         self.used_words = set()
         self.model_type = model_type
         
@@ -323,24 +333,48 @@ Réponds UNIQUEMENT avec le mot que tu proposes, sans explication ni ponctuation
         
         return prompt
     
+    def _used_mask(self) -> np.ndarray:
+        """Masque des mots déjà utilisés (exclus des recherches)"""
+        mask = np.zeros(len(self.vocab), dtype=bool)
+        for word in self.used_words:
+            idx = self.word_to_index.get(word)
+            if idx is not None:
+                mask[idx] = True
+        return mask
+    
+    def _first_available(self, exclude: np.ndarray) -> Optional[str]:
+        """Premier mot du vocabulaire qui n'a pas encore été utilisé"""
+        if exclude.all():
+            return None
+        return self.vocab[int(np.argmin(exclude))]
+    
+    def _lookup_available(self, word: str, exclude: np.ndarray) -> Optional[str]:
+        """Mot du vocabulaire (avec sa casse) correspondant à la réponse du LLM, s'il est disponible"""
+        for candidate in (word, word.lower(), word.capitalize()):
+            idx = self.word_to_index.get(candidate)
+            if idx is not None and not exclude[idx]:
+                return self.vocab[idx]
+        return None
+    
     def find_best_guess(self, history: List[Dict]) -> Optional[str]:
         """Trouve le meilleur mot en utilisant le LLM avec validation anti-régression"""
-        available_vocab = [w for w in self.vocab if w not in self.used_words]
-        
-        if not available_vocab:
+        # Mots disponibles : masque des mots utilisés sur les lignes du vocabulaire
+        exclude = self._used_mask()
+        if len(self.vocab) - int(exclude.sum()) == 0:
             return None
         
         # Si pas d'historique, choisir un mot commun
         if not history:
-            return available_vocab[0] if available_vocab else None
+            return self._first_available(exclude)
         
         # Obtenir le meilleur score actuel pour validation
         best_guess_data = max(history, key=lambda h: h.get('score', 0))
         best_score = best_guess_data.get('score', 0)
         best_word = best_guess_data.get('guess', '')
         
-        # Construire le prompt
-        prompt = self._build_prompt(history, available_vocab)
+        # Construire le prompt (seuls les 50 premiers mots disponibles y figurent)
+        available_words = [self.vocab[i] for i in np.flatnonzero(~exclude)[:50]]
+        prompt = self._build_prompt(history, available_words)
         
         try:
             # Appeler le LLM
@@ -349,104 +383,96 @@ Réponds UNIQUEMENT avec le mot que tu proposes, sans explication ni ponctuation
             # Nettoyer la réponse (enlever guillemets, espaces, etc.)
             guess = response.strip().strip('"').strip("'").strip()
             
-            # Vérifier que le mot est dans le vocabulaire disponible
-            if guess.lower() in [w.lower() for w in available_vocab]:
-                # Trouver la version exacte (avec la bonne casse)
-                for word in available_vocab:
-                    if word.lower() == guess.lower():
-                        # VALIDATION : Vérifier que le mot proposé est sémantiquement proche du meilleur mot
-                        # pour éviter les régressions
-                        validated_word = self._validate_guess(word, best_word, best_score, available_vocab)
-                        return validated_word
+            # Vérifier que le mot est dans le vocabulaire disponible (avec la bonne casse)
+            word = self._lookup_available(guess, exclude)
+            if word is not None:
+                # VALIDATION : Vérifier que le mot proposé est sémantiquement proche du meilleur mot
+                # pour éviter les régressions
+                validated_word = self._validate_guess(word, best_word, best_score, exclude)
+                return validated_word
             
             # Si le LLM a proposé un mot hors vocabulaire, utiliser le fallback heuristique
-            return self._heuristic_fallback(best_word, best_score, available_vocab)
+            return self._heuristic_fallback(best_word, best_score, exclude)
             
         except Exception as e:
             print(f"Erreur lors de l'appel LLM: {e}")
             # Fallback : utiliser l'heuristique
-            return self._heuristic_fallback(best_word, best_score, available_vocab)
+            return self._heuristic_fallback(best_word, best_score, exclude)
     
-    def _validate_guess(self, proposed_word: str, best_word: str, best_score: float, available_vocab: List[str]) -> str:
+    def _word_vector(self, word: str):
+        """Vecteur normalisé d'un mot (spaCy seulement hors vocabulaire, None si inconnu)"""
+        if word in self.word_to_index:
+            return self._get_index().vector(self.word_to_index[word])
+        from .game import get_nlp
+        
+        doc = get_nlp()(word)
+        if not doc.has_vector or doc.vector_norm == 0:
+            return None
+        return doc.vector / doc.vector_norm
+    
+    def _similarity(self, word1: str, word2: str) -> Optional[float]:
+        """Similarité cosinus entre deux mots (None si l'un n'a pas de vecteur)"""
+        vec1 = self._word_vector(word1)
+        vec2 = self._word_vector(word2)
+        if vec1 is None or vec2 is None:
+            return None
+        return float(np.dot(vec1, vec2))
+    
+    def _validate_guess(self, proposed_word: str, best_word: str, best_score: float, exclude: np.ndarray) -> str:
         """Valide que le mot proposé n'est pas une régression évidente"""
-        from .game import nlp
-        from sklearn.metrics.pairwise import cosine_similarity
-        import numpy as np
-        
         # Si le score est déjà très élevé (>90%), on veut être sûr que le nouveau mot est proche
         if best_score > 90:
             # Vérifier la similarité sémantique entre le mot proposé et le meilleur mot
-            best_doc = nlp(best_word)
-            proposed_doc = nlp(proposed_word)
+            similarity = self._similarity(best_word, proposed_word)
             
-            if best_doc.has_vector and proposed_doc.has_vector:
-                similarity = float(best_doc.similarity(proposed_doc))
+            if similarity is not None:
                 # Si la similarité est très faible (<0.5), c'est probablement une régression
                 if similarity < 0.5:
                     # Utiliser le fallback heuristique à la place
-                    return self._heuristic_fallback(best_word, best_score, available_vocab)
+                    return self._heuristic_fallback(best_word, best_score, exclude)
         
         # Si le score est moyen-élevé (70-90%), on accepte mais on vérifie quand même
         elif best_score > 70:
-            best_doc = nlp(best_word)
-            proposed_doc = nlp(proposed_word)
+            similarity = self._similarity(best_word, proposed_word)
             
-            if best_doc.has_vector and proposed_doc.has_vector:
-                similarity = float(best_doc.similarity(proposed_doc))
+            if similarity is not None:
                 # Si la similarité est très faible (<0.3), utiliser le fallback
                 if similarity < 0.3:
-                    return self._heuristic_fallback(best_word, best_score, available_vocab)
+                    return self._heuristic_fallback(best_word, best_score, exclude)
         
         # Sinon, accepter le mot proposé
         return proposed_word
     
-    def _heuristic_fallback(self, best_word: str, best_score: float, available_vocab: List[str]) -> Optional[str]:
-        """Fallback heuristique pour trouver un mot proche du meilleur mot"""
-        from .game import nlp
-        from sklearn.metrics.pairwise import cosine_similarity
-        import numpy as np
-        
-        if not available_vocab:
+    def _get_index(self):
+        """Index des plus proches voisins du vocabulaire (construit au premier appel)"""
+        if self.index is None:
+            from .neighbors import build_index
+            
+            vectors = self.vocab_vectors
+            if vectors is None:
+                from .game import get_nlp
+                vectors = np.array([doc.vector for doc in get_nlp().pipe(self.vocab)], dtype=np.float32)
+            self.index = build_index(vectors)
+        return self.index
+    
+    def _heuristic_fallback(self, best_word: str, best_score: float, exclude: np.ndarray) -> Optional[str]:
+        """Fallback heuristique pour trouver un mot proche du meilleur mot (hors mots exclus)"""
+        if exclude.all():
             return None
         
-        best_doc = nlp(best_word)
-        if not best_doc.has_vector:
-            return available_vocab[0]
+        index = self._get_index()
         
         # Trouver les mots les plus proches sémantiquement du meilleur mot
-        best_vec = best_doc.vector.reshape(1, -1)
-        
-        # Obtenir les vecteurs des mots disponibles
-        available_docs = [nlp(w) for w in available_vocab]
-        available_vectors = np.array([doc.vector for doc in available_docs if doc.has_vector])
-        available_words_filtered = [w for w, doc in zip(available_vocab, available_docs) if doc.has_vector]
-        
-        if len(available_vectors) == 0:
-            return available_vocab[0]
-        
-        # Calculer les similarités
-        similarities = cosine_similarity(best_vec, available_vectors)[0]
-        
-        # Selon le score actuel, choisir une stratégie
-        if best_score > 90:
-            # Score très élevé : prendre le mot le plus proche
-            best_idx = np.argmax(similarities)
-            return available_words_filtered[best_idx]
-        elif best_score > 70:
-            # Score élevé : prendre parmi les top 3
-            top_3_indices = np.argsort(similarities)[::-1][:3]
-            best_idx = top_3_indices[0]
-            return available_words_filtered[best_idx]
-        elif best_score > 50:
-            # Score moyen : prendre parmi les top 5
-            top_5_indices = np.argsort(similarities)[::-1][:5]
-            best_idx = top_5_indices[0]
-            return available_words_filtered[best_idx]
-        else:
-            # Score faible : prendre parmi les top 10
-            top_10_indices = np.argsort(similarities)[::-1][:10]
-            best_idx = top_10_indices[0]
-            return available_words_filtered[best_idx]
+        best_vec = self._word_vector(best_word)
+        if best_vec is None:
+            return self._first_available(exclude)
+        
+        # Quel que soit le score actuel (top 3, 5 ou 10 selon le cas),
+        # c'est le mot le plus proche qui est retenu
+        top_indices, _ = index.search(best_vec, 1, exclude=exclude)
+        if len(top_indices) == 0:
+            return self._first_available(exclude)
+        return self.vocab[top_indices[0]]
     
     def solve_game(self, game_manager, game_id: str, max_iterations: int = 6) -> Dict:
         """Résout automatiquement une partie en utilisant le LLM"""
@@ -2,23 +2,37 @@ from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 import random
 import numpy as np
-import spacy
-from sklearn.metrics.pairwise import cosine_similarity
-
-# Chargement du modèle de langue (contient les vecteurs sémantiques)
-# On essaie d'abord le modèle large (plus précis), puis on fallback sur medium
-print("Chargement du modèle spaCy...")
-nlp = None
-try:
-    nlp = spacy.load("fr_core_news_lg")
-    print("✓ Modèle 'fr_core_news_lg' chargé (vecteurs 300D, plus précis)")
-except OSError:
-    try:
-        nlp = spacy.load("fr_core_news_md")
-        print("⚠ Modèle 'fr_core_news_md' chargé (vecteurs 300D, moins précis)")
-        print("  Pour de meilleurs résultats, installez 'fr_core_news_lg': python -m spacy download fr_core_news_lg")
-    except OSError:
-        raise RuntimeError("Aucun modèle spaCy trouvé. Lancez: python -m spacy download fr_core_news_lg (recommandé) ou fr_core_news_md")
+
+from .neighbors import ExactIndex, build_index
+from .vector_store import VectorStore
+
+# Modèle de langue (contient les vecteurs sémantiques), chargé à la première utilisation :
+# avec un store de vecteurs (app/vector_store.py), il ne sert qu'aux mots hors vocabulaire
+_nlp = None
+
+
+def get_nlp():
+    """
+    Charge le modèle spaCy (une seule fois par processus)
+
+    On essaie d'abord le modèle large (plus précis), puis on fallback sur medium
+    """
+    global _nlp
+    if _nlp is None:
+        import spacy
+
+        print("Chargement du modèle spaCy...")
+        try:
+            _nlp = spacy.load("fr_core_news_lg")
+            print("✓ Modèle 'fr_core_news_lg' chargé (vecteurs 300D, plus précis)")
+        except OSError:
+            try:
+                _nlp = spacy.load("fr_core_news_md")
+                print("⚠ Modèle 'fr_core_news_md' chargé (vecteurs 300D, moins précis)")
+                print("  Pour de meilleurs résultats, installez 'fr_core_news_lg': python -m spacy download fr_core_news_lg")
+            except OSError:
+                raise RuntimeError("Aucun modèle spaCy trouvé. Lancez: python -m spacy download fr_core_news_lg (recommandé) ou fr_core_news_md")
+    return _nlp
 
 class Game:
     def __init__(self, target: str, max_attempts: int = 6):
@@ -30,12 +44,33 @@ class Game:
         self.finished: bool = False
         self.won: bool = False
         self.target_revealed: bool = False  # Indique si le mot cible a été révélé manuellement
+        # Similarités (cosinus) de chaque mot du vocabulaire avec la cible, et leur version triée
+        self.similarities: Optional[np.ndarray] = None
+        self.sorted_similarities: Optional[np.ndarray] = None
 
 class GameManager:
-    def __init__(self, vocab: List[str]):
+    def __init__(self, vocab: List[str], index_kind: str = "exact", vector_store: Optional[str] = None):
         self.vocab = vocab
         self.games: Dict[str, Game] = {}
         
+        # Vecteurs déjà exportés (python -m app.vector_store) : ouverts en mémoire partagée
+        store = VectorStore.load(vector_store, vocab=vocab) if vector_store else None
+        if store is not None:
+            self.vocab = store.words
+            self.vocab_vectors = store.vectors
+            print(f"Vocabulaire chargé depuis {vector_store} : {len(self.vocab)} mots ({store.meta.get('dtype')}).")
+        else:
+            self._vectorize_vocab()
+        
+        # Index mot -> ligne de la matrice (premier indice si le mot est en double)
+        self.word_to_index: Dict[str, int] = {}
+        for i, word in enumerate(self.vocab):
+            self.word_to_index.setdefault(word, i)
+        # Index des plus proches voisins, partagé par les solveurs ("exact" ou "ivf")
+        self.index: ExactIndex = build_index(self.vocab_vectors, kind=index_kind, normalized=True)
+
+    def _vectorize_vocab(self):
+        """Vectorise le vocabulaire avec spaCy (sans store de vecteurs)"""
         # 1. Prétraitement : On ne garde que les mots connus du modèle spaCy
         # pour éviter les erreurs ou les vecteurs vides (zéro)
         self.valid_vocab = []
@@ -43,38 +78,115 @@ class GameManager:
         
         print("Indexation du vocabulaire...")
         # nlp.pipe est plus rapide pour traiter une liste
-        for doc in nlp.pipe(self.vocab):
+        for doc in get_nlp().pipe(self.vocab):
             # On ne garde que si le mot a un vecteur valide
             if doc.has_vector and doc.vector_norm > 0:
                 self.valid_vocab.append(doc.text)
                 vectors_list.append(doc.vector)
         
         self.vocab = self.valid_vocab
-        # Matrice numpy contenant tous les vecteurs du vocabulaire
-        self.vocab_vectors = np.array(vectors_list)
+        # Matrice numpy contenant tous les vecteurs du vocabulaire, normalisés une fois
+        # pour toutes : la similarité cosinus devient un simple produit scalaire
+        vocab_vectors = np.array(vectors_list, dtype=np.float32)
+        vocab_vectors /= np.linalg.norm(vocab_vectors, axis=1, keepdims=True)
+        self.vocab_vectors = vocab_vectors
         print(f"Vocabulaire chargé : {len(self.vocab)} mots vectorisés.")
 
+    def _word_vector(self, word: str) -> Optional[np.ndarray]:
+        """Vecteur normalisé d'un mot (None si le modèle ne le connaît pas)"""
+        idx = self.word_to_index.get(word)
+        if idx is not None:
+            return self.index.vector(idx)
+        doc = get_nlp()(word)
+        if not doc.has_vector or doc.vector_norm == 0:
+            return None
+        return (doc.vector / doc.vector_norm).astype(np.float32)
+
+    def _get_similarities(self, game: Game) -> Tuple[np.ndarray, np.ndarray]:
+        """Similarités du vocabulaire avec la cible de la partie (calculées une seule fois)"""
+        if getattr(game, 'similarities', None) is None:
+            target_vec = self._word_vector(game.target)
+            game.similarities = self.index.similarities(target_vec)
+            game.sorted_similarities = np.sort(game.similarities)
+        return game.similarities, game.sorted_similarities
+
+    def _rank(self, sorted_sims: np.ndarray, score: float) -> int:
+        """Rang d'un score : nombre de mots du vocabulaire avec un score strictement supérieur, + 1"""
+        not_above = int(np.searchsorted(sorted_sims, score + 1e-10, side='right'))
+        return len(sorted_sims) - not_above + 1
+
     def start_game(self, target: Optional[str] = None, max_attempts: int = 6) -> Game:
         if target is None:
             target = random.choice(self.vocab)
         # Si la cible demandée n'est pas dans notre vocabulaire vectorisé, on fallback
-        if target not in self.vocab:
+        if target not in self.word_to_index:
              # On essaye de trouver le mot s'il existe quand même dans spacy
-             if not nlp(target).has_vector:
+             if self._word_vector(target) is None:
                  raise ValueError(f"Le mot cible '{target}' n'est pas connu du modèle sémantique.")
         
         g = Game(target=target, max_attempts=max_attempts)
+        # Classement de tout le vocabulaire par rapport à la cible, une fois par partie
+        self._get_similarities(g)
         self.games[g.id] = g
         return g
 
-    def score_guess(self, game_id: str, guess: str) -> Dict:
+    def _score_words(self, game: Game, words: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores (0-1) et rangs de plusieurs mots par rapport à la cible, en une opération matricielle
+
+        Le rang d'un mot est le nombre de mots du vocabulaire avec un score STRICTEMENT
+        supérieur, + 1 (dernier rang pour un mot sans vecteur).
+        """
+        # Les similarités de tout le vocabulaire avec la cible sont calculées
+        # une seule fois, au démarrage de la partie (start_game)
+        sims, sorted_sims = self._get_similarities(game)
+
+        scores = np.zeros(len(words), dtype=np.float64)
+        has_vector = np.zeros(len(words), dtype=bool)
+
+        # Mots du vocabulaire : score exact du tableau, cohérent avec le rang
+        rows = [self.word_to_index.get(word) for word in words]
+        in_vocab = np.array([row is not None for row in rows], dtype=bool)
+        if in_vocab.any():
+            scores[in_vocab] = sims[[row for row in rows if row is not None]]
+            has_vector[in_vocab] = True
+
+        # Autres mots : vecteurs spaCy (None si mot inconnu / faute de frappe),
+        # comparés à la cible en un seul produit matriciel
+        oov_positions = []
+        oov_vectors = []
+        for i in np.flatnonzero(~in_vocab):
+            vec = self._word_vector(words[i])
+            if vec is not None:
+                oov_positions.append(i)
+                oov_vectors.append(vec)
+        if oov_vectors:
+            target_vec = self._word_vector(game.target)
+            # S'assurer que le score est dans [0, 1]
+            scores[oov_positions] = np.clip(np.array(oov_vectors, dtype=np.float32) @ target_vec, 0.0, 1.0)
+            has_vector[oov_positions] = True
+
+        # Rangs (petite tolérance pour éviter les problèmes de précision) :
+        # les similarités étant triées, c'est une recherche dichotomique par mot
+        not_above = np.searchsorted(sorted_sims, scores + 1e-10, side='right')
+        ranks = len(sorted_sims) - not_above + 1
+        ranks[~has_vector] = len(self.vocab) + 1  # Dernier rang si pas de vecteur
+
+        # Note importante : Le score et le rang sont calculés de manière cohérente.
+        # Si un mot est au rang 25 avec 20%, cela signifie qu'il y a 24 mots dans le vocabulaire
+        # avec un score supérieur à 20%. Cela peut sembler contre-intuitif, mais c'est mathématiquement correct.
+        # La similarité sémantique entre mots peut être faible même pour des mots "proches" conceptuellement.
+        return scores, ranks
+
+    def _check_playable(self, game_id: str) -> Tuple[Game, Optional[Dict]]:
+        """Récupère une partie avant de jouer (avec la réponse d'erreur si elle est gagnée)"""
         if game_id not in self.games:
             raise KeyError("Partie introuvable")
         game = self.games[game_id]
         
         # Si la partie est gagnée, on ne peut plus jouer
         if game.finished and game.won:
-            return {"error": "Partie terminée (gagnée)", "finished": True, "won": game.won, "target": game.target}
+            return game, {"error": "Partie terminée (gagnée)", "finished": True, "won": game.won, "target": game.target}
         
         # Initialiser target_revealed si la partie a été créée avant cette fonctionnalité
         if not hasattr(game, 'target_revealed'):
@@ -84,80 +196,15 @@ class GameManager:
         # SAUF si le mot a été révélé (partie définitivement terminée)
         if game.finished and not game.won and not game.target_revealed:
             game.finished = False  # Réactiver la partie
+        return game, None
 
+    def _record_guess(self, game: Game, guess_norm: str, score: float, rank: int):
+        """Enregistre une tentative déjà scorée et met à jour l'état du jeu"""
         game.attempts += 1
-        guess_norm = guess.strip()
-        
-        # --- Calcul UNIFIÉ du Score et du Rang ---
-        # On calcule TOUJOURS avec le vocabulaire pour garantir la cohérence
-        target_doc = nlp(game.target)
-        guess_doc = nlp(guess_norm)
-
-        # Si le mot n'a pas de vecteur (mot inconnu / faute de frappe)
-        if not guess_doc.has_vector or guess_doc.vector_norm == 0:
-            score = 0.0
-            rank = len(self.vocab) + 1  # Dernier rang si pas de vecteur
-        else:
-            # Normaliser le vecteur cible pour un calcul cohérent
-            target_vec_raw = target_doc.vector
-            target_norm = np.linalg.norm(target_vec_raw)
-            if target_norm > 0:
-                target_vec_normalized = target_vec_raw / target_norm
-            else:
-                target_vec_normalized = target_vec_raw
-            
-            target_vec = target_vec_normalized.reshape(1, -1)
-            
-            # Normaliser les vecteurs du vocabulaire pour un calcul cohérent
-            vocab_norms = np.linalg.norm(self.vocab_vectors, axis=1, keepdims=True)
-            vocab_norms = np.where(vocab_norms == 0, 1, vocab_norms)
-            vocab_vectors_normalized = self.vocab_vectors / vocab_norms
-            
-            # Calculer la similarité cosinus entre la cible et TOUS les mots du vocabulaire
-            # Cela garantit que le score et le rang sont calculés de la même manière
-            sims = cosine_similarity(target_vec, vocab_vectors_normalized)[0]
-            
-            # Calculer le score du mot deviné avec la MÊME méthode que pour le vocabulaire
-            # pour garantir la cohérence absolue entre score et rang
-            guess_vec_raw = guess_doc.vector
-            guess_norm_val = np.linalg.norm(guess_vec_raw)
-            if guess_norm_val > 0:
-                guess_vec_normalized = guess_vec_raw / guess_norm_val
-            else:
-                guess_vec_normalized = guess_vec_raw
-            
-            guess_vec = guess_vec_normalized.reshape(1, -1)
-            # Calculer la similarité avec le vecteur cible normalisé (même méthode que pour vocab)
-            score = float(cosine_similarity(target_vec, guess_vec)[0][0])
-            
-            # S'assurer que le score est dans [0, 1]
-            score = max(0.0, min(1.0, score))
-            
-            # Si le mot est dans le vocabulaire, utiliser son score exact du tableau pour cohérence
-            if guess_norm in self.vocab:
-                idx = self.vocab.index(guess_norm)
-                score_from_vocab = float(sims[idx])
-                # Utiliser le score du vocabulaire pour garantir la cohérence exacte avec le rang
-                score = score_from_vocab
-            
-            # Calculer le rang : combien de mots du vocabulaire ont un score supérieur ?
-            # On utilise une comparaison avec une petite tolérance pour éviter les problèmes de précision
-            # Le rang est calculé en comptant combien de mots du vocabulaire ont un score STRICTEMENT supérieur
-            # puis on ajoute 1 (car le rang commence à 1, pas 0)
-            rank = int(np.sum(sims > (score + 1e-10))) + 1
-            
-            # Note importante : Le score et le rang sont maintenant calculés de manière cohérente.
-            # Si un mot est au rang 25 avec 20%, cela signifie qu'il y a 24 mots dans le vocabulaire
-            # avec un score supérieur à 20%. Cela peut sembler contre-intuitif, mais c'est mathématiquement correct.
-            # La similarité sémantique entre mots peut être faible même pour des mots "proches" conceptuellement.
-
-        # Mise à jour état du jeu
         game.guesses.append((guess_norm, score, rank))
 
         # Condition de victoire (Score très proche de 1 ou mot identique)
         if guess_norm.lower() == game.target.lower():
-            score = 1.0 # Force 1.0
-            rank = 1
             game.finished = True
             game.won = True
         elif game.attempts >= game.max_attempts:
@@ -167,10 +214,8 @@ class GameManager:
                 game.finished = True
                 game.won = False
 
-        # Récupérer les mots les plus proches pour info (optionnel, aide au debug)
-        # top_k_idx = sims.argsort()[::-1][:10]
-        # top_k = [{"word": self.vocab[i], "sim": float(sims[i])} for i in top_k_idx]
-
+    def _game_state(self, game: Game) -> Dict:
+        """État de la partie renvoyé après une tentative"""
         # Initialiser target_revealed si la partie a été créée avant cette fonctionnalité
         if not hasattr(game, 'target_revealed'):
             game.target_revealed = False
@@ -179,10 +224,6 @@ class GameManager:
         should_reveal_target = (game.finished and game.won) or (hasattr(game, 'target_revealed') and game.target_revealed)
         
         return {
-            "game_id": game.id,
-            "guess": guess_norm,
-            "score": round(score * 100, 2), # En pourcentage souvent plus lisible (0-100)
-            "rank": rank,
             "attempts": game.attempts,
             "remaining": max(0, game.max_attempts - game.attempts),
             "finished": game.finished,
@@ -192,5 +233,68 @@ class GameManager:
             "history": [{"guess": g, "score": round(s * 100, 2), "rank": r} for g, s, r in game.guesses],
         }
 
+    def score_guess(self, game_id: str, guess: str) -> Dict:
+        game, error = self._check_playable(game_id)
+        if error is not None:
+            return error
+
+        guess_norm = guess.strip()
+        
+        # --- Calcul UNIFIÉ du Score et du Rang ---
+        scores, ranks = self._score_words(game, [guess_norm])
+        score = float(scores[0])
+        rank = int(ranks[0])
+
+        # Mise à jour état du jeu
+        self._record_guess(game, guess_norm, score, rank)
+        if game.won:
+            score = 1.0 # Force 1.0
+            rank = 1
+
+        # Récupérer les mots les plus proches pour info (optionnel, aide au debug)
+        # sims, _ = self._get_similarities(game)
+        # top_k_idx = sims.argsort()[::-1][:10]
+        # top_k = [{"word": self.vocab[i], "sim": float(sims[i])} for i in top_k_idx]
+
+        return {
+            "game_id": game.id,
+            "guess": guess_norm,
+            "score": round(score * 100, 2), # En pourcentage souvent plus lisible (0-100)
+            "rank": rank,
+            **self._game_state(game),
+        }
+
+    def score_guesses(self, game_id: str, guesses: List[str]) -> Dict:
+        """
+        Joue plusieurs tentatives d'un coup : scores et rangs sont calculés
+        en une seule opération matricielle.
+
+        Les mots sont joués dans l'ordre, comme avec score_guess, jusqu'à la
+        victoire ou la fin des tentatives ; les mots suivants ne sont pas joués.
+        """
+        game, error = self._check_playable(game_id)
+        if error is not None:
+            return error
+
+        words = [guess.strip() for guess in guesses]
+        scores, ranks = self._score_words(game, words)
+
+        results = []
+        for guess_norm, score, rank in zip(words, scores.tolist(), ranks.tolist()):
+            if game.finished:
+                break
+            self._record_guess(game, guess_norm, score, rank)
+            if game.won:
+                score = 1.0
+                rank = 1
+            results.append({"guess": guess_norm, "score": round(score * 100, 2), "rank": rank})
+
+        return {
+            "game_id": game.id,
+            "results": results,
+            "played": len(results),
+            **self._game_state(game),
+        }
+
     def get_vocab(self, limit: int = 200) -> List[str]:
         return self.vocab[:limit]
\ No newline at end of file
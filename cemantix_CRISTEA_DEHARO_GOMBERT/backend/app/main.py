@@ -2,7 +2,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 import os
 import json
 import asyncio
@@ -20,7 +20,15 @@ if not VOCAB_FILE.exists():
 with VOCAB_FILE.open(encoding="utf-8") as f:
     vocab = [line.strip() for line in f if line.strip()]
 
-game_manager = GameManager(vocab=vocab)
+# Vecteurs exportés par `python -m app.vector_store` (sinon le vocabulaire est vectorisé avec spaCy au démarrage)
+VECTOR_STORE = os.getenv("VECTOR_STORE", str(BASE_DIR / "vectors"))
+
+# Index des plus proches voisins des solveurs : "exact" (par défaut) ou "ivf" (approximatif, grands vocabulaires)
+game_manager = GameManager(
+    vocab=vocab,
+    index_kind=os.getenv("NN_INDEX", "exact"),
+    vector_store=VECTOR_STORE
+)
 
 app = FastAPI(title="Cemantix léger (FR)")
 
@@ -42,6 +50,10 @@ class GuessPayload(BaseModel):
     game_id: str
     guess: str
 
+class BatchGuessPayload(BaseModel):
+    game_id: str
+    guesses: List[str]
+
 class AddAttemptsPayload(BaseModel):
     game_id: str
     additional_attempts: int
@@ -101,6 +113,16 @@ def make_guess(p: GuessPayload):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/guess/batch")
+def make_guesses(p: BatchGuessPayload):
+    """Joue plusieurs mots d'un coup (dans l'ordre, jusqu'à la victoire ou la fin des tentatives)"""
+    try:
+        return game_manager.score_guesses(p.game_id, p.guesses)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/add-attempts")
 def add_attempts(p: AddAttemptsPayload):
     """Ajoute des tentatives supplémentaires à une partie terminée (perdue)"""
@@ -221,10 +243,13 @@ async def solve_game_stream(game_manager, game_id: str, use_llm: bool, llm_model
             solver = LLMSolver(
                 game_manager.vocab, 
                 vocab_vectors=game_manager.vocab_vectors,
-                model_type=llm_model
+                model_type=llm_model,
+                index=game_manager.index,
+                word_to_index=game_manager.word_to_index
             )
         else:
-            solver = AISolver(game_manager.vocab, game_manager.vocab_vectors)
+            solver = AISolver(game_manager.vocab, game_manager.vocab_vectors, index=game_manager.index,
+                              word_to_index=game_manager.word_to_index)
         
         solver.used_words = set()
         guesses_made = []
@@ -336,7 +361,9 @@ def ai_suggest(p: AISuggestPayload):
         solver = LLMSolver(
             game_manager.vocab, 
             vocab_vectors=game_manager.vocab_vectors,
-            model_type=llm_model
+            model_type=llm_model,
+            index=game_manager.index,
+            word_to_index=game_manager.word_to_index
         )
         
         # Récupérer l'historique avec les scores et rangs
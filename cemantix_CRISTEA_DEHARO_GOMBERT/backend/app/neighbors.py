@@ -0,0 +1,203 @@
+"""
+Index de plus proches voisins sur les vecteurs du vocabulaire
+
+Les solveurs cherchent à chaque étape les k mots les plus proches (similarité
+cosinus) d'un vecteur de requête, en excluant les mots déjà proposés.
+Deux index sont disponibles :
+- ExactIndex : produit matriciel par blocs + argpartition (résultat exact)
+- IVFIndex : index approximatif à listes inversées (k-means sphérique), qui
+  ne parcourt que les listes des centroïdes les plus proches de la requête
+"""
+from typing import Optional, Tuple
+import numpy as np
+
+# Nombre de lignes de la matrice traitées par produit matriciel
+BLOCK_ROWS = 65536
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Normalise les lignes en float32 (sans copie si elles le sont déjà)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    if np.allclose(norms, 1.0, atol=1e-3):
+        return vectors
+    norms = np.where(norms == 0, 1, norms)
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions des k meilleurs scores, triées par score décroissant"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
+class ExactIndex:
+    """Recherche exacte des plus proches voisins (produit matriciel par blocs)"""
+
+    def __init__(self, vectors: np.ndarray, block_rows: int = BLOCK_ROWS, normalized: bool = False):
+        """
+        Args:
+            vectors: Matrice (n_mots, dim) des vecteurs du vocabulaire
+            block_rows: Nombre de lignes par bloc (limite la mémoire temporaire)
+            normalized: Vecteurs déjà normalisés : la matrice est utilisée telle
+                quelle, sans copie (par ex. float16 en mmap depuis le store de vecteurs)
+        """
+        self.vectors = vectors if normalized else normalize_rows(vectors)
+        self.block_rows = block_rows
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def vector(self, idx: int) -> np.ndarray:
+        """Vecteur normalisé d'une ligne de l'index (float32)"""
+        return np.asarray(self.vectors[idx], dtype=np.float32)
+
+    def similarities(self, query: np.ndarray) -> np.ndarray:
+        """Similarités (float32) de toutes les lignes avec un vecteur, calculées par blocs"""
+        query = normalize_rows(query)
+        sims = np.empty(len(self.vectors), dtype=np.float32)
+        for start in range(0, len(self.vectors), self.block_rows):
+            stop = start + self.block_rows
+            sims[start:stop] = self.vectors[start:stop] @ query
+        return sims
+
+    def search(self, query: np.ndarray, k: int, exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cherche les k mots les plus proches d'un vecteur
+
+        Args:
+            query: Vecteur de requête (pas forcément normalisé)
+            k: Nombre de voisins
+            exclude: Masque booléen (n_mots,) des lignes à ignorer (mots déjà utilisés)
+
+        Returns:
+            (indices, similarités) triés par similarité décroissante ;
+            moins de k résultats si trop de mots sont exclus
+        """
+        query = normalize_rows(query)
+        return self._search_rows(query, k, exclude, None)
+
+    def _search_rows(self, query: np.ndarray, k: int, exclude: Optional[np.ndarray],
+                     rows: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k parmi toutes les lignes, ou seulement parmi `rows`"""
+        n = len(self.vectors) if rows is None else len(rows)
+        best_idx = []
+        best_scores = []
+        for start in range(0, n, self.block_rows):
+            stop = min(start + self.block_rows, n)
+            if rows is None:
+                block_idx = np.arange(start, stop)
+                scores = self.vectors[start:stop] @ query
+            else:
+                block_idx = rows[start:stop]
+                scores = self.vectors[block_idx] @ query
+            if exclude is not None:
+                keep = ~exclude[block_idx]
+                block_idx = block_idx[keep]
+                scores = scores[keep]
+            top = _top_k(scores, k)
+            best_idx.append(block_idx[top])
+            best_scores.append(scores[top])
+
+        if not best_idx:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        indices = np.concatenate(best_idx)
+        scores = np.concatenate(best_scores)
+        top = _top_k(scores, k)
+        return indices[top], scores[top]
+
+
+class IVFIndex(ExactIndex):
+    """
+    Recherche approximative par listes inversées
+
+    Les vecteurs sont répartis en n_lists groupes (k-means sphérique) ; une
+    requête ne compare que les mots des n_probe groupes dont le centroïde est
+    le plus proche. Si ces groupes ne contiennent pas assez de mots non
+    exclus, la recherche exacte prend le relais.
+    """
+
+    def __init__(self, vectors: np.ndarray, n_lists: Optional[int] = None, n_probe: int = 8,
+                 n_iter: int = 10, seed: int = 0, block_rows: int = BLOCK_ROWS, normalized: bool = False):
+        """
+        Args:
+            vectors: Matrice (n_mots, dim) des vecteurs du vocabulaire
+            n_lists: Nombre de groupes (par défaut : racine carrée du nombre de mots)
+            n_probe: Nombre de groupes parcourus par requête
+            n_iter: Itérations de k-means
+            seed: Graine du tirage des centroïdes initiaux
+            block_rows: Nombre de lignes par bloc (limite la mémoire temporaire)
+            normalized: Vecteurs déjà normalisés (utilisés sans copie)
+        """
+        super().__init__(vectors, block_rows=block_rows, normalized=normalized)
+        n = len(self.vectors)
+        if n_lists is None:
+            n_lists = int(np.sqrt(n))
+        n_lists = max(1, min(n_lists, n))
+        self.n_probe = n_probe
+
+        # k-means sphérique sur un échantillon du vocabulaire
+        rng = np.random.default_rng(seed)
+        sample_size = min(n, 256 * n_lists)
+        sample = np.asarray(self.vectors[np.sort(rng.choice(n, sample_size, replace=False))], dtype=np.float32)
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            labels = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            filled = np.bincount(labels, minlength=n_lists) > 0
+            # Les groupes vides gardent leur centroïde
+            centroids[filled] = normalize_rows(sums[filled])
+        self.centroids = centroids
+
+        # Listes inversées : lignes triées par groupe, avec les bornes de chaque groupe
+        labels = self._assign(self.vectors, centroids)
+        self.list_rows = np.argsort(labels, kind="stable")
+        self.list_offsets = np.searchsorted(labels[self.list_rows], np.arange(n_lists + 1))
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Groupe (centroïde le plus proche) de chaque vecteur, par blocs"""
+        labels = np.empty(len(vectors), dtype=np.intp)
+        for start in range(0, len(vectors), self.block_rows):
+            stop = start + self.block_rows
+            block = np.asarray(vectors[start:stop], dtype=np.float32)
+            labels[start:stop] = np.argmax(block @ centroids.T, axis=1)
+        return labels
+
+    def search(self, query: np.ndarray, k: int, exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        query = normalize_rows(query)
+        probes = _top_k(self.centroids @ query, self.n_probe)
+        rows = np.concatenate([
+            self.list_rows[self.list_offsets[c]:self.list_offsets[c + 1]] for c in probes
+        ])
+        indices, scores = self._search_rows(query, k, exclude, rows)
+        if len(indices) < min(k, len(self.vectors)):
+            # Pas assez de candidats dans les groupes parcourus
+            return self._search_rows(query, k, exclude, None)
+        return indices, scores
+
+
+INDEX_TYPES = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+}
+
+
+def build_index(vectors: np.ndarray, kind: str = "exact", **kwargs) -> ExactIndex:
+    """
+    Construit un index de plus proches voisins
+
+    Args:
+        vectors: Matrice (n_mots, dim) des vecteurs du vocabulaire
+        kind: "exact" ou "ivf" (approximatif, pour les grands vocabulaires)
+        **kwargs: Paramètres de l'index (n_lists, n_probe, normalized, ...)
+    """
+    if kind not in INDEX_TYPES:
+        raise ValueError(f"Type d'index inconnu : '{kind}' (disponibles : {', '.join(INDEX_TYPES)})")
+    return INDEX_TYPES[kind](vectors, **kwargs)
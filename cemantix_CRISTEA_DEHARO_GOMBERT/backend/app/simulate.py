@@ -0,0 +1,284 @@
+"""
+Simulateur de parties et benchmark des solveurs Cemantix (hors ligne)
+
+Le solveur joue contre chaque mot cible du vocabulaire (ou un échantillon),
+sans passer par l'API. Les tirages sont reproductibles : la partie n°i utilise
+la graine seed + i, quel que soit le worker qui la joue. Les parties sont
+réparties sur un pool de processus qui partagent la même matrice de vecteurs
+(store en mmap, ou matrice héritée du processus parent par fork).
+
+Rapport : distribution du nombre de tentatives, latence par étape (choix du
+mot par le solveur, score de la tentative) et débit.
+
+Utilisation (depuis le dossier backend) :
+    python -m app.simulate                          # solveur heuristique, sans LLM
+    python -m app.simulate --sample 500 --seed 1 --workers 8 --json resultats.json
+    python -m app.simulate --solver llm --sample 20 --workers 1
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .game import GameManager
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Bornes supérieures des tranches de la distribution du nombre de tentatives
+GUESS_BUCKETS = [1, 2, 3, 5, 10, 20, 50, 100, 200, 500, 1000]
+
+# Ressources du processus (héritées du parent par fork, ou créées par _init_worker)
+_manager: Optional[GameManager] = None
+_solver = None
+
+
+def _make_solver(manager: GameManager, solver_name: str, llm_model: str):
+    """Crée le solveur qui partage le vocabulaire, l'index et la table des mots du GameManager"""
+    if solver_name == "llm":
+        from .ai_solver_llm import LLMSolver
+        return LLMSolver(manager.vocab, vocab_vectors=manager.vocab_vectors,
+                         model_type=llm_model, index=manager.index,
+                         word_to_index=manager.word_to_index)
+    from .ai_solver import AISolver
+    return AISolver(manager.vocab, manager.vocab_vectors, index=manager.index,
+                    word_to_index=manager.word_to_index)
+
+
+def _init_worker(vocab: List[str], index_kind: str, vector_store: Optional[str],
+                 solver_name: str, llm_model: str):
+    """Initialise un processus : GameManager (si pas hérité du parent) et solveur"""
+    global _manager, _solver
+    if _manager is None:
+        _manager = GameManager(vocab, index_kind=index_kind, vector_store=vector_store)
+    _solver = _make_solver(_manager, solver_name, llm_model)
+
+
+def play_game(task: Tuple[str, int, int]) -> Dict:
+    """
+    Joue une partie complète avec le solveur du processus
+
+    Args:
+        task: (mot cible, graine, nombre maximal de tentatives)
+
+    Returns:
+        Résultat de la partie et durées (secondes) de chaque étape
+    """
+    target, seed, max_guesses = task
+    manager, solver = _manager, _solver
+
+    start = time.perf_counter()
+    game = manager.start_game(target=target, max_attempts=max_guesses)
+    setup_time = time.perf_counter() - start
+
+    solver.used_words = set()
+    if hasattr(solver, "rng"):
+        solver.rng = np.random.default_rng(seed)
+
+    think_times = []
+    score_times = []
+    try:
+        while not game.finished:
+            history = [{"guess": g, "score": s * 100, "rank": r} for g, s, r in game.guesses]
+
+            t0 = time.perf_counter()
+            guess = solver.find_best_guess(history)
+            t1 = time.perf_counter()
+            if not guess:
+                break
+            solver.used_words.add(guess)
+            manager.score_guess(game.id, guess)
+            t2 = time.perf_counter()
+
+            think_times.append(t1 - t0)
+            score_times.append(t2 - t1)
+    finally:
+        manager.games.pop(game.id, None)
+
+    return {
+        "target": target,
+        "seed": seed,
+        "won": game.won,
+        "guesses": game.attempts,
+        "setup_time": setup_time,
+        "think_times": think_times,
+        "score_times": score_times,
+    }
+
+
+def run_simulation(vocab: List[str], targets: List[str], seed: int = 0, max_guesses: int = 100,
+                   workers: int = 1, solver_name: str = "heuristic", llm_model: str = "ollama",
+                   index_kind: str = "exact", vector_store: Optional[str] = None) -> Tuple[List[Dict], float]:
+    """
+    Joue une partie par mot cible
+
+    Returns:
+        (résultats des parties dans l'ordre des cibles, durée totale en secondes)
+    """
+    global _manager, _solver
+    # Le GameManager est créé une fois dans le processus principal : avec fork,
+    # les workers héritent de la matrice de vecteurs sans la recopier
+    if _manager is None:
+        _manager = GameManager(vocab, index_kind=index_kind, vector_store=vector_store)
+    tasks = [(target, seed + i, max_guesses) for i, target in enumerate(targets)]
+
+    start = time.perf_counter()
+    if workers <= 1:
+        _solver = _make_solver(_manager, solver_name, llm_model)
+        results = [play_game(task) for task in tasks]
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        chunksize = max(1, len(tasks) // (workers * 8))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(vocab, index_kind, vector_store, solver_name, llm_model),
+        ) as executor:
+            results = list(executor.map(play_game, tasks, chunksize=chunksize))
+    return results, time.perf_counter() - start
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Percentile (rang le plus proche) d'une liste de valeurs"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _latency_stats(times: List[float]) -> Dict:
+    """Statistiques de latence en millisecondes"""
+    ms = [t * 1000 for t in times]
+    return {
+        "count": len(ms),
+        "mean": statistics.fmean(ms) if ms else 0.0,
+        "p50": percentile(ms, 50),
+        "p90": percentile(ms, 90),
+        "p99": percentile(ms, 99),
+        "max": max(ms, default=0.0),
+    }
+
+
+def guess_distribution(results: List[Dict], max_guesses: int) -> Dict[str, int]:
+    """Nombre de parties gagnées par tranche de nombre de tentatives, et parties perdues"""
+    edges = [edge for edge in GUESS_BUCKETS if edge < max_guesses] + [max_guesses]
+    distribution = {}
+    lower = 1
+    for upper in edges:
+        label = str(upper) if lower == upper else f"{lower}-{upper}"
+        distribution[label] = sum(1 for r in results if r["won"] and lower <= r["guesses"] <= upper)
+        lower = upper + 1
+    distribution["non trouvé"] = sum(1 for r in results if not r["won"])
+    return distribution
+
+
+def summarize(results: List[Dict], elapsed: float, max_guesses: int) -> Dict:
+    """Résumé du benchmark (distribution, latences, débit)"""
+    won = [r["guesses"] for r in results if r["won"]]
+    think_times = [t for r in results for t in r["think_times"]]
+    score_times = [t for r in results for t in r["score_times"]]
+    steps = len(think_times)
+    return {
+        "games": len(results),
+        "won": len(won),
+        "win_rate": len(won) / len(results) if results else 0.0,
+        "guesses": {
+            "mean": statistics.fmean(won) if won else 0.0,
+            "median": statistics.median(won) if won else 0.0,
+            "p90": percentile(won, 90),
+            "max": max(won, default=0),
+        },
+        "distribution": guess_distribution(results, max_guesses),
+        "latency_ms": {
+            "start_game": _latency_stats([r["setup_time"] for r in results]),
+            "solver": _latency_stats(think_times),
+            "score": _latency_stats(score_times),
+        },
+        "throughput": {
+            "elapsed_s": elapsed,
+            "games_per_s": len(results) / elapsed if elapsed > 0 else 0.0,
+            "steps_per_s": steps / elapsed if elapsed > 0 else 0.0,
+        },
+    }
+
+
+def print_report(summary: Dict):
+    """Affiche le résumé du benchmark"""
+    print(f"\nParties : {summary['games']} - gagnées : {summary['won']} ({summary['win_rate']:.1%})")
+    g = summary["guesses"]
+    print(f"Tentatives (parties gagnées) : moyenne {g['mean']:.1f}, médiane {g['median']:.0f}, "
+          f"p90 {g['p90']}, max {g['max']}")
+
+    print("\nDistribution du nombre de tentatives :")
+    total = max(1, summary["games"])
+    width = max(len(label) for label in summary["distribution"])
+    for label, count in summary["distribution"].items():
+        bar = "█" * round(40 * count / total)
+        print(f"  {label:>{width}} | {count:6d} {bar}")
+
+    print("\nLatence par étape (ms) :")
+    print(f"  {'étape':<11} {'n':>8} {'moyenne':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for name, stats in summary["latency_ms"].items():
+        print(f"  {name:<11} {stats['count']:>8} {stats['mean']:>9.2f} {stats['p50']:>9.2f} "
+              f"{stats['p90']:>9.2f} {stats['p99']:>9.2f} {stats['max']:>9.2f}")
+
+    t = summary["throughput"]
+    print(f"\nDébit : {t['games_per_s']:.1f} parties/s, {t['steps_per_s']:.1f} tentatives/s "
+          f"({t['elapsed_s']:.1f} s au total)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hors ligne des solveurs Cemantix")
+    parser.add_argument("--vocab", default=str(BASE_DIR / "vocab.txt"), help="Fichier du vocabulaire")
+    parser.add_argument("--vector-store", default=os.getenv("VECTOR_STORE", str(BASE_DIR / "vectors")),
+                        help="Dossier du store de vecteurs (sinon vectorisation spaCy)")
+    parser.add_argument("--index", default=os.getenv("NN_INDEX", "exact"), choices=["exact", "ivf"],
+                        help="Index des plus proches voisins des solveurs")
+    parser.add_argument("--solver", default="heuristic", choices=["heuristic", "llm"],
+                        help="heuristic : AISolver, sans LLM (par défaut) ; llm : LLMSolver")
+    parser.add_argument("--llm-model", default=os.getenv("LLM_MODEL", "ollama"), help="Modèle du LLMSolver")
+    parser.add_argument("--sample", type=int, default=0, help="Nombre de mots cibles tirés au hasard (0 : tout le vocabulaire)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du tirage des cibles et des parties")
+    parser.add_argument("--max-guesses", type=int, default=100, help="Nombre maximal de tentatives par partie")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Nombre de processus")
+    parser.add_argument("--json", help="Fichier où écrire le résumé et le résultat de chaque partie")
+    args = parser.parse_args()
+
+    with open(args.vocab, encoding="utf-8") as f:
+        vocab = [line.strip() for line in f if line.strip()]
+
+    global _manager
+    _manager = GameManager(vocab, index_kind=args.index, vector_store=args.vector_store)
+    targets = list(_manager.vocab)
+    if args.sample and args.sample < len(targets):
+        targets = random.Random(args.seed).sample(targets, args.sample)
+
+    print(f"Simulation : {len(targets)} parties, solveur {args.solver}, index {args.index}, "
+          f"{args.workers} worker(s), seed {args.seed}")
+    results, elapsed = run_simulation(
+        vocab, targets, seed=args.seed, max_guesses=args.max_guesses, workers=args.workers,
+        solver_name=args.solver, llm_model=args.llm_model,
+        index_kind=args.index, vector_store=args.vector_store,
+    )
+    summary = summarize(results, elapsed, args.max_guesses)
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "summary": summary, "games": results}, f, ensure_ascii=False, indent=2)
+        print(f"Résultats écrits dans {args.json}")
+
+
+if __name__ == "__main__":
+    main()
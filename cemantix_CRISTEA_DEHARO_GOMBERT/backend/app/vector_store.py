@@ -0,0 +1,137 @@
+"""
+Stockage persistant des vecteurs du vocabulaire
+
+Les vecteurs spaCy du vocabulaire sont exportés une fois pour toutes (hors
+ligne) dans un dossier :
+- vectors.npy : matrice (n_mots, dim) des vecteurs normalisés (float16 par défaut)
+- words.txt : les mots, un par ligne, dans l'ordre des lignes de la matrice
+- meta.json : modèle spaCy, type des vecteurs, empreinte du vocabulaire source
+
+Le backend ouvre la matrice en mémoire partagée (np.load avec mmap_mode) :
+le démarrage est immédiat, les pages ne sont lues qu'à l'usage et sont
+partagées par tous les workers via le cache du système. spaCy n'est alors
+chargé que pour les mots hors vocabulaire.
+
+Construction (depuis le dossier backend) :
+    python -m app.vector_store
+    python -m app.vector_store --vocab app/vocab.txt --out app/vectors --dtype float32
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import hashlib
+import json
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_STORE_DIR = BASE_DIR / "vectors"
+
+VECTORS_FILE = "vectors.npy"
+WORDS_FILE = "words.txt"
+META_FILE = "meta.json"
+
+
+def vocab_fingerprint(vocab: List[str]) -> str:
+    """Empreinte d'un vocabulaire (détecte un store construit pour un autre vocab.txt)"""
+    return hashlib.blake2b("\n".join(vocab).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class VectorStore:
+    """Vecteurs normalisés du vocabulaire, ouverts en mémoire partagée"""
+
+    def __init__(self, words: List[str], vectors: np.ndarray, meta: Dict):
+        self.words = words
+        self.vectors = vectors
+        self.meta = meta
+        self.word_to_index: Dict[str, int] = {}
+        for i, word in enumerate(words):
+            self.word_to_index.setdefault(word, i)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def load(cls, path, vocab: Optional[List[str]] = None) -> Optional["VectorStore"]:
+        """
+        Ouvre un store (matrice en mmap, rien n'est copié en mémoire)
+
+        Args:
+            path: Dossier du store
+            vocab: Vocabulaire attendu ; si le store a été construit à partir
+                d'un autre vocabulaire, il est ignoré
+
+        Returns:
+            Le store, ou None s'il n'existe pas ou ne correspond pas au vocabulaire
+        """
+        path = Path(path)
+        if not (path / META_FILE).exists():
+            return None
+        meta = json.loads((path / META_FILE).read_text(encoding="utf-8"))
+        if vocab is not None and meta.get("vocab_fingerprint") != vocab_fingerprint(vocab):
+            print(f"⚠ Store de vecteurs {path} construit pour un autre vocabulaire : ignoré")
+            print("  Reconstruisez-le : python -m app.vector_store")
+            return None
+        with (path / WORDS_FILE).open(encoding="utf-8") as f:
+            words = [line.rstrip("\n") for line in f]
+        vectors = np.load(path / VECTORS_FILE, mmap_mode="r")
+        if len(words) != len(vectors):
+            raise ValueError(f"Store de vecteurs incohérent : {len(words)} mots pour {len(vectors)} vecteurs")
+        return cls(words, vectors, meta)
+
+
+def build_vector_store(vocab: List[str], path=DEFAULT_STORE_DIR, dtype: str = "float16",
+                       batch_size: int = 1000) -> VectorStore:
+    """
+    Vectorise le vocabulaire avec spaCy et l'enregistre sur disque
+
+    Les mots sans vecteur sont écartés, comme au chargement du GameManager.
+
+    Args:
+        vocab: Liste des mots du vocabulaire
+        path: Dossier du store (créé si besoin)
+        dtype: "float16" (compact) ou "float32" (recherche exacte plus rapide)
+        batch_size: Taille des lots de nlp.pipe
+    """
+    from .game import get_nlp
+
+    nlp = get_nlp()
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    words = []
+    vectors_list = []
+    for doc in nlp.pipe(vocab, batch_size=batch_size):
+        if doc.has_vector and doc.vector_norm > 0:
+            words.append(doc.text)
+            vectors_list.append(doc.vector / doc.vector_norm)
+
+    vectors = np.array(vectors_list, dtype=np.float32)
+    np.save(path / VECTORS_FILE, vectors.astype(dtype))
+    with (path / WORDS_FILE).open("w", encoding="utf-8") as f:
+        f.writelines(f"{word}\n" for word in words)
+    meta = {
+        "model": nlp.meta.get("name", ""),
+        "dtype": dtype,
+        "dim": int(vectors.shape[1]) if len(vectors) else 0,
+        "count": len(words),
+        "vocab_fingerprint": vocab_fingerprint(vocab),
+    }
+    (path / META_FILE).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    print(f"Store de vecteurs écrit dans {path} : {len(words)} mots ({dtype})")
+    return VectorStore.load(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporte les vecteurs du vocabulaire pour le backend")
+    parser.add_argument("--vocab", default=str(BASE_DIR / "vocab.txt"), help="Fichier du vocabulaire (un mot par ligne)")
+    parser.add_argument("--out", default=str(DEFAULT_STORE_DIR), help="Dossier du store")
+    parser.add_argument("--dtype", default="float16", choices=["float16", "float32"], help="Type des vecteurs enregistrés")
+    args = parser.parse_args()
+
+    with open(args.vocab, encoding="utf-8") as f:
+        vocab = [line.strip() for line in f if line.strip()]
+    build_vector_store(vocab, args.out, dtype=args.dtype)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Stockage des parties en cours pour l'API.
+
+Les parties sont gardées en mémoire et supprimées après une période
+d'inactivité (TTL). Avec un fichier SQLite, elles sont aussi enregistrées
+sur disque (mot cible et tentatives) : une partie absente de la mémoire,
+par exemple après un redémarrage du serveur, est reconstruite en rejouant
+ses tentatives.
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wordle_solver import WordleGame, ConstraintManager
+
+
+@dataclass
+class GameSession:
+    """Une partie en cours et son état de résolution."""
+    game_id: str
+    language: str
+    strategy_name: str
+    target_word: str
+    game: WordleGame
+    constraint_manager: ConstraintManager
+    created_at: float = field(default_factory=time.time)
+    last_access: float = field(default_factory=time.time)
+    
+    @classmethod
+    def create(cls, game_id: str, language: str, strategy_name: str, target_word: str) -> "GameSession":
+        """Crée une nouvelle partie."""
+        return cls(
+            game_id=game_id,
+            language=language,
+            strategy_name=strategy_name,
+            target_word=target_word,
+            game=WordleGame(target_word),
+            constraint_manager=ConstraintManager()
+        )
+    
+    def play(self, guess: str):
+        """
+        Joue une tentative et met à jour les contraintes.
+        
+        Returns:
+            FeedbackResult de la tentative
+        
+        Raises:
+            ValueError: Si la tentative est invalide ou la partie terminée
+        """
+        feedback = self.game.make_guess(guess)
+        self.constraint_manager.apply_feedback(feedback)
+        return feedback
+
+
+class GameStore:
+    """
+    Parties en cours, avec expiration et persistance SQLite optionnelle.
+    
+    Utilisé depuis la boucle d'événements de l'API (un seul thread).
+    """
+    
+    def __init__(self, ttl: float = 3600.0, db_path: Optional[str] = None):
+        """
+        Initialise le stockage.
+        
+        Args:
+            ttl: Durée d'inactivité (secondes) avant suppression d'une partie
+            db_path: Fichier SQLite (None : mémoire uniquement)
+        """
+        self.ttl = ttl
+        self.db_path = db_path
+        self._sessions: Dict[str, GameSession] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        self.evicted = 0
+        
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS games ("
+                " game_id TEXT PRIMARY KEY,"
+                " language TEXT NOT NULL,"
+                " strategy TEXT NOT NULL,"
+                " target_word TEXT NOT NULL,"
+                " guesses TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._db.commit()
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def add(self, session: GameSession):
+        """Enregistre une nouvelle partie."""
+        self._sessions[session.game_id] = session
+        self.save(session)
+    
+    def get(self, game_id: str) -> Optional[GameSession]:
+        """
+        Récupère une partie (et repousse son expiration).
+        
+        Args:
+            game_id: Identifiant de la partie
+        
+        Returns:
+            GameSession, ou None si elle n'existe pas ou a expiré
+        """
+        now = time.time()
+        session = self._sessions.get(game_id)
+        if session is None:
+            session = self._restore(game_id, now)
+            if session is None:
+                return None
+            self._sessions[game_id] = session
+        elif now - session.last_access > self.ttl:
+            self.delete(game_id)
+            self.evicted += 1
+            return None
+        
+        session.last_access = now
+        return session
+    
+    def save(self, session: GameSession):
+        """
+        Enregistre l'état d'une partie sur disque (après une tentative).
+        
+        Args:
+            session: Partie à enregistrer
+        """
+        session.last_access = time.time()
+        if self._db is None:
+            return
+        guesses = [feedback.guess for feedback in session.game.get_history()]
+        self._db.execute(
+            "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                session.game_id, session.language, session.strategy_name,
+                session.target_word, json.dumps(guesses),
+                session.created_at, session.last_access
+            )
+        )
+        self._db.commit()
+    
+    def delete(self, game_id: str) -> bool:
+        """
+        Supprime une partie.
+        
+        Returns:
+            True si la partie existait
+        """
+        existed = self._sessions.pop(game_id, None) is not None
+        if self._db is not None:
+            cursor = self._db.execute("DELETE FROM games WHERE game_id = ?", (game_id,))
+            self._db.commit()
+            existed = existed or cursor.rowcount > 0
+        return existed
+    
+    def evict_expired(self) -> int:
+        """
+        Supprime les parties inactives depuis plus que le TTL.
+        
+        Returns:
+            Nombre de parties supprimées de la mémoire
+        """
+        cutoff = time.time() - self.ttl
+        expired = [
+            game_id for game_id, session in self._sessions.items()
+            if session.last_access < cutoff
+        ]
+        for game_id in expired:
+            del self._sessions[game_id]
+        
+        if self._db is not None:
+            for game_id in expired:
+                self._db.execute("DELETE FROM games WHERE game_id = ?", (game_id,))
+            # Parties enregistrées mais jamais rechargées depuis le démarrage
+            active = list(self._sessions)
+            placeholders = ",".join("?" * len(active))
+            self._db.execute(
+                f"DELETE FROM games WHERE updated_at < ? AND game_id NOT IN ({placeholders})",
+                [cutoff, *active]
+            )
+            self._db.commit()
+        
+        self.evicted += len(expired)
+        return len(expired)
+    
+    def close(self):
+        """Ferme la base SQLite."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def _restore(self, game_id: str, now: float) -> Optional[GameSession]:
+        """Reconstruit une partie enregistrée en rejouant ses tentatives."""
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT language, strategy, target_word, guesses, created_at, updated_at"
+            " FROM games WHERE game_id = ?",
+            (game_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        language, strategy_name, target_word, guesses, created_at, updated_at = row
+        if now - updated_at > self.ttl:
+            self.delete(game_id)
+            self.evicted += 1
+            return None
+        
+        session = GameSession.create(game_id, language, strategy_name, target_word)
+        session.created_at = created_at
+        for guess in json.loads(guesses):
+            session.play(guess)
+        return session
@@ -0,0 +1,361 @@
+"""
+Test de charge du backend Wordle Solver.
+
+Rejoue des parties complètes (nouvelle partie, puis suggestion et tentative
+jusqu'à la fin) avec N utilisateurs simultanés, stratégie par stratégie, et
+rapporte pour chaque endpoint et chaque stratégie :
+- l'histogramme et les percentiles (p50, p90, p99) des latences ;
+- le débit (requêtes/s) et le nombre d'erreurs ;
+- la croissance de la mémoire (RSS) du serveur pendant la phase.
+
+Deux modes :
+- ASGI (défaut) : l'application tourne dans ce processus, via le transport
+  ASGI de httpx (démarrage/arrêt compris) ;
+- --url : serveur déjà lancé (uvicorn main:app), mémoire lue via --server-pid.
+
+Les seuils --slo (p99 en ms par endpoint) font échouer le script (code 1)
+s'ils sont dépassés : à lancer avant un déploiement.
+
+Exemples :
+    python load_harness.py --games 200 --concurrency 20 --strategies frequency,entropy
+    python load_harness.py --url http://localhost:8000 --server-pid 1234
+    python load_harness.py --slo suggest=300 --slo guess=50 --json report.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import httpx
+
+# Le backend est importable depuis ce dossier (mode ASGI)
+sys.path.insert(0, str(Path(__file__).parent))
+
+ENDPOINTS = ('new', 'guess', 'suggest')
+
+# Bornes supérieures des classes de l'histogramme (ms)
+HISTOGRAM_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf')]
+
+
+@dataclass
+class EndpointStats:
+    """Latences d'un endpoint pour une stratégie."""
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    
+    def record(self, latency: float, ok: bool):
+        """Enregistre une requête (latence en secondes)."""
+        self.latencies.append(latency)
+        if not ok:
+            self.errors += 1
+    
+    def percentile(self, p: float) -> float:
+        """Percentile des latences (ms), par rang le plus proche."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[rank] * 1000
+    
+    def histogram(self) -> List[int]:
+        """Nombre de requêtes par classe de HISTOGRAM_BOUNDS."""
+        counts = [0] * len(HISTOGRAM_BOUNDS)
+        for latency in self.latencies:
+            ms = latency * 1000
+            for i, bound in enumerate(HISTOGRAM_BOUNDS):
+                if ms <= bound:
+                    counts[i] += 1
+                    break
+        return counts
+    
+    def to_dict(self, duration: float) -> Dict:
+        """Résumé sérialisable."""
+        count = len(self.latencies)
+        return {
+            'requests': count,
+            'errors': self.errors,
+            'throughput': count / duration if duration > 0 else 0.0,
+            'mean_ms': sum(self.latencies) / count * 1000 if count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'max_ms': max(self.latencies) * 1000 if count else 0.0,
+            'histogram': dict(zip(
+                [str(bound) if bound != float('inf') else 'inf' for bound in HISTOGRAM_BOUNDS],
+                self.histogram()
+            )),
+        }
+
+
+@dataclass
+class PhaseResult:
+    """Résultat d'une phase (une stratégie)."""
+    strategy: str
+    games: int = 0
+    duration: float = 0.0
+    rss_before: Optional[int] = None
+    rss_after: Optional[int] = None
+    endpoints: Dict[str, EndpointStats] = field(
+        default_factory=lambda: {name: EndpointStats() for name in ENDPOINTS}
+    )
+    
+    @property
+    def memory_growth(self) -> Optional[int]:
+        """Croissance du RSS pendant la phase (octets)."""
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+    
+    def to_dict(self) -> Dict:
+        """Résumé sérialisable."""
+        requests = sum(len(stats.latencies) for stats in self.endpoints.values())
+        return {
+            'strategy': self.strategy,
+            'games': self.games,
+            'duration_s': self.duration,
+            'throughput': requests / self.duration if self.duration > 0 else 0.0,
+            'rss_before': self.rss_before,
+            'rss_after': self.rss_after,
+            'memory_growth': self.memory_growth,
+            'endpoints': {
+                name: stats.to_dict(self.duration) for name, stats in self.endpoints.items()
+            },
+        }
+
+
+def read_rss(pid: Optional[int] = None) -> Optional[int]:
+    """
+    Mémoire résidente d'un processus et de ses enfants (workers), en octets.
+    
+    Args:
+        pid: Processus à mesurer (None : ce processus)
+    
+    Returns:
+        RSS, ou None si elle n'est pas mesurable
+    """
+    pid = pid or os.getpid()
+    statm = f"/proc/{pid}/statm"
+    if not os.path.exists(statm):
+        if pid == os.getpid() and resource is not None:
+            # Pic de mémoire (Ko sous Linux, octets sous macOS)
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == 'darwin' else peak * 1024
+        return None
+    
+    with open(statm) as f:
+        total = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    children = f"/proc/{pid}/task/{pid}/children"
+    if os.path.exists(children):
+        with open(children) as f:
+            for child in f.read().split():
+                total += read_rss(int(child)) or 0
+    return total
+
+
+async def timed(stats: EndpointStats, request) -> Optional[Dict]:
+    """Exécute une requête et enregistre sa latence."""
+    start = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError:
+        stats.record(time.perf_counter() - start, ok=False)
+        return None
+    stats.record(time.perf_counter() - start, ok=response.status_code < 400)
+    return response.json() if response.status_code < 400 else None
+
+
+async def play_game(
+    client: httpx.AsyncClient,
+    phase: PhaseResult,
+    language: str,
+    rng: random.Random,
+    explore_rate: float
+):
+    """
+    Joue une partie comme un utilisateur de l'interface.
+    
+    Le joueur demande une suggestion avant chaque tentative et la suit,
+    sauf dans une proportion explore_rate des cas où il joue un autre mot
+    possible (les parties sortent alors des arbres de décision compilés).
+    """
+    created = await timed(phase.endpoints['new'], client.post(
+        "/api/game/new", json={"language": language, "strategy": phase.strategy}
+    ))
+    if created is None:
+        return
+    game_id = created["game_id"]
+    
+    for _ in range(6):
+        suggestion = await timed(phase.endpoints['suggest'], client.post(
+            "/api/game/suggest", json={"game_id": game_id, "limit": 10}
+        ))
+        if suggestion is None or not suggestion.get("suggested_word"):
+            break
+        
+        guess = suggestion["suggested_word"]
+        if suggestion["possible_words"] and rng.random() < explore_rate:
+            guess = rng.choice(suggestion["possible_words"])
+        
+        result = await timed(phase.endpoints['guess'], client.post(
+            "/api/game/guess", json={"game_id": game_id, "guess": guess}
+        ))
+        if result is None or result["is_over"]:
+            break
+    
+    phase.games += 1
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    strategy: str,
+    args: argparse.Namespace,
+    server_pid: Optional[int]
+) -> PhaseResult:
+    """Joue args.games parties avec args.concurrency utilisateurs simultanés."""
+    phase = PhaseResult(strategy=strategy)
+    rng = random.Random(args.seed)
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(args.games):
+        queue.put_nowait(None)
+    
+    async def user():
+        while not queue.empty():
+            queue.get_nowait()
+            await play_game(client, phase, args.language, rng, args.explore_rate)
+    
+    phase.rss_before = read_rss(server_pid)
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(args.concurrency)))
+    phase.duration = time.perf_counter() - start
+    phase.rss_after = read_rss(server_pid)
+    return phase
+
+
+def format_report(phases: List[PhaseResult]) -> str:
+    """Rapport texte : tableau des latences puis histogrammes."""
+    lines = [
+        "=" * 100,
+        "TEST DE CHARGE - LATENCES PAR ENDPOINT ET STRATÉGIE".center(100),
+        "=" * 100,
+        f"{'Stratégie':<12} {'Endpoint':<9} {'Requêtes':>9} {'Erreurs':>8} {'Débit/s':>9} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+        "-" * 100,
+    ]
+    for phase in phases:
+        for name, stats in phase.endpoints.items():
+            summary = stats.to_dict(phase.duration)
+            lines.append(
+                f"{phase.strategy:<12} {name:<9} {summary['requests']:>9} {summary['errors']:>8} "
+                f"{summary['throughput']:>9.1f} {summary['p50_ms']:>9.1f} {summary['p90_ms']:>9.1f} "
+                f"{summary['p99_ms']:>9.1f} {summary['max_ms']:>9.1f}"
+            )
+        growth = phase.memory_growth
+        memory = f"{growth / 2**20:+.1f} Mo" if growth is not None else "non mesurée"
+        lines.append(
+            f"{'':<12} {phase.games} parties en {phase.duration:.1f}s, mémoire {memory}"
+        )
+        lines.append("-" * 100)
+    
+    lines.append("\nHISTOGRAMMES (ms)")
+    for phase in phases:
+        for name, stats in phase.endpoints.items():
+            counts = stats.histogram()
+            total = sum(counts)
+            if not total:
+                continue
+            lines.append(f"\n  {phase.strategy} / {name}")
+            previous = 0
+            for bound, count in zip(HISTOGRAM_BOUNDS, counts):
+                if count:
+                    label = f"{previous}-{bound}" if bound != float('inf') else f">{previous}"
+                    bar = "█" * max(1, round(40 * count / total))
+                    lines.append(f"    {label:>11} {count:>7} {bar}")
+                previous = bound
+    return "\n".join(lines)
+
+
+def check_slos(phases: List[PhaseResult], slos: Dict[str, float]) -> List[str]:
+    """
+    Vérifie les seuils de p99.
+    
+    Returns:
+        Liste des dépassements (vide si tout est conforme)
+    """
+    violations = []
+    for phase in phases:
+        for name, limit in slos.items():
+            p99 = phase.endpoints[name].percentile(99)
+            if p99 > limit:
+                violations.append(f"{phase.strategy}/{name} : p99 {p99:.1f} ms > {limit:.1f} ms")
+    return violations
+
+
+def parse_slo(value: str):
+    """Parse un seuil 'endpoint=ms'."""
+    name, _, limit = value.partition("=")
+    if name not in ENDPOINTS or not limit:
+        raise argparse.ArgumentTypeError(f"Seuil invalide : {value} (attendu {'|'.join(ENDPOINTS)}=ms)")
+    return name, float(limit)
+
+
+async def main(args: argparse.Namespace) -> int:
+    strategies = [name.strip() for name in args.strategies.split(",") if name.strip()]
+    phases = []
+    
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout) as client:
+            for strategy in strategies:
+                phases.append(await run_phase(client, strategy, args, args.server_pid))
+    else:
+        from main import app
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://loadtest", timeout=args.timeout
+            ) as client:
+                for strategy in strategies:
+                    phases.append(await run_phase(client, strategy, args, None))
+    
+    print(format_report(phases))
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([phase.to_dict() for phase in phases], f, indent=2)
+    
+    violations = check_slos(phases, dict(args.slo))
+    if violations:
+        print("\n❌ Seuils dépassés :")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test de charge du backend Wordle Solver")
+    parser.add_argument("--url", default=None, help="Serveur à tester (défaut : application en ASGI local)")
+    parser.add_argument("--server-pid", type=int, default=None, help="PID du serveur (mesure mémoire en mode --url)")
+    parser.add_argument("--strategies", default="frequency,entropy,minimax", help="Stratégies testées (séparées par des virgules)")
+    parser.add_argument("--language", default="en", choices=["en", "fr"], help="Langue des parties")
+    parser.add_argument("--games", type=int, default=100, help="Parties jouées par stratégie")
+    parser.add_argument("--concurrency", type=int, default=10, help="Utilisateurs simultanés")
+    parser.add_argument("--explore-rate", type=float, default=0.2, help="Proportion de tentatives qui ne suivent pas la suggestion")
+    parser.add_argument("--seed", type=int, default=42, help="Graine aléatoire des joueurs")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Délai maximal d'une requête (s)")
+    parser.add_argument("--slo", type=parse_slo, action="append", default=[], help="Seuil de p99, ex. suggest=300 (répétable)")
+    parser.add_argument("--json", default=None, help="Fichier de sortie JSON")
+    
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -2,39 +2,96 @@
 API FastAPI pour le Wordle Solver.
 
 Expose les fonctionnalités du solver via une API REST.
+
+Configuration (variables d'environnement) :
+- WORDLE_LANGUAGES : langues chargées au démarrage (défaut "en,fr")
+- WORDLE_GAME_TTL : durée d'inactivité avant suppression d'une partie (s)
+- WORDLE_GAME_DB : fichier SQLite de persistance des parties (optionnel)
+- WORDLE_SUGGEST_WORKERS : processus de calcul des suggestions
+  (0 : thread du serveur)
 """
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Set
+from typing import List, Optional, Dict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import multiprocessing
+import os
+import random
+import uuid
 import sys
 from pathlib import Path
 
 # Ajouter le dossier parent au path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from wordle_solver import (
-    WordleGame,
-    HybridSolver,
-    ConstraintManager,
-    DictionaryLoader,
-    generate_feedback,
-    FeedbackResult,
-    Feedback
-)
-from wordle_solver.strategies import (
-    FrequencyStrategy,
-    EntropyStrategy,
-    MinimaxStrategy,
-    SimpleStrategy
+from wordle_solver.strategies import available_strategies, get_cache_stats
+from game_store import GameStore, GameSession
+from suggestions import (
+    load_resources,
+    loaded_languages,
+    loaded_trees,
+    get_word_list,
+    get_solver,
+    compute_suggestion,
+    init_worker
 )
 from gemini_service import get_gemini_service
 
+LANGUAGES = [lang.strip() for lang in os.getenv("WORDLE_LANGUAGES", "en,fr").split(",") if lang.strip()]
+GAME_TTL = float(os.getenv("WORDLE_GAME_TTL", "3600"))
+GAME_DB = os.getenv("WORDLE_GAME_DB") or None
+SUGGEST_WORKERS = int(os.getenv("WORDLE_SUGGEST_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Intervalle entre deux passes d'éviction des parties expirées (secondes)
+EVICTION_INTERVAL = 60
+
+# Parties en cours et pool de calcul des suggestions
+store = GameStore(ttl=GAME_TTL, db_path=GAME_DB)
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+async def _evict_periodically():
+    """Supprime régulièrement les parties expirées."""
+    while True:
+        await asyncio.sleep(EVICTION_INTERVAL)
+        store.evict_expired()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Charge les ressources au démarrage et libère le pool à l'arrêt."""
+    global _executor
+    load_resources(LANGUAGES)
+    
+    if SUGGEST_WORKERS > 0:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        _executor = ProcessPoolExecutor(
+            max_workers=SUGGEST_WORKERS,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(LANGUAGES,)
+        )
+    eviction = asyncio.create_task(_evict_periodically())
+    
+    yield
+    
+    eviction.cancel()
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+    store.close()
+
+
 app = FastAPI(
     title="Wordle Solver API",
     description="API pour résoudre Wordle avec différentes stratégies",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configuration CORS pour permettre les requêtes depuis React
@@ -46,31 +103,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Cache global pour les dictionnaires et solveurs
-_solvers: Dict[str, HybridSolver] = {}
-_strategies: Dict[str, any] = {}
-_games: Dict[str, Dict] = {}  # game_id -> {game, constraint_manager, solver, strategy}
-
-
-def get_solver(language: str) -> HybridSolver:
-    """Récupère ou crée un solver pour une langue."""
-    if language not in _solvers:
-        dictionary = DictionaryLoader.load_language(language)
-        _solvers[language] = HybridSolver(dictionary)
-    return _solvers[language]
 
-
-def get_strategy(strategy_name: str):
-    """Récupère ou crée une stratégie."""
-    if strategy_name not in _strategies:
-        strategies_map = {
-            'frequency': FrequencyStrategy(),
-            'entropy': EntropyStrategy(max_words_to_evaluate=100),
-            'minimax': MinimaxStrategy(),
-            'simple': SimpleStrategy()
-        }
-        _strategies[strategy_name] = strategies_map.get(strategy_name, FrequencyStrategy())
-    return _strategies[strategy_name]
+def get_session(game_id: str) -> GameSession:
+    """Récupère une partie en cours (404 si inconnue ou expirée)."""
+    session = store.get(game_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    return session
 
 
 # Modèles Pydantic
@@ -175,6 +214,13 @@ async def get_strategies():
                 "speed": "medium",
                 "recommended": False
             },
+            {
+                "id": "lookahead",
+                "name": "Lookahead",
+                "description": "Recherche sur plusieurs coups (nombre espéré de tentatives minimal)",
+                "speed": "slow",
+                "recommended": False
+            },
             {
                 "id": "simple",
                 "name": "Simple",
@@ -189,37 +235,26 @@ async def get_strategies():
 @app.post("/api/game/new")
 async def new_game(request: NewGameRequest):
     """Crée une nouvelle partie."""
-    import uuid
-    import random
-    
     game_id = str(uuid.uuid4())
     
-    # Charger le dictionnaire et créer le solver
-    solver = get_solver(request.language)
-    strategy = get_strategy(request.strategy)
+    try:
+        words = get_word_list(request.language)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     # Choisir un mot cible
     if request.target_word:
         target_word = request.target_word.upper()
     else:
         # Choisir un mot aléatoire du dictionnaire
-        dictionary = DictionaryLoader.load_language(request.language)
-        target_word = random.choice(list(dictionary))
-    
-    # Créer la partie
-    game = WordleGame(target_word)
-    constraint_manager = ConstraintManager()
+        target_word = random.choice(words)
     
-    # Stocker la partie
-    _games[game_id] = {
-        'game': game,
-        'constraint_manager': constraint_manager,
-        'solver': solver,
-        'strategy': strategy,
-        'language': request.language,
-        'strategy_name': request.strategy,
-        'target_word': target_word
-    }
+    # Créer et stocker la partie
+    try:
+        session = GameSession.create(game_id, request.language, request.strategy, target_word)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    store.add(session)
     
     return {
         "game_id": game_id,
@@ -233,22 +268,17 @@ async def new_game(request: NewGameRequest):
 @app.post("/api/game/guess")
 async def make_guess(request: GuessRequest):
     """Fait une tentative."""
-    if request.game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
-    
-    game_data = _games[request.game_id]
-    game = game_data['game']
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
+    session = get_session(request.game_id)
+    game = session.game
+    constraint_manager = session.constraint_manager
+    solver = get_solver(session.language)
     
     guess = request.guess.upper()
     
     try:
-        # Faire la tentative
-        feedback = game.make_guess(guess)
-        
-        # Appliquer les contraintes
-        constraint_manager.apply_feedback(feedback)
+        # Faire la tentative et appliquer les contraintes
+        feedback = session.play(guess)
+        store.save(session)
         
         # Calculer les mots possibles
         possible_words = solver.get_possible_words(constraint_manager, limit=100)
@@ -280,62 +310,29 @@ async def make_guess(request: GuessRequest):
 
 @app.post("/api/game/suggest")
 async def get_suggestions(request: SuggestRequest):
-    """Obtient des suggestions de mots."""
-    if request.game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
+    """Obtient des suggestions de mots (calculées hors de la boucle d'événements)."""
+    session = get_session(request.game_id)
     
-    game_data = _games[request.game_id]
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
-    strategy = game_data['strategy']
-    game = game_data['game']
-    
-    # Obtenir les mots possibles
-    possible_words = solver.solve(constraint_manager, use_cpsat=False)
-    
-    if not possible_words:
-        return {
-            "suggested_word": None,
-            "possible_words": [],
-            "possible_words_count": 0,
-            "explanation": "Aucun mot possible trouvé"
-        }
-    
-    # Utiliser la stratégie pour choisir le meilleur mot
-    attempt_number = len(game.attempts) + 1
-    
-    if attempt_number == 1:
-        suggested = strategy.get_first_guess(game_data['language'])
-    else:
-        dictionary = DictionaryLoader.load_language(game_data['language'])
-        suggested = strategy.choose_word(
-            possible_words,
-            constraint_manager,
-            attempt_number,
-            full_dictionary=dictionary
-        )
-    
-    explanation = strategy.explain_choice(suggested, possible_words)
-    
-    return {
-        "suggested_word": suggested,
-        "possible_words": sorted(list(possible_words))[:request.limit],
-        "possible_words_count": len(possible_words),
-        "explanation": explanation,
-        "strategy": game_data['strategy_name']
-    }
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        _executor,
+        compute_suggestion,
+        session.language,
+        session.strategy_name,
+        session.game.get_history(),
+        request.limit
+    )
+    result["strategy"] = session.strategy_name
+    return result
 
 
 @app.get("/api/game/state/{game_id}")
 async def get_game_state(game_id: str):
     """Obtient l'état actuel d'une partie."""
-    if game_id not in _games:
-        raise HTTPException(status_code=404, detail="Partie non trouvée")
-    
-    game_data = _games[game_id]
-    game = game_data['game']
-    constraint_manager = game_data['constraint_manager']
-    solver = game_data['solver']
+    session = get_session(game_id)
+    game = session.game
+    constraint_manager = session.constraint_manager
+    solver = get_solver(session.language)
     
     # Formater l'historique
     attempts = []
@@ -351,8 +348,8 @@ async def get_game_state(game_id: str):
     
     return {
         "game_id": game_id,
-        "language": game_data['language'],
-        "strategy": game_data['strategy_name'],
+        "language": session.language,
+        "strategy": session.strategy_name,
         "attempts": attempts,
         "is_over": game.is_over,
         "is_won": game.is_won,
@@ -365,10 +362,9 @@ async def get_game_state(game_id: str):
 @app.delete("/api/game/{game_id}")
 async def delete_game(game_id: str):
     """Supprime une partie."""
-    if game_id not in _games:
+    if not store.delete(game_id):
         raise HTTPException(status_code=404, detail="Partie non trouvée")
     
-    del _games[game_id]
     return {"message": "Partie supprimée", "game_id": game_id}
 
 
@@ -376,9 +372,13 @@ async def delete_game(game_id: str):
 async def get_stats():
     """Obtient des statistiques globales."""
     return {
-        "active_games": len(_games),
-        "loaded_dictionaries": list(_solvers.keys()),
-        "available_strategies": list(_strategies.keys())
+        "active_games": len(store),
+        "evicted_games": store.evicted,
+        "loaded_dictionaries": loaded_languages(),
+        "available_strategies": available_strategies(),
+        "decision_trees": loaded_trees(),
+        "suggest_workers": SUGGEST_WORKERS,
+        "score_caches": get_cache_stats()
     }
 
 
@@ -0,0 +1,189 @@
+"""
+Ressources partagées de l'API et calcul des suggestions.
+
+Les dictionnaires, solveurs (index binaire), matrices de patterns et arbres
+de décision sont chargés une seule fois, au démarrage du serveur. Le calcul
+d'une suggestion est une fonction pure de (langue, stratégie, historique) :
+il peut tourner dans un processus du pool de workers, qui charge ses propres
+ressources à l'initialisation, sans bloquer la boucle d'événements.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Ajouter le dossier parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wordle_solver import (
+    HybridSolver,
+    ConstraintManager,
+    DictionaryLoader,
+    FeedbackResult
+)
+from wordle_solver.game import get_pattern_matrix
+from wordle_solver.strategies import (
+    BaseStrategy,
+    DecisionTree,
+    create_strategy,
+    load_decision_tree
+)
+
+# Ressources chargées dans le processus
+_dictionaries: Dict[str, Set[str]] = {}
+_word_lists: Dict[str, List[str]] = {}
+_solvers: Dict[str, HybridSolver] = {}
+_strategies: Dict[str, BaseStrategy] = {}
+_trees: Dict[Tuple[str, str], Optional[DecisionTree]] = {}
+
+
+def load_resources(languages: Iterable[str], pattern_matrices: bool = True):
+    """
+    Charge les dictionnaires et les index des langues données.
+    
+    Args:
+        languages: Langues à charger ('en', 'fr')
+        pattern_matrices: Si True, charge aussi les matrices de patterns
+            (depuis le cache disque, construites au premier lancement)
+    """
+    for language in languages:
+        if language in _dictionaries:
+            continue
+        dictionary = DictionaryLoader.load_language(language)
+        _dictionaries[language] = dictionary
+        _word_lists[language] = sorted(dictionary)
+        _solvers[language] = HybridSolver(dictionary)
+        if pattern_matrices:
+            get_pattern_matrix(language)
+
+
+def loaded_languages() -> List[str]:
+    """Retourne les langues chargées."""
+    return list(_dictionaries)
+
+
+def get_dictionary(language: str) -> Set[str]:
+    """
+    Retourne le dictionnaire d'une langue (chargé à la demande sinon).
+    
+    Le dictionnaire est partagé : ne pas le modifier.
+    
+    Raises:
+        ValueError: Si la langue n'est pas supportée
+    """
+    if language not in _dictionaries:
+        load_resources([language], pattern_matrices=False)
+    return _dictionaries[language]
+
+
+def get_word_list(language: str) -> List[str]:
+    """Retourne les mots d'une langue, triés (tirage des mots cibles)."""
+    get_dictionary(language)
+    return _word_lists[language]
+
+
+def get_solver(language: str) -> HybridSolver:
+    """Retourne le solveur d'une langue."""
+    get_dictionary(language)
+    return _solvers[language]
+
+
+def get_strategy(strategy_name: str) -> BaseStrategy:
+    """Retourne l'instance de stratégie du processus."""
+    if strategy_name not in _strategies:
+        _strategies[strategy_name] = create_strategy(strategy_name)
+    return _strategies[strategy_name]
+
+
+def get_decision_tree(language: str, strategy_name: str) -> Optional[DecisionTree]:
+    """
+    Récupère l'arbre de décision compilé (examples/compile_decision_tree.py).
+    
+    Returns:
+        L'arbre, ou None s'il n'existe pas ou ne correspond plus au dictionnaire
+    """
+    key = (language, strategy_name)
+    if key not in _trees:
+        _trees[key] = load_decision_tree(language, strategy_name, get_dictionary(language))
+    return _trees[key]
+
+
+def loaded_trees() -> List[str]:
+    """Retourne les arbres de décision chargés."""
+    return [
+        f"{language}/{strategy}" for (language, strategy), tree in _trees.items()
+        if tree is not None
+    ]
+
+
+def compute_suggestion(
+    language: str,
+    strategy_name: str,
+    history: List[FeedbackResult],
+    limit: int = 10
+) -> Dict:
+    """
+    Calcule le mot suggéré après un historique de tentatives.
+    
+    Args:
+        language: Langue de la partie
+        strategy_name: Identifiant de la stratégie
+        history: Feedbacks des tentatives déjà jouées
+        limit: Nombre de mots possibles renvoyés
+    
+    Returns:
+        Réponse de /api/game/suggest (sans l'identifiant de stratégie)
+    """
+    constraint_manager = ConstraintManager()
+    for feedback in history:
+        constraint_manager.apply_feedback(feedback)
+    
+    solver = get_solver(language)
+    strategy = get_strategy(strategy_name)
+    
+    # Obtenir les mots possibles
+    possible_words = solver.solve(constraint_manager, use_cpsat=False)
+    
+    if not possible_words:
+        return {
+            "suggested_word": None,
+            "possible_words": [],
+            "possible_words_count": 0,
+            "explanation": "Aucun mot possible trouvé"
+        }
+    
+    # Chercher d'abord le mot dans l'arbre de décision compilé
+    suggested = None
+    source = "live"
+    tree = get_decision_tree(language, strategy_name)
+    if tree is not None:
+        suggested = tree.suggest(history)
+        if suggested is not None:
+            source = "tree"
+    
+    # Sinon utiliser la stratégie pour choisir le meilleur mot
+    if suggested is None:
+        attempt_number = len(history) + 1
+        
+        if attempt_number == 1:
+            suggested = strategy.get_first_guess(language)
+        else:
+            suggested = strategy.choose_word(
+                possible_words,
+                constraint_manager,
+                attempt_number,
+                full_dictionary=get_dictionary(language)
+            )
+    
+    return {
+        "suggested_word": suggested,
+        "possible_words": sorted(possible_words)[:limit],
+        "possible_words_count": len(possible_words),
+        "explanation": strategy.explain_choice(suggested, possible_words),
+        "source": source
+    }
+
+
+def init_worker(languages: List[str]):
+    """Initialise un worker du pool : charge les ressources une fois par processus."""
+    load_resources(languages)
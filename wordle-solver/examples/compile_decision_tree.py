@@ -0,0 +1,96 @@
+"""
+Compilation des arbres de décision utilisés par l'API.
+
+Déroule une stratégie sur tous les mots du dictionnaire et enregistre
+l'arbre obtenu là où le backend le cherche (/api/game/suggest répond alors
+par simple lecture de l'arbre).
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wordle_solver.dictionaries import DictionaryLoader
+from wordle_solver.game import get_pattern_matrix
+from wordle_solver.strategies import (
+    available_strategies,
+    create_strategy,
+    compile_decision_tree,
+    decision_tree_path,
+)
+
+
+def compile_tree(language: str, strategy_name: str, max_depth: int = 6, output_dir: str = None):
+    """
+    Compile et enregistre l'arbre d'une langue et d'une stratégie.
+    
+    Args:
+        language: Langue ('en' ou 'fr')
+        strategy_name: Identifiant de la stratégie
+        max_depth: Nombre maximal de tentatives compilées
+        output_dir: Dossier de destination (cache par défaut)
+    """
+    dictionary = DictionaryLoader.load_language(language)
+    get_pattern_matrix(language)
+    
+    print(f"🌳 Compilation : {language.upper()} / {strategy_name} ({len(dictionary)} mots)")
+    start = time.time()
+    tree = compile_decision_tree(
+        create_strategy(strategy_name),
+        dictionary,
+        language=language,
+        strategy_name=strategy_name,
+        max_depth=max_depth
+    )
+    
+    path = decision_tree_path(language, strategy_name, output_dir)
+    tree.save(str(path))
+    
+    size_kb = os.path.getsize(path) / 1024
+    print(f"  ✓ {len(tree)} nœuds en {time.time() - start:.1f}s")
+    print(f"  ✓ {path} ({size_kb:.0f} Ko)\n")
+
+
+def main():
+    """Fonction principale."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Compilation des arbres de décision Wordle")
+    parser.add_argument(
+        '--language',
+        choices=['en', 'fr', 'all'],
+        default='all',
+        help='Langue'
+    )
+    parser.add_argument(
+        '--strategy',
+        choices=available_strategies() + ['all'],
+        default='all',
+        help='Stratégie à compiler'
+    )
+    parser.add_argument(
+        '--max-depth',
+        type=int,
+        default=6,
+        help='Nombre maximal de tentatives compilées'
+    )
+    parser.add_argument(
+        '--output-dir',
+        default=None,
+        help='Dossier de destination (par défaut celui lu par le backend)'
+    )
+    
+    args = parser.parse_args()
+    
+    languages = ['en', 'fr'] if args.language == 'all' else [args.language]
+    strategies = available_strategies() if args.strategy == 'all' else [args.strategy]
+    
+    for language in languages:
+        for strategy_name in strategies:
+            compile_tree(language, strategy_name, args.max_depth, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Ce script compare les performances de différentes stratégies
 sur un ensemble de mots représentatifs.
 """
 
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,21 +17,23 @@ from wordle_solver.strategies import (
     FastEntropyStrategy,
     MinimaxStrategy,
     ExpectedSizeStrategy,
+    EntropyStrategy,
     quick_benchmark
 )
 
 
-def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
+def benchmark_all_strategies(n_words: int = 30, language: str = "en", num_workers: int = 1):
     """
     Benchmark de toutes les stratégies disponibles.
     
     Args:
-        n_words: Nombre de mots à tester
+        n_words: Nombre de mots à tester (0 = tout le dictionnaire)
         language: Langue ('en' ou 'fr')
+        num_workers: Nombre de processus par stratégie
     """
     print("\n" + "="*80)
     print(f"BENCHMARK DES STRATÉGIES WORDLE".center(80))
-    print(f"Langue: {language.upper()} | Mots testés: {n_words}".center(80))
+    print(f"Langue: {language.upper()} | Mots testés: {n_words or 'tous'} | Workers: {num_workers}".center(80))
     print("="*80 + "\n")
     
     # Définir les stratégies à tester
@@ -41,6 +44,7 @@ def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
         FastEntropyStrategy(evaluation_limit=30),
         MinimaxStrategy(tie_breaker="entropy"),
         ExpectedSizeStrategy(),
+        EntropyStrategy(use_full_dictionary=True),
     ]
     
     print("📋 Stratégies testées:")
@@ -48,12 +52,15 @@ def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
         print(f"  {i}. {strategy.name}")
     print()
     
-    # Lancer le benchmark
+    # Lancer le benchmark (EntropyStrategy sur tout le dictionnaire : la matrice
+    # de patterns est calculée au premier lancement puis relue depuis le cache)
     stats = quick_benchmark(
         strategies=strategies,
         n_words=n_words,
         language=language,
-        verbose=True
+        verbose=True,
+        num_workers=num_workers,
+        use_pattern_matrix=True
     )
     
     # Afficher le gagnant
@@ -69,6 +76,7 @@ def benchmark_all_strategies(n_words: int = 30, language: str = "en"):
     print(f"  Taux de victoire: {best_strategy.win_rate:.1f}%")
     print(f"  Moyenne: {best_strategy.average_attempts:.2f} tentatives")
     print(f"  Temps: {best_strategy.average_time:.3f}s par partie")
+    print(f"  Débit: {best_strategy.games_per_second:.1f} parties/s")
     print("\n" + "="*80 + "\n")
 
 
@@ -232,7 +240,13 @@ def main():
         '--n-words',
         type=int,
         default=30,
-        help='Nombre de mots à tester (benchmark)'
+        help='Nombre de mots à tester (benchmark, 0 = tout le dictionnaire)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Nombre de processus par stratégie (benchmark)'
     )
     parser.add_argument(
         '--language',
@@ -251,7 +265,7 @@ def main():
     
     try:
         if args.mode == 'benchmark':
-            benchmark_all_strategies(args.n_words, args.language)
+            benchmark_all_strategies(args.n_words, args.language, args.workers)
         
         elif args.mode == 'compare':
             compare_two_strategies()
@@ -272,6 +286,7 @@ if __name__ == "__main__":
     if len(sys.argv) == 1:
         print("\n💡 Usage:")
         print("  python strategy_benchmark.py --mode benchmark --n-words 30")
+        print("  python strategy_benchmark.py --mode benchmark --n-words 0 --workers 8")
         print("  python strategy_benchmark.py --mode compare")
         print("  python strategy_benchmark.py --mode demo --strategy entropy\n")
         
@@ -0,0 +1,65 @@
+"""
+Tests unitaires pour le comparateur de stratégies.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pickle
+
+import numpy as np
+from wordle_solver.game import PatternMatrix, patterns
+from wordle_solver.strategies import StrategyComparator, FrequencyStrategy, MinimaxStrategy
+
+
+DICTIONARY = {
+    'AROSE', 'ROBOT', 'SPEED', 'EERIE', 'ABBEY', 'KAYAK', 'LLAMA', 'CRANE',
+    'SLATE', 'TRACE', 'STEEL', 'LEVEL', 'GEESE', 'ERASE', 'OTTER', 'SOARE',
+}
+
+
+class TestParallelComparator:
+    """Tests du mode parallèle."""
+    
+    def test_parallel_matches_sequential(self):
+        """Les parties jouées en parallèle sont identiques aux séquentielles."""
+        comparator = StrategyComparator(DICTIONARY, use_pattern_matrix=False)
+        targets = sorted(DICTIONARY)
+        
+        for strategy_class in (FrequencyStrategy, MinimaxStrategy):
+            sequential = comparator.test_strategy(strategy_class(), targets)
+            expected = {r.target_word: r.guesses for r in comparator.results[-len(targets):]}
+            
+            parallel = comparator.test_strategy(strategy_class(), targets, num_workers=2, chunk_size=3)
+            played = {r.target_word: r.guesses for r in comparator.results[-len(targets):]}
+            
+            assert played == expected
+            assert parallel.games_won == sequential.games_won
+            assert parallel.total_guesses == sequential.total_guesses
+            assert parallel.games_per_second > 0
+    
+    def test_memmap_matrix_pickles_by_path(self, tmp_path):
+        """Une matrice sur disque est rouverte en memmap au lieu d'être copiée."""
+        matrix = PatternMatrix.load_or_build(DICTIONARY, str(tmp_path), name='test')
+        assert matrix.__getstate__()['matrix'] is None
+        
+        restored = pickle.loads(pickle.dumps(matrix))
+        assert isinstance(restored.matrix, np.memmap)
+        assert np.array_equal(restored.matrix, matrix.matrix)
+    
+    def test_default_uses_cached_matrix_only(self, tmp_path, monkeypatch):
+        """Par défaut, la matrice n'est utilisée que si elle est déjà calculée."""
+        monkeypatch.setattr(patterns, 'DEFAULT_CACHE_DIR', tmp_path)
+        monkeypatch.setattr(patterns, '_loaded', {})
+        
+        comparator = StrategyComparator(DICTIONARY, language='test')
+        assert comparator.pattern_matrix is None
+        assert not list(tmp_path.iterdir())
+        
+        PatternMatrix.load_or_build(DICTIONARY, name='test')
+        comparator = StrategyComparator(DICTIONARY, language='test')
+        assert isinstance(comparator.pattern_matrix.matrix, np.memmap)
+        assert patterns.find_pattern_matrix(DICTIONARY) is comparator.pattern_matrix
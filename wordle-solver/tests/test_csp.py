@@ -9,7 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
-from wordle_solver.csp import ConstraintManager, WordFilter, HybridSolver
+from wordle_solver.csp import ConstraintManager, WordFilter, FastWordFilter, HybridSolver, BitsetIndex
 from wordle_solver.game import generate_feedback, Feedback
 
 
@@ -96,6 +96,40 @@ class TestWordFilter:
         assert "AROSE" not in valid_words
 
 
+class TestBitsetIndex:
+    """Tests pour l'index binaire."""
+    
+    DICTIONARY = {"ROBOT", "AROSE", "SLATE", "ROVER", "ROOST", "SPEED", "EERIE", "ERASE", "STEEL"}
+    
+    @pytest.mark.parametrize("guesses,target", [
+        (["AROSE"], "ROBOT"),
+        (["EERIE"], "SPEED"),
+        (["SPEED", "ERASE"], "STEEL"),
+        (["ROOST"], "ROVER"),
+    ])
+    def test_matches_is_word_valid(self, guesses, target):
+        """Le masque correspond à is_word_valid sur tout le dictionnaire."""
+        index = BitsetIndex(self.DICTIONARY)
+        cm = ConstraintManager()
+        incremental = index.valid.copy()
+        for guess in guesses:
+            feedback = generate_feedback(guess, target)
+            cm.apply_feedback(feedback)
+            incremental &= index.feedback_mask(feedback)
+        
+        expected = {word for word in self.DICTIONARY if cm.is_word_valid(word)}
+        assert index.words_from_mask(index.mask(cm)) == expected
+        assert index.words_from_mask(incremental) == expected
+        assert FastWordFilter(self.DICTIONARY).filter_by_constraints(cm) == expected
+    
+    def test_unknown_letter(self):
+        """Une lettre absente du dictionnaire ne laisse aucun candidat."""
+        index = BitsetIndex(self.DICTIONARY)
+        cm = ConstraintManager()
+        cm.apply_feedback(generate_feedback("QUACK", "QUICK"))
+        assert not index.mask(cm).any()
+
+
 class TestHybridSolver:
     """Tests pour le solveur hybride."""
     
@@ -0,0 +1,72 @@
+"""
+Tests unitaires pour les arbres de décision compilés.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from wordle_solver import WordleGame, HybridSolver, ConstraintManager
+from wordle_solver.game import generate_feedback
+from wordle_solver.strategies import (
+    DecisionTree,
+    FrequencyStrategy,
+    compile_decision_tree,
+    decision_tree_path,
+    load_decision_tree,
+)
+
+
+DICTIONARY = {
+    'AROSE', 'ROBOT', 'SPEED', 'EERIE', 'ABBEY', 'KAYAK', 'LLAMA', 'CRANE',
+    'SLATE', 'TRACE', 'STEEL', 'LEVEL', 'GEESE', 'ERASE', 'OTTER', 'SOARE',
+}
+
+
+class TestDecisionTree:
+    """Tests du compilateur et du chargement des arbres."""
+    
+    @pytest.fixture
+    def tree(self):
+        return compile_decision_tree(FrequencyStrategy(), DICTIONARY, 'en', 'frequency')
+    
+    def test_matches_live_strategy(self, tree):
+        """Chaque suggestion de l'arbre est celle de la stratégie en direct."""
+        solver = HybridSolver(DICTIONARY)
+        strategy = FrequencyStrategy()
+        
+        for target in sorted(DICTIONARY):
+            game = WordleGame(target)
+            cm = ConstraintManager()
+            while not game.is_over:
+                attempt = len(game.attempts) + 1
+                if attempt == 1:
+                    live = strategy.get_first_guess('en')
+                else:
+                    possible = solver.solve(cm)
+                    live = strategy.choose_word(possible, cm, attempt, full_dictionary=DICTIONARY)
+                
+                assert tree.suggest(game.get_history()) == live
+                cm.apply_feedback(game.make_guess(live))
+    
+    def test_unknown_history_falls_back(self, tree):
+        """Un historique hors de l'arbre ne donne pas de suggestion."""
+        other = 'CRANE' if tree.guess(0) != 'CRANE' else 'SLATE'
+        assert tree.suggest([generate_feedback(other, 'ROBOT')]) is None
+    
+    def test_save_and_load(self, tree, tmp_path):
+        """L'arbre est rechargé à l'identique et vérifié contre le dictionnaire."""
+        tree.save(str(decision_tree_path('en', 'frequency', str(tmp_path))))
+        
+        loaded = load_decision_tree('en', 'frequency', DICTIONARY, str(tmp_path))
+        assert isinstance(loaded, DecisionTree)
+        assert len(loaded) == len(tree)
+        assert loaded.metadata['strategy'] == 'frequency'
+        history = [generate_feedback(tree.guess(0), 'LEVEL')]
+        assert loaded.suggest(history) == tree.suggest(history)
+        
+        # Dictionnaire différent : l'arbre est ignoré
+        assert load_decision_tree('en', 'frequency', DICTIONARY | {'OTHER'}, str(tmp_path)) is None
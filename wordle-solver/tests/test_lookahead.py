@@ -0,0 +1,69 @@
+"""
+Tests unitaires pour la stratégie de recherche à plusieurs coups.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wordle_solver.csp import ConstraintManager
+from wordle_solver.game import generate_feedback, encode_feedback
+from wordle_solver.strategies import LookaheadStrategy, ScoreCache, available_strategies
+
+
+WORDS = sorted({
+    'CRANE', 'CRATE', 'GRACE', 'BRACE', 'TRACE', 'PLACE', 'SPACE', 'SLATE',
+    'GRATE', 'CRAVE', 'GRAVE', 'BRAVE',
+})
+
+
+def brute_force(targets):
+    """Nombre espéré optimal de tentatives (mots proposés parmi les cibles)."""
+    if len(targets) == 1:
+        return 1.0
+    best = float('inf')
+    for guess in targets:
+        groups = {}
+        for target in targets:
+            if target != guess:
+                groups.setdefault(encode_feedback(generate_feedback(guess, target)), []).append(target)
+        value = 1 + sum(len(group) / len(targets) * brute_force(group) for group in groups.values())
+        best = min(best, value)
+    return best
+
+
+class TestLookaheadStrategy:
+    """Tests pour LookaheadStrategy."""
+
+    def test_exact_search_matches_brute_force(self):
+        strategy = LookaheadStrategy(max_depth=6, beam_width=len(WORDS), time_budget=60, cache=ScoreCache())
+        word = strategy.choose_word(set(WORDS), ConstraintManager(), 2)
+
+        assert word in WORDS
+        assert abs(strategy.stats['expected_guesses'] - brute_force(WORDS)) < 1e-9
+
+    def test_memoized_subproblems_are_reused(self):
+        cache = ScoreCache()
+        first = LookaheadStrategy(max_depth=3, cache=cache)
+        word = first.choose_word(set(WORDS), ConstraintManager(), 2)
+
+        second = LookaheadStrategy(max_depth=3, cache=cache)
+        assert second.choose_word(set(WORDS), ConstraintManager(), 2) == word
+        assert second.stats['cache_hits'] > 0
+
+    def test_zero_time_budget_falls_back_to_bound(self):
+        strategy = LookaheadStrategy(time_budget=0, cache=ScoreCache())
+        word = strategy.choose_word(set(WORDS), ConstraintManager(), 2)
+
+        assert word in WORDS
+        assert strategy.stats['search_depth'] == 1
+
+    def test_small_sets(self):
+        strategy = LookaheadStrategy()
+        assert strategy.choose_word(set(), ConstraintManager(), 2) is None
+        assert strategy.choose_word({'SLATE', 'CRANE'}, ConstraintManager(), 2) == 'CRANE'
+
+    def test_registered(self):
+        assert 'lookahead' in available_strategies()
@@ -0,0 +1,91 @@
+"""
+Tests unitaires pour la matrice de patterns.
+"""
+
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pytest
+from wordle_solver.game import generate_feedback, PatternMatrix, encode_feedback, decode_pattern
+from wordle_solver.strategies import EntropyStrategy, MinimaxStrategy, ExpectedSizeStrategy
+
+
+WORDS = [
+    'AROSE', 'ROBOT', 'SPEED', 'EERIE', 'ABBEY', 'KAYAK', 'LLAMA', 'CRANE',
+    'SLATE', 'TRACE', 'STEEL', 'LEVEL', 'GEESE', 'ERASE', 'OTTER', 'SOARE',
+    'CŒURS', 'MŒURS',
+]
+
+
+class TestPatternMatrix:
+    """Tests pour la matrice de patterns."""
+    
+    @pytest.fixture
+    def matrix(self):
+        return PatternMatrix.build(WORDS)
+    
+    def test_matches_generate_feedback(self, matrix):
+        """Chaque case correspond à generate_feedback (lettres dupliquées comprises)."""
+        for guess in WORDS:
+            for target in WORDS:
+                feedback = generate_feedback(guess, target)
+                assert matrix.pattern(guess, target) == encode_feedback(feedback)
+                assert decode_pattern(matrix.pattern(guess, target)) == feedback.to_pattern()
+    
+    def test_all_correct_on_diagonal(self, matrix):
+        """Un mot contre lui-même donne le pattern tout vert."""
+        assert np.all(np.diag(matrix.matrix) == 242)
+    
+    def test_save_and_memmap(self, tmp_path):
+        """La matrice est rechargée en memmap depuis le cache."""
+        built = PatternMatrix.load_or_build(WORDS, str(tmp_path), name='test')
+        loaded = PatternMatrix.load_or_build(WORDS, str(tmp_path), name='test')
+        assert isinstance(loaded.matrix, np.memmap)
+        assert np.array_equal(built.matrix, loaded.matrix)
+    
+    def test_load_cached_does_not_build(self, tmp_path):
+        """load_cached ne calcule pas une matrice absente du cache."""
+        assert PatternMatrix.load_cached(WORDS, str(tmp_path), name='test') is None
+        assert not list(tmp_path.iterdir())
+        
+        PatternMatrix.load_or_build(WORDS, str(tmp_path), name='test')
+        assert PatternMatrix.load_cached(WORDS, str(tmp_path), name='test') is not None
+    
+    def test_scores(self, matrix):
+        """Les scores vectorisés correspondent aux groupes de feedback."""
+        targets = matrix.indices(['SPEED', 'STEEL', 'GEESE', 'ERASE'])
+        guess = matrix.indices(['EERIE'])
+        groups = {}
+        for target in ['SPEED', 'STEEL', 'GEESE', 'ERASE']:
+            pattern = generate_feedback('EERIE', target).to_pattern()
+            groups[pattern] = groups.get(pattern, 0) + 1
+        sizes = np.array(list(groups.values()))
+        
+        assert matrix.worst_case_scores(guess, targets)[0] == sizes.max()
+        assert matrix.num_groups(guess, targets)[0] == len(sizes)
+        assert matrix.expected_size_scores(guess, targets)[0] == pytest.approx((sizes ** 2).sum() / 4)
+        p = sizes / 4
+        assert matrix.entropy_scores(guess, targets)[0] == pytest.approx(-(p * np.log2(p)).sum())
+
+
+class TestStrategiesWithMatrix:
+    """Les stratégies donnent le même score avec ou sans matrice."""
+    
+    @pytest.mark.parametrize('strategy_class,score', [
+        (EntropyStrategy, lambda s, w, t: -s._calculate_entropy(w, t)),
+        (MinimaxStrategy, lambda s, w, t: s._calculate_worst_case(w, t)),
+        (ExpectedSizeStrategy, lambda s, w, t: s._calculate_expected_size(w, t)),
+    ])
+    def test_same_best_score(self, strategy_class, score):
+        possible = set(WORDS[:12])
+        matrix = PatternMatrix.build(WORDS)
+        reference = strategy_class()
+        fast = strategy_class(pattern_matrix=matrix)
+        
+        expected = reference.choose_word(possible, None, 2)
+        chosen = fast.choose_word(possible, None, 2)
+        assert score(reference, chosen, possible) == pytest.approx(score(reference, expected, possible))
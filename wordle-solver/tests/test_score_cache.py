@@ -0,0 +1,67 @@
+"""
+Tests unitaires pour le cache partagé des scores.
+"""
+
+import pickle
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au path pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wordle_solver.csp import ConstraintManager
+from wordle_solver.strategies import EntropyStrategy, MinimaxStrategy, ScoreCache, state_key
+
+
+WORDS = {'CRANE', 'SLATE', 'TRACE', 'CRATE', 'GRACE', 'BRACE', 'PLACE', 'SPACE'}
+
+
+class TestScoreCache:
+    """Tests pour ScoreCache et state_key."""
+
+    def test_state_key_ignores_order(self):
+        assert state_key(['CRANE', 'SLATE', 'TRACE']) == state_key({'TRACE', 'CRANE', 'SLATE'})
+        assert state_key(['CRANE', 'SLATE']) != state_key(['CRANE', 'TRACE'])
+        assert state_key([])[0] == 0
+
+    def test_lru_eviction_and_stats(self):
+        cache = ScoreCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1   # 'a' devient le plus récent
+        cache.put('c', 3)            # évince 'b'
+
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['evictions'] == 1
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / 'scores.pkl')
+        cache = ScoreCache(path=path)
+        cache.put(('CRANE', state_key(WORDS)), 2.5)
+        cache.save()
+
+        reloaded = ScoreCache(path=path)
+        assert reloaded.get(('CRANE', state_key(WORDS))) == 2.5
+        assert pickle.loads(pickle.dumps(reloaded)).get(('CRANE', state_key(WORDS))) == 2.5
+
+    def test_cache_shared_between_instances(self):
+        cache = ScoreCache()
+        first = EntropyStrategy(cache=cache)
+        word = first.choose_word(WORDS, ConstraintManager(), 2)
+
+        second = EntropyStrategy(cache=cache)
+        assert second.choose_word(WORDS, ConstraintManager(), 2) == word
+        assert second.stats['cache_hits'] > 0
+
+    def test_minimax_uses_cache(self):
+        cache = ScoreCache()
+        strategy = MinimaxStrategy(cache=cache)
+        targets_key = state_key(WORDS)
+        worst = strategy._calculate_worst_case('CRANE', WORDS, targets_key)
+
+        assert cache.get(('CRANE', targets_key)) == worst
@@ -2,12 +2,14 @@
 
 from .constraint_manager import ConstraintManager
 from .word_filter import WordFilter, FastWordFilter
+from .bitset_index import BitsetIndex
 from .solver import WordleCSPSolver, HybridSolver
 
 __all__ = [
     'ConstraintManager',
     'WordFilter',
     'FastWordFilter',
+    'BitsetIndex',
     'WordleCSPSolver',
     'HybridSolver',
 ]
@@ -0,0 +1,165 @@
+"""
+Index binaire du dictionnaire pour le filtrage par contraintes.
+
+Chaque mot reçoit un identifiant entier (ordre alphabétique). L'index garde
+un masque booléen NumPy par couple (position, lettre) et par couple
+(lettre, nombre minimum d'occurrences) : les contraintes vertes, jaunes,
+grises et de fréquence se traduisent alors en quelques ET logiques sur des
+tableaux de n booléens, au lieu de revalider chaque mot.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .constraint_manager import ConstraintManager
+from ..game.feedback import FeedbackResult
+
+WORD_LENGTH = 5
+
+
+class BitsetIndex:
+    """
+    Masques booléens du dictionnaire par position/lettre et par fréquence.
+
+    Les masques sont produits par mask() et reconvertis en mots par words_from_mask().
+    Une contrainte sur une lettre inconnue du dictionnaire donne un masque
+    vide (ou plein pour une négation).
+    """
+
+    def __init__(self, dictionary: Iterable[str]):
+        """
+        Construit l'index.
+
+        Args:
+            dictionary: Mots du dictionnaire
+        """
+        self.words: List[str] = sorted({word.upper() for word in dictionary})
+        self.ids: Dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        n = len(self.words)
+
+        # Seuls les mots de 5 lettres peuvent être valides
+        self.valid = np.array([len(word) == WORD_LENGTH for word in self.words], dtype=bool)
+
+        # (position, lettre) -> mots ayant cette lettre à cette position
+        self.by_position: Dict[Tuple[int, str], np.ndarray] = {}
+        # (lettre, k) -> mots contenant au moins k fois la lettre
+        self.by_count: Dict[Tuple[str, int], np.ndarray] = {}
+
+        for i, word in enumerate(self.words):
+            if not self.valid[i]:
+                continue
+            counts: Dict[str, int] = {}
+            for pos, letter in enumerate(word):
+                key = (pos, letter)
+                if key not in self.by_position:
+                    self.by_position[key] = np.zeros(n, dtype=bool)
+                self.by_position[key][i] = True
+                counts[letter] = counts.get(letter, 0) + 1
+            for letter, count in counts.items():
+                for k in range(1, count + 1):
+                    key = (letter, k)
+                    if key not in self.by_count:
+                        self.by_count[key] = np.zeros(n, dtype=bool)
+                    self.by_count[key][i] = True
+
+        self._empty = np.zeros(n, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def position_mask(self, position: int, letter: str) -> np.ndarray:
+        """Mots ayant `letter` à la position `position`."""
+        return self.by_position.get((position, letter), self._empty)
+
+    def count_mask(self, letter: str, min_count: int) -> np.ndarray:
+        """Mots contenant au moins `min_count` fois `letter`."""
+        return self.by_count.get((letter, min_count), self._empty)
+
+    def mask(
+        self,
+        constraint_manager: ConstraintManager,
+        base: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compile les contraintes en un masque de mots valides.
+
+        Équivalent à ConstraintManager.is_word_valid appliqué à chaque mot.
+
+        Args:
+            constraint_manager: Le gestionnaire de contraintes
+            base: Masque de départ (par exemple le résultat précédent, les
+                contraintes ne faisant que s'accumuler)
+
+        Returns:
+            Masque booléen (n,)
+        """
+        mask = self.valid.copy() if base is None else base & self.valid
+
+        # Contraintes vertes
+        for pos, letter in constraint_manager.correct_positions.items():
+            mask &= self.position_mask(pos, letter)
+
+        # Contraintes grises
+        for letter in constraint_manager.absent_letters:
+            mask &= ~self.count_mask(letter, 1)
+
+        # Contraintes jaunes : lettre présente, mais pas aux positions testées
+        for letter, forbidden_positions in constraint_manager.present_letters.items():
+            mask &= self.count_mask(letter, 1)
+            for pos in forbidden_positions:
+                mask &= ~self.position_mask(pos, letter)
+
+        # Contraintes de fréquence
+        for letter, (min_count, max_count) in constraint_manager.letter_counts.items():
+            if min_count > 0:
+                mask &= self.count_mask(letter, min_count)
+            if max_count is not None:
+                mask &= ~self.count_mask(letter, max_count + 1)
+
+        return mask
+
+    def feedback_mask(self, feedback: FeedbackResult) -> np.ndarray:
+        """
+        Masque des mots compatibles avec un seul feedback.
+
+        Permet un rétrécissement incrémental : après chaque tentative,
+        candidats &= feedback_mask(feedback).
+
+        Args:
+            feedback: Résultat d'une tentative
+
+        Returns:
+            Masque booléen (n,)
+        """
+        constraint_manager = ConstraintManager()
+        constraint_manager.apply_feedback(feedback)
+        return self.mask(constraint_manager)
+
+    def ids_mask(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Convertit un ensemble de mots en masque (les mots inconnus sont ignorés).
+
+        Args:
+            words: Mots à marquer
+
+        Returns:
+            Masque booléen (n,)
+        """
+        mask = np.zeros(len(self.words), dtype=bool)
+        ids = [self.ids[word] for word in words if word in self.ids]
+        mask[ids] = True
+        return mask
+
+    def words_from_mask(self, mask: np.ndarray) -> Set[str]:
+        """
+        Convertit un masque en ensemble de mots.
+
+        Args:
+            mask: Masque booléen (n,)
+
+        Returns:
+            Ensemble des mots marqués
+        """
+        words = self.words
+        return {words[i] for i in np.flatnonzero(mask)}
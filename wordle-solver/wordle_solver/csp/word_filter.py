@@ -7,13 +7,15 @@ en appliquant toutes les contraintes accumulées.
 
 from typing import Set, List
 from .constraint_manager import ConstraintManager
+from .bitset_index import BitsetIndex
 
 
 class WordFilter:
     """
     Filtre un dictionnaire de mots selon les contraintes CSP.
     
-    Optimisé pour performance avec des opérations sur sets.
+    Les contraintes sont compilées en ET logiques sur les masques d'un
+    BitsetIndex du dictionnaire.
     """
     
     def __init__(self, dictionary: Set[str]):
@@ -26,6 +28,7 @@ class WordFilter:
         # Normaliser tous les mots en majuscules
         self.full_dictionary = {word.upper() for word in dictionary}
         self.current_candidates = self.full_dictionary.copy()
+        self.index = BitsetIndex(self.full_dictionary)
         self._cache = {}
     
     def filter_by_constraints(self, constraint_manager: ConstraintManager) -> Set[str]:
@@ -46,10 +49,7 @@ class WordFilter:
         
         # CORRECTION: Toujours filtrer depuis le dictionnaire complet
         # pour éviter de perdre des mots à cause d'un état mutable
-        valid_words = {
-            word for word in self.full_dictionary
-            if constraint_manager.is_word_valid(word)
-        }
+        valid_words = self.index.words_from_mask(self.index.mask(constraint_manager))
         
         # Mettre en cache et mettre à jour current_candidates pour info
         self._cache[cache_key] = valid_words
@@ -68,10 +68,16 @@ class WordFilter:
         Returns:
             Ensemble de mots valides
         """
-        return {
+        words = {word.upper() for word in words}
+        indexed = self.index.ids_mask(words)
+        valid_words = self.index.words_from_mask(self.index.mask(constraint_manager, base=indexed))
+        
+        # Mots hors dictionnaire : validation mot par mot
+        valid_words.update(
             word for word in words
-            if constraint_manager.is_word_valid(word)
-        }
+            if word not in self.index.ids and constraint_manager.is_word_valid(word)
+        )
+        return valid_words
     
     def _create_cache_key(self, constraint_manager: ConstraintManager) -> str:
         """
@@ -223,7 +229,8 @@ class FastWordFilter:
     """
     Version optimisée du filtre de mots utilisant des techniques avancées.
     
-    Utilise des index pré-calculés pour accélérer les opérations de filtrage.
+    Sans cache ni état : chaque appel compile les contraintes en masques
+    sur l'index binaire pré-calculé du dictionnaire.
     """
     
     def __init__(self, dictionary: Set[str]):
@@ -234,40 +241,11 @@ class FastWordFilter:
             dictionary: Ensemble de mots valides
         """
         self.dictionary = {word.upper() for word in dictionary}
-        
-        # Index par position
-        self.by_position: dict[int, dict[str, Set[str]]] = self._build_position_index()
-        
-        # Index par lettre présente
-        self.by_letter: dict[str, Set[str]] = self._build_letter_index()
-    
-    def _build_position_index(self) -> dict[int, dict[str, Set[str]]]:
-        """Construit un index des mots par lettre à chaque position."""
-        index = {i: {} for i in range(5)}
-        
-        for word in self.dictionary:
-            for pos, letter in enumerate(word):
-                if letter not in index[pos]:
-                    index[pos][letter] = set()
-                index[pos][letter].add(word)
-        
-        return index
-    
-    def _build_letter_index(self) -> dict[str, Set[str]]:
-        """Construit un index des mots contenant chaque lettre."""
-        index = {}
-        
-        for word in self.dictionary:
-            for letter in set(word):
-                if letter not in index:
-                    index[letter] = set()
-                index[letter].add(word)
-        
-        return index
+        self.index = BitsetIndex(self.dictionary)
     
     def filter_by_constraints(self, constraint_manager: ConstraintManager) -> Set[str]:
         """
-        Filtre rapidement selon les contraintes en utilisant les index.
+        Filtre rapidement selon les contraintes en utilisant l'index.
         
         Args:
             constraint_manager: Le gestionnaire de contraintes
@@ -275,29 +253,4 @@ class FastWordFilter:
         Returns:
             Ensemble de mots valides
         """
-        candidates = self.dictionary.copy()
-        
-        # Filtrer par positions correctes (très sélectif)
-        for pos, letter in constraint_manager.correct_positions.items():
-            if letter in self.by_position[pos]:
-                candidates &= self.by_position[pos][letter]
-            else:
-                return set()  # Aucun mot possible
-        
-        # Filtrer par lettres présentes
-        for letter in constraint_manager.present_letters.keys():
-            if letter in self.by_letter:
-                candidates &= self.by_letter[letter]
-            else:
-                return set()
-        
-        # Filtrer par lettres absentes
-        for letter in constraint_manager.absent_letters:
-            if letter in self.by_letter:
-                candidates -= self.by_letter[letter]
-        
-        # Validation finale pour les contraintes complexes
-        return {
-            word for word in candidates
-            if constraint_manager.is_word_valid(word)
-        }
+        return self.index.words_from_mask(self.index.mask(constraint_manager))
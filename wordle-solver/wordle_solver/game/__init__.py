@@ -3,6 +3,14 @@
 from .feedback import Feedback, FeedbackResult, generate_feedback
 from .wordle_game import WordleGame
 from .validator import WordValidator
+from .patterns import (
+    PatternMatrix,
+    encode_feedback,
+    decode_pattern,
+    get_pattern_matrix,
+    register_pattern_matrix,
+    find_pattern_matrix,
+)
 
 __all__ = [
     'Feedback',
@@ -10,4 +18,10 @@ __all__ = [
     'generate_feedback',
     'WordleGame',
     'WordValidator',
+    'PatternMatrix',
+    'encode_feedback',
+    'decode_pattern',
+    'get_pattern_matrix',
+    'register_pattern_matrix',
+    'find_pattern_matrix',
 ]
@@ -0,0 +1,473 @@
+"""
+Matrice précalculée des patterns de feedback.
+
+Pour un dictionnaire de n mots, la matrice (n, n) en uint8 contient le
+feedback de chaque couple (proposition, cible) encodé en base 3 :
+ABSENT=0, PRESENT=1, CORRECT=2, la position i ayant le poids 3**i
+(243 patterns possibles, 242 = mot trouvé).
+
+La matrice est calculée une fois par liste de mots, sauvegardée en .npy puis
+ouverte en memmap : elle est partagée entre processus et les stratégies
+scorent tout le dictionnaire avec quelques bincount vectorisés au lieu
+d'appeler generate_feedback pour chaque couple.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .feedback import Feedback, FeedbackResult
+
+WORD_LENGTH = 5
+NUM_PATTERNS = 3 ** WORD_LENGTH
+ALL_CORRECT = NUM_PATTERNS - 1
+
+# Valeur de chaque feedback dans l'encodage
+FEEDBACK_VALUES = {
+    Feedback.ABSENT: 0,
+    Feedback.PRESENT: 1,
+    Feedback.CORRECT: 2,
+}
+
+POWERS = 3 ** np.arange(WORD_LENGTH, dtype=np.int64)
+
+# Dossier par défaut des matrices (surchargeable par variable d'environnement)
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get('WORDLE_PATTERN_CACHE', Path.home() / '.cache' / 'wordle_solver')
+)
+
+
+def encode_feedback(feedback: FeedbackResult) -> int:
+    """
+    Encode un FeedbackResult en entier base 3.
+
+    Args:
+        feedback: Résultat de feedback
+
+    Returns:
+        Pattern entre 0 et 242
+    """
+    return sum(FEEDBACK_VALUES[fb] * 3 ** i for i, fb in enumerate(feedback.feedbacks))
+
+
+def decode_pattern(pattern: int) -> str:
+    """
+    Décode un pattern en chaîne "GYBBG".
+
+    Args:
+        pattern: Pattern entre 0 et 242
+
+    Returns:
+        Chaîne de 5 caractères (G=vert, Y=jaune, B=gris)
+    """
+    symbols = 'BYG'
+    result = []
+    for _ in range(WORD_LENGTH):
+        result.append(symbols[pattern % 3])
+        pattern //= 3
+    return ''.join(result)
+
+
+def _letter_codes(words: Sequence[str]) -> np.ndarray:
+    """
+    Convertit des mots en tableau (n, 5) de codes de lettres.
+
+    Les codes sont compactés (0 à nombre de lettres distinctes - 1) : le
+    dictionnaire français contient des ligatures hors ASCII (Œ, Æ).
+    """
+    chars = np.array(words, dtype=f'<U{WORD_LENGTH}').view(np.uint32)
+    _, codes = np.unique(chars, return_inverse=True)
+    return codes.reshape(len(words), WORD_LENGTH).astype(np.uint8)
+
+
+def compute_patterns(guesses: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Calcule les patterns d'un bloc de propositions contre des cibles.
+
+    Reproduit exactement generate_feedback (lettres dupliquées comprises) :
+    une lettre mal placée est jaune tant que la cible contient encore des
+    occurrences non vertes de cette lettre non consommées par les positions
+    précédentes de la proposition.
+
+    Args:
+        guesses: Codes de lettres (g, 5)
+        targets: Codes de lettres (t, 5)
+
+    Returns:
+        Patterns uint8 (g, t)
+    """
+    g, t = len(guesses), len(targets)
+
+    # Verts (g, t, 5)
+    green = guesses[:, None, :] == targets[None, :, :]
+
+    # Occurrences de chaque lettre dans les cibles (t, alphabet)
+    alphabet = int(max(guesses.max(initial=0), targets.max(initial=0))) + 1
+    target_counts = np.zeros((t, alphabet), dtype=np.int8)
+    for j in range(WORD_LENGTH):
+        np.add.at(target_counts, (np.arange(t), targets[:, j]), 1)
+
+    # same[k, i, j] : la proposition k a la même lettre en i et en j
+    same = guesses[:, :, None] == guesses[:, None, :]
+
+    patterns = np.zeros((g, t), dtype=np.uint8)
+    for i in range(WORD_LENGTH):
+        green_i = green[:, :, i]
+        # Occurrences de la lettre dans la cible, hors positions vertes, moins
+        # celles déjà consommées par les positions précédentes non vertes.
+        # Seules les propositions à lettre répétée sont corrigées.
+        available = target_counts[:, guesses[:, i]].T
+        for j in range(WORD_LENGTH):
+            if j == i:
+                continue
+            rows = np.flatnonzero(same[:, i, j])
+            if not len(rows):
+                continue
+            if j < i:
+                available[rows] -= 1
+            else:
+                available[rows] -= green[rows, :, j]
+        present = ~green_i & (available > 0)
+        patterns += (2 * green_i + present).astype(np.uint8) * np.uint8(POWERS[i])
+
+    return patterns.astype(np.uint8)
+
+
+def dictionary_hash(words: Sequence[str]) -> str:
+    """Empreinte d'une liste de mots (détecte les matrices périmées)."""
+    return hashlib.sha1('\n'.join(words).encode('utf-8')).hexdigest()[:16]
+
+
+class PatternMatrix:
+    """
+    Matrice de patterns proposition x cible sur un dictionnaire trié.
+
+    Les lignes et les colonnes suivent le même ordre (mots triés) ; les
+    fonctions de score prennent des tableaux d'indices.
+    """
+
+    def __init__(self, words: Sequence[str], matrix: np.ndarray, path: Optional[str] = None):
+        """
+        Initialise la matrice.
+
+        Args:
+            words: Mots triés (majuscules, 5 lettres)
+            matrix: Patterns uint8 (n, n)
+            path: Fichier .npy d'origine si la matrice est en memmap
+        """
+        self.words: List[str] = list(words)
+        self.index: Dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        self.matrix = matrix
+        self.path = path
+
+    def __getstate__(self):
+        # Une matrice sur disque est rouverte en memmap par le processus qui
+        # la reçoit au lieu d'être copiée
+        state = self.__dict__.copy()
+        if self.path is not None:
+            state['matrix'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.matrix is None:
+            self.matrix = np.load(self.path, mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+
+    @classmethod
+    def build(
+        cls,
+        words: Iterable[str],
+        path: Optional[str] = None,
+        block_size: int = 512
+    ) -> "PatternMatrix":
+        """
+        Calcule la matrice d'un dictionnaire.
+
+        Args:
+            words: Mots du dictionnaire
+            path: Fichier .npy de destination (calcul en mémoire si None)
+            block_size: Nombre de propositions calculées par bloc
+
+        Returns:
+            PatternMatrix
+        """
+        words = sorted({word.upper() for word in words})
+        codes = _letter_codes(words)
+        n = len(words)
+
+        if path is None:
+            matrix = np.empty((n, n), dtype=np.uint8)
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            matrix = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.uint8, shape=(n, n))
+
+        for start in range(0, n, block_size):
+            matrix[start:start + block_size] = compute_patterns(codes[start:start + block_size], codes)
+
+        if path is not None:
+            matrix.flush()
+            del matrix
+            os.replace(tmp_path, path)
+            matrix = np.load(path, mmap_mode='r')
+
+        return cls(words, matrix, path)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        words: Iterable[str],
+        cache_dir: Optional[str] = None,
+        name: str = 'patterns'
+    ) -> "PatternMatrix":
+        """
+        Ouvre la matrice en memmap depuis le cache, ou la calcule.
+
+        Le nom de fichier contient l'empreinte de la liste de mots : une
+        liste modifiée produit une nouvelle matrice.
+
+        Args:
+            words: Mots du dictionnaire
+            cache_dir: Dossier du cache (DEFAULT_CACHE_DIR par défaut)
+            name: Préfixe du fichier (par exemple la langue)
+
+        Returns:
+            PatternMatrix
+        """
+        words = sorted({word.upper() for word in words})
+        matrix = cls.load_cached(words, cache_dir, name)
+        if matrix is not None:
+            return matrix
+        return cls.build(words, str(cls._cache_path(words, cache_dir, name)))
+
+    @classmethod
+    def load_cached(
+        cls,
+        words: Iterable[str],
+        cache_dir: Optional[str] = None,
+        name: str = 'patterns'
+    ) -> Optional["PatternMatrix"]:
+        """
+        Ouvre la matrice en memmap si elle est déjà dans le cache (sans la calculer).
+
+        Args:
+            words: Mots du dictionnaire
+            cache_dir: Dossier du cache (DEFAULT_CACHE_DIR par défaut)
+            name: Préfixe du fichier (par exemple la langue)
+
+        Returns:
+            PatternMatrix, ou None si elle n'a pas encore été calculée
+        """
+        words = sorted({word.upper() for word in words})
+        path = cls._cache_path(words, cache_dir, name)
+        if not path.exists():
+            return None
+        return cls(words, np.load(path, mmap_mode='r'), str(path))
+
+    @staticmethod
+    def _cache_path(words: List[str], cache_dir: Optional[str], name: str) -> Path:
+        """Chemin de la matrice dans le cache (mots triés, en majuscules)."""
+        cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        return cache_dir / f"{name}_{dictionary_hash(words)}.npy"
+
+    def indices(self, words: Iterable[str]) -> np.ndarray:
+        """
+        Convertit des mots en indices.
+
+        Args:
+            words: Mots présents dans la matrice
+
+        Returns:
+            Tableau d'indices int64
+
+        Raises:
+            KeyError: Si un mot est absent de la matrice
+        """
+        index = self.index
+        return np.fromiter((index[word] for word in words), dtype=np.int64)
+
+    def covers(self, words: Iterable[str]) -> bool:
+        """Indique si tous les mots sont dans la matrice."""
+        index = self.index
+        return all(word in index for word in words)
+
+    def pattern(self, guess: str, target: str) -> int:
+        """Retourne le pattern d'un couple (proposition, cible)."""
+        return int(self.matrix[self.index[guess], self.index[target]])
+
+    def pattern_counts(
+        self,
+        guess_indices: np.ndarray,
+        target_indices: np.ndarray,
+        block_size: int = 1024
+    ) -> np.ndarray:
+        """
+        Compte, pour chaque proposition, les cibles de chaque pattern.
+
+        Args:
+            guess_indices: Indices des propositions (g,)
+            target_indices: Indices des cibles (t,)
+            block_size: Nombre de propositions traitées par bloc
+
+        Returns:
+            Comptages int64 (g, 243)
+        """
+        counts = np.empty((len(guess_indices), NUM_PATTERNS), dtype=np.int64)
+        target_indices = np.sort(target_indices)
+        offsets = (np.arange(block_size) * NUM_PATTERNS)[:, None]
+
+        for start in range(0, len(guess_indices), block_size):
+            rows = guess_indices[start:start + block_size]
+            block = self.matrix[rows[:, None], target_indices[None, :]] + offsets[:len(rows)]
+            counts[start:start + len(rows)] = np.bincount(
+                block.ravel(), minlength=len(rows) * NUM_PATTERNS
+            ).reshape(len(rows), NUM_PATTERNS)
+
+        return counts
+
+    def group_sizes(
+        self,
+        guess_indices: np.ndarray,
+        target_indices: np.ndarray,
+        block_size: int = 1024
+    ):
+        """
+        Tailles des groupes de cibles (un groupe par pattern obtenu).
+
+        Avec moins de cibles que de patterns possibles, les patterns de
+        chaque ligne sont triés et comptés par plages, ce qui évite la table
+        dense (g, 243) de pattern_counts.
+
+        Args:
+            guess_indices: Indices des propositions (g,)
+            target_indices: Indices des cibles (t,)
+            block_size: Nombre de propositions traitées par bloc
+
+        Returns:
+            Tuple (owners, sizes) : indice de la proposition (croissant) et
+            taille de chaque groupe
+        """
+        t = len(target_indices)
+        if t >= NUM_PATTERNS:
+            counts = self.pattern_counts(guess_indices, target_indices, block_size)
+            owners, patterns = np.nonzero(counts)
+            return owners, counts[owners, patterns]
+
+        target_indices = np.sort(target_indices)
+        owners, sizes = [], []
+        for start in range(0, len(guess_indices), block_size):
+            rows = guess_indices[start:start + block_size]
+            block = np.sort(self.matrix[rows[:, None], target_indices[None, :]], axis=1)
+            new_group = np.ones(block.shape, dtype=bool)
+            new_group[:, 1:] = block[:, 1:] != block[:, :-1]
+            starts = np.flatnonzero(new_group)
+            owners.append(starts // t + start)
+            sizes.append(np.diff(starts, append=block.size))
+        return np.concatenate(owners), np.concatenate(sizes)
+
+    def entropy_scores(self, guess_indices: np.ndarray, target_indices: np.ndarray) -> np.ndarray:
+        """
+        Entropie (bits) de la distribution des patterns de chaque proposition.
+
+        H = log2(n) - Σ c log2(c) / n, sur les tailles de groupes c.
+
+        Returns:
+            Tableau float64 (g,)
+        """
+        owners, sizes = self.group_sizes(guess_indices, target_indices)
+        total = len(target_indices)
+        weights = sizes * np.log2(sizes)
+        return np.log2(total) - np.bincount(owners, weights, len(guess_indices)) / total
+
+    def worst_case_scores(self, guess_indices: np.ndarray, target_indices: np.ndarray) -> np.ndarray:
+        """
+        Taille du plus grand groupe de cibles restant après chaque proposition.
+
+        Returns:
+            Tableau int64 (g,)
+        """
+        owners, sizes = self.group_sizes(guess_indices, target_indices)
+        row_starts = np.searchsorted(owners, np.arange(len(guess_indices)))
+        return np.maximum.reduceat(sizes, row_starts)
+
+    def expected_size_scores(self, guess_indices: np.ndarray, target_indices: np.ndarray) -> np.ndarray:
+        """
+        Taille espérée du groupe restant (Σ taille² / n) pour chaque proposition.
+
+        Returns:
+            Tableau float64 (g,)
+        """
+        owners, sizes = self.group_sizes(guess_indices, target_indices)
+        squares = (sizes * sizes).astype(np.float64)
+        return np.bincount(owners, squares, len(guess_indices)) / len(target_indices)
+
+    def num_groups(self, guess_indices: np.ndarray, target_indices: np.ndarray) -> np.ndarray:
+        """
+        Nombre de patterns distincts obtenus par chaque proposition.
+
+        Returns:
+            Tableau int64 (g,)
+        """
+        owners, _ = self.group_sizes(guess_indices, target_indices)
+        return np.bincount(owners, minlength=len(guess_indices))
+
+
+# Matrices chargées dans le processus, par nom
+_loaded: Dict[str, PatternMatrix] = {}
+
+
+def get_pattern_matrix(language: str = 'en', cache_dir: Optional[str] = None) -> PatternMatrix:
+    """
+    Retourne la matrice d'une langue (chargée une fois par processus).
+
+    Args:
+        language: 'en' ou 'fr'
+        cache_dir: Dossier du cache (optionnel)
+
+    Returns:
+        PatternMatrix
+    """
+    language = language.lower()
+    if language not in _loaded:
+        from ..dictionaries import DictionaryLoader
+        words = DictionaryLoader.load_language(language)
+        register_pattern_matrix(
+            language, PatternMatrix.load_or_build(words, cache_dir, name=language)
+        )
+    return _loaded[language]
+
+
+def register_pattern_matrix(name: str, matrix: PatternMatrix):
+    """
+    Rend une matrice disponible pour find_pattern_matrix.
+
+    Args:
+        name: Nom de la matrice (langue, dictionnaire personnalisé...)
+        matrix: Matrice à enregistrer
+    """
+    _loaded[name] = matrix
+
+
+def find_pattern_matrix(*word_sets: Iterable[str]) -> Optional[PatternMatrix]:
+    """
+    Cherche parmi les matrices chargées une matrice contenant tous les mots.
+
+    Args:
+        *word_sets: Ensembles de mots (propositions, cibles...)
+
+    Returns:
+        PatternMatrix, ou None si aucune ne convient
+    """
+    for matrix in _loaded.values():
+        if all(matrix.covers(words) for words in word_sets):
+            return matrix
+    return None
@@ -4,7 +4,16 @@ from .base_strategy import BaseStrategy, SimpleStrategy, RandomStrategy
 from .frequency_strategy import FrequencyStrategy, PositionalFrequencyStrategy
 from .entropy_strategy import EntropyStrategy, FastEntropyStrategy
 from .minimax_strategy import MinimaxStrategy, ExpectedSizeStrategy
+from .lookahead_strategy import LookaheadStrategy
+from .score_cache import ScoreCache, state_key, get_shared_cache, get_cache_stats
 from .comparator import StrategyComparator, quick_benchmark, GameResult, StrategyStats
+from .registry import STRATEGY_FACTORIES, create_strategy, available_strategies
+from .decision_tree import (
+    DecisionTree,
+    compile_decision_tree,
+    decision_tree_path,
+    load_decision_tree,
+)
 
 __all__ = [
     # Classes de base
@@ -24,9 +33,29 @@ __all__ = [
     'MinimaxStrategy',
     'ExpectedSizeStrategy',
     
+    # Recherche à plusieurs coups
+    'LookaheadStrategy',
+    
+    # Cache des scores
+    'ScoreCache',
+    'state_key',
+    'get_shared_cache',
+    'get_cache_stats',
+    
     # Comparaison
     'StrategyComparator',
     'quick_benchmark',
     'GameResult',
     'StrategyStats',
+    
+    # Registre
+    'STRATEGY_FACTORIES',
+    'create_strategy',
+    'available_strategies',
+    
+    # Arbres de décision
+    'DecisionTree',
+    'compile_decision_tree',
+    'decision_tree_path',
+    'load_decision_tree',
 ]
@@ -8,6 +8,7 @@ la méthode choose_word().
 from abc import ABC, abstractmethod
 from typing import Set, Optional, Dict, Any
 from ..csp import ConstraintManager
+from ..game import PatternMatrix, find_pattern_matrix
 
 
 class BaseStrategy(ABC):
@@ -26,6 +27,7 @@ class BaseStrategy(ABC):
             name: Nom de la stratégie
         """
         self.name = name
+        self.pattern_matrix: Optional[PatternMatrix] = None
         self.stats = {
             'words_evaluated': 0,
             'time_taken': 0.0,
@@ -92,6 +94,27 @@ class BaseStrategy(ABC):
         """
         return f"Stratégie {self.name} a choisi '{chosen_word}' parmi {len(possible_words)} mots possibles."
     
+    def _get_pattern_matrix(self, *word_sets, **kwargs) -> Optional[PatternMatrix]:
+        """
+        Retourne la matrice de patterns couvrant tous les mots donnés.
+        
+        Priorité : kwargs['pattern_matrix'], puis la matrice de la stratégie,
+        puis les matrices chargées dans le processus.
+        
+        Args:
+            *word_sets: Ensembles de mots (propositions, cibles...)
+            **kwargs: Peut contenir 'pattern_matrix'
+            
+        Returns:
+            PatternMatrix, ou None (calcul mot par mot)
+        """
+        matrix = kwargs.get('pattern_matrix') or self.pattern_matrix
+        if matrix is None:
+            return find_pattern_matrix(*word_sets)
+        if all(matrix.covers(words) for words in word_sets):
+            return matrix
+        return None
+    
     def reset_stats(self):
         """Réinitialise les statistiques de la stratégie."""
         self.stats = {
@@ -5,14 +5,16 @@ Permet de tester et comparer les performances de différentes stratégies
 sur un ensemble de mots cibles.
 """
 
-from typing import List, Dict, Set, Any, Optional
+from typing import List, Dict, Set, Any, Optional, Iterator
 from dataclasses import dataclass, field
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from collections import defaultdict
 import statistics
 
 from .base_strategy import BaseStrategy
-from ..game import WordleGame, generate_feedback
+from ..game import WordleGame, generate_feedback, PatternMatrix, register_pattern_matrix, find_pattern_matrix
 from ..csp import ConstraintManager, HybridSolver
 from ..dictionaries import DictionaryLoader
 
@@ -47,6 +49,9 @@ class StrategyStats:
     games_won: int = 0
     total_attempts: int = 0
     total_time: float = 0.0
+    total_guesses: int = 0
+    wall_time: float = 0.0
+    num_workers: int = 1
     attempt_distribution: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
     failed_words: List[str] = field(default_factory=list)
     
@@ -65,6 +70,16 @@ class StrategyStats:
         """Temps moyen par partie."""
         return (self.total_time / self.games_played) if self.games_played > 0 else 0.0
     
+    @property
+    def games_per_second(self) -> float:
+        """Débit en parties par seconde (temps réel, tous workers confondus)."""
+        return (self.games_played / self.wall_time) if self.wall_time > 0 else 0.0
+    
+    @property
+    def guesses_per_second(self) -> float:
+        """Débit en tentatives par seconde (temps réel)."""
+        return (self.total_guesses / self.wall_time) if self.wall_time > 0 else 0.0
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convertit en dictionnaire."""
         return {
@@ -74,6 +89,10 @@ class StrategyStats:
             'win_rate': round(self.win_rate, 2),
             'average_attempts': round(self.average_attempts, 2),
             'average_time': round(self.average_time, 3),
+            'wall_time': round(self.wall_time, 3),
+            'num_workers': self.num_workers,
+            'games_per_second': round(self.games_per_second, 2),
+            'guesses_per_second': round(self.guesses_per_second, 2),
             'attempt_distribution': dict(self.attempt_distribution),
             'failed_words': self.failed_words
         }
@@ -89,25 +108,48 @@ class StrategyComparator:
     - Générer des rapports comparatifs
     """
     
-    def __init__(self, dictionary: Set[str], language: str = "en"):
+    def __init__(self, dictionary: Set[str], language: str = "en", use_pattern_matrix: Optional[bool] = None):
         """
         Initialise le comparateur.
         
         Args:
             dictionary: Dictionnaire de mots valides
             language: Langue ('en' ou 'fr')
+            use_pattern_matrix: True pour charger ou calculer la matrice de
+                patterns du dictionnaire (calcul long la première fois) ;
+                None (par défaut) pour ne l'utiliser que si elle est déjà
+                chargée ou dans le cache ; False pour s'en passer
         """
         self.dictionary = dictionary
         self.language = language
         self.solver = HybridSolver(dictionary)
+        self.pattern_matrix = None
+        if use_pattern_matrix is None:
+            self.pattern_matrix = find_pattern_matrix(dictionary)
+            if self.pattern_matrix is None:
+                self.pattern_matrix = PatternMatrix.load_cached(dictionary, name=language)
+                if self.pattern_matrix is not None:
+                    register_pattern_matrix(language, self.pattern_matrix)
+        elif use_pattern_matrix:
+            self.pattern_matrix = PatternMatrix.load_or_build(dictionary, name=language)
+            register_pattern_matrix(language, self.pattern_matrix)
         self.results: List[GameResult] = []
         self.stats_by_strategy: Dict[str, StrategyStats] = {}
     
+    def __getstate__(self):
+        # Envoyé aux workers (méthode spawn) : inutile de copier les résultats
+        state = self.__dict__.copy()
+        state['results'] = []
+        state['stats_by_strategy'] = {}
+        return state
+    
     def test_strategy(
         self,
         strategy: BaseStrategy,
         target_words: List[str],
-        verbose: bool = False
+        verbose: bool = False,
+        num_workers: int = 1,
+        chunk_size: Optional[int] = None
     ) -> StrategyStats:
         """
         Teste une stratégie sur un ensemble de mots.
@@ -116,34 +158,89 @@ class StrategyComparator:
             strategy: La stratégie à tester
             target_words: Liste de mots cibles
             verbose: Si True, affiche les progrès
+            num_workers: Nombre de processus (1 = séquentiel)
+            chunk_size: Nombre de mots envoyés à la fois à un worker
             
         Returns:
             Statistiques de la stratégie
         """
-        stats = StrategyStats(strategy_name=strategy.name)
+        stats = StrategyStats(strategy_name=strategy.name, num_workers=num_workers)
+        start_time = time.time()
         
-        for i, target in enumerate(target_words):
+        results = self.iter_results(strategy, target_words, num_workers, chunk_size)
+        for i, result in enumerate(results):
             if verbose and (i + 1) % 10 == 0:
                 print(f"  Progression: {i+1}/{len(target_words)} mots testés...")
             
-            result = self._play_game(strategy, target)
             self.results.append(result)
             
             # Mettre à jour les stats
             stats.games_played += 1
             stats.total_time += result.time_taken
+            stats.total_guesses += result.attempts
             
             if result.won:
                 stats.games_won += 1
                 stats.total_attempts += result.attempts
                 stats.attempt_distribution[result.attempts] += 1
             else:
-                stats.failed_words.append(target)
+                stats.failed_words.append(result.target_word)
                 stats.attempt_distribution[0] += 1  # 0 = échec
         
+        stats.wall_time = time.time() - start_time
         self.stats_by_strategy[strategy.name] = stats
         return stats
     
+    def iter_results(
+        self,
+        strategy: BaseStrategy,
+        target_words: List[str],
+        num_workers: int = 1,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[GameResult]:
+        """
+        Joue les parties et produit les résultats au fur et à mesure.
+        
+        En mode parallèle, les mots cibles sont répartis par paquets entre
+        les processus ; l'ordre des résultats suit alors leur arrivée. Avec
+        la méthode fork, le dictionnaire, l'index et la matrice de patterns
+        (memmap) sont partagés sans copie ; sinon la matrice est rouverte
+        en memmap par chaque worker.
+        
+        Args:
+            strategy: La stratégie à tester
+            target_words: Liste de mots cibles
+            num_workers: Nombre de processus (1 = séquentiel)
+            chunk_size: Nombre de mots par paquet (par défaut ~4 paquets par worker)
+            
+        Yields:
+            GameResult de chaque partie
+        """
+        if num_workers <= 1 or len(target_words) <= 1:
+            for target in target_words:
+                yield self._play_game(strategy, target)
+            return
+        
+        if chunk_size is None:
+            chunk_size = max(1, len(target_words) // (num_workers * 4))
+        chunks = [
+            target_words[i:i + chunk_size]
+            for i in range(0, len(target_words), chunk_size)
+        ]
+        
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self, strategy)
+        ) as executor:
+            futures = [executor.submit(_play_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+    
     def _play_game(self, strategy: BaseStrategy, target_word: str) -> GameResult:
         """
         Joue une partie avec une stratégie donnée.
@@ -216,7 +313,8 @@ class StrategyComparator:
         self,
         strategies: List[BaseStrategy],
         target_words: List[str],
-        verbose: bool = True
+        verbose: bool = True,
+        num_workers: int = 1
     ) -> Dict[str, StrategyStats]:
         """
         Compare plusieurs stratégies sur les mêmes mots.
@@ -225,6 +323,7 @@ class StrategyComparator:
             strategies: Liste de stratégies à comparer
             target_words: Mots cibles pour les tests
             verbose: Afficher les progrès
+            num_workers: Nombre de processus par stratégie (1 = séquentiel)
             
         Returns:
             Dictionnaire {nom_stratégie: stats}
@@ -232,20 +331,21 @@ class StrategyComparator:
         if verbose:
             print(f"\n{'='*70}")
             print(f"COMPARAISON DE {len(strategies)} STRATÉGIES")
-            print(f"Mots cibles: {len(target_words)}")
+            print(f"Mots cibles: {len(target_words)} | Workers: {num_workers}")
             print(f"{'='*70}\n")
         
         for i, strategy in enumerate(strategies, 1):
             if verbose:
                 print(f"[{i}/{len(strategies)}] Test de : {strategy.name}")
             
-            self.test_strategy(strategy, target_words, verbose=False)
+            self.test_strategy(strategy, target_words, verbose=False, num_workers=num_workers)
             
             if verbose:
                 stats = self.stats_by_strategy[strategy.name]
                 print(f"  ✓ Taux de victoire: {stats.win_rate:.1f}%")
                 print(f"  ✓ Moyenne tentatives: {stats.average_attempts:.2f}")
-                print(f"  ✓ Temps moyen: {stats.average_time:.3f}s\n")
+                print(f"  ✓ Temps moyen: {stats.average_time:.3f}s")
+                print(f"  ✓ Débit: {stats.games_per_second:.1f} parties/s ({stats.wall_time:.1f}s)\n")
         
         return self.stats_by_strategy
     
@@ -274,7 +374,7 @@ class StrategyComparator:
         # Résumé
         lines.append("📊 RÉSUMÉ")
         lines.append("-" * 80)
-        lines.append(f"{'Stratégie':<30} {'Victoires':<12} {'Moy.':<8} {'Temps':<10}")
+        lines.append(f"{'Stratégie':<30} {'Victoires':<12} {'Moy.':<8} {'Temps':<10} {'Débit':<10}")
         lines.append("-" * 80)
         
         for stats in sorted_stats:
@@ -283,6 +383,7 @@ class StrategyComparator:
                 f"{stats.win_rate:>5.1f}% ({stats.games_won}/{stats.games_played})"
                 f"    {stats.average_attempts:>4.2f}"
                 f"    {stats.average_time:>6.3f}s"
+                f"   {stats.games_per_second:>6.1f}/s"
             )
         
         lines.append("")
@@ -340,16 +441,20 @@ def quick_benchmark(
     strategies: List[BaseStrategy],
     n_words: int = 20,
     language: str = "en",
-    verbose: bool = True
+    verbose: bool = True,
+    num_workers: int = 1,
+    use_pattern_matrix: Optional[bool] = None
 ) -> Dict[str, StrategyStats]:
     """
     Benchmark rapide de stratégies.
     
     Args:
         strategies: Liste de stratégies à tester
-        n_words: Nombre de mots à tester
+        n_words: Nombre de mots à tester (0 = tout le dictionnaire)
         language: Langue ('en' ou 'fr')
         verbose: Afficher les résultats
+        num_workers: Nombre de processus par stratégie (1 = séquentiel)
+        use_pattern_matrix: Voir StrategyComparator
         
     Returns:
         Statistiques par stratégie
@@ -359,14 +464,41 @@ def quick_benchmark(
     
     # Sélectionner des mots représentatifs
     words_list = sorted(dictionary)
-    step = max(1, len(words_list) // n_words)
-    test_words = words_list[::step][:n_words]
+    if n_words:
+        step = max(1, len(words_list) // n_words)
+        test_words = words_list[::step][:n_words]
+    else:
+        test_words = words_list
     
     # Comparer
-    comparator = StrategyComparator(dictionary, language)
-    stats = comparator.compare_strategies(strategies, test_words, verbose=verbose)
+    comparator = StrategyComparator(dictionary, language, use_pattern_matrix=use_pattern_matrix)
+    stats = comparator.compare_strategies(
+        strategies, test_words, verbose=verbose, num_workers=num_workers
+    )
     
     if verbose:
         print(comparator.generate_report(detailed=True))
     
     return stats
+
+
+# État des workers du mode parallèle (un comparateur et une stratégie par processus)
+_worker_comparator: Optional[StrategyComparator] = None
+_worker_strategy: Optional[BaseStrategy] = None
+
+
+def _init_worker(comparator: StrategyComparator, strategy: BaseStrategy):
+    """Initialise un worker avec le comparateur et la stratégie à tester."""
+    global _worker_comparator, _worker_strategy
+    _worker_comparator = comparator
+    _worker_strategy = strategy
+    if comparator.pattern_matrix is not None:
+        register_pattern_matrix(comparator.language, comparator.pattern_matrix)
+
+
+def _play_chunk(target_words: List[str]) -> List[GameResult]:
+    """Joue un paquet de parties dans un worker."""
+    return [
+        _worker_comparator._play_game(_worker_strategy, target)
+        for target in target_words
+    ]
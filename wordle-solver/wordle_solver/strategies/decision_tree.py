@@ -0,0 +1,356 @@
+"""
+Arbres de décision pré-compilés par stratégie.
+
+Pour un dictionnaire et une stratégie donnés, le mot proposé ne dépend que
+de l'historique des feedbacks. Le compilateur déroule la stratégie sur tous
+les mots cibles et enregistre le mot choisi à chaque nœud ; les enfants
+d'un nœud sont indexés par le pattern de feedback obtenu (encodage base 3
+de patterns.py). Une suggestion devient une descente dans l'arbre.
+
+Format sur disque (.npz) :
+- words : mots référencés (tableau de chaînes)
+- guesses : indice dans words du mot proposé à chaque nœud (int32)
+- child_offsets : début des enfants de chaque nœud (int32, CSR)
+- child_patterns : pattern menant à chaque enfant, triés par nœud (uint8)
+- child_nodes : nœud enfant (int32)
+- metadata : JSON (langue, stratégie, empreinte du dictionnaire...)
+"""
+
+import copy
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .base_strategy import BaseStrategy
+from ..csp import ConstraintManager, HybridSolver
+from ..game import FeedbackResult, generate_feedback, encode_feedback, find_pattern_matrix
+from ..game.patterns import ALL_CORRECT, DEFAULT_CACHE_DIR, dictionary_hash
+
+# Nombre maximal de tentatives d'une partie
+MAX_ATTEMPTS = 6
+
+
+class DecisionTree:
+    """
+    Arbre de décision compilé : un mot par nœud, un enfant par pattern.
+
+    Le nœud 0 est la racine (première tentative).
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        guesses: np.ndarray,
+        child_offsets: np.ndarray,
+        child_patterns: np.ndarray,
+        child_nodes: np.ndarray,
+        metadata: Optional[Dict] = None
+    ):
+        """
+        Initialise l'arbre.
+
+        Args:
+            words: Mots référencés par guesses
+            guesses: Indice du mot proposé à chaque nœud
+            child_offsets: Début des enfants de chaque nœud (taille nœuds + 1)
+            child_patterns: Pattern de chaque enfant (trié au sein d'un nœud)
+            child_nodes: Indice de chaque enfant
+            metadata: Informations de compilation
+        """
+        self.words = list(words)
+        self.guesses = guesses
+        self.child_offsets = child_offsets
+        self.child_patterns = child_patterns
+        self.child_nodes = child_nodes
+        self.metadata = metadata or {}
+
+    def __len__(self) -> int:
+        return len(self.guesses)
+
+    def guess(self, node: int) -> str:
+        """Retourne le mot proposé à un nœud."""
+        return self.words[self.guesses[node]]
+
+    def child(self, node: int, pattern: int) -> Optional[int]:
+        """
+        Retourne l'enfant d'un nœud pour un pattern.
+
+        Args:
+            node: Indice du nœud
+            pattern: Pattern de feedback (0-242)
+
+        Returns:
+            Indice de l'enfant, ou None si le pattern n'a pas été compilé
+        """
+        start, end = self.child_offsets[node], self.child_offsets[node + 1]
+        i = start + np.searchsorted(self.child_patterns[start:end], pattern)
+        if i < end and self.child_patterns[i] == pattern:
+            return int(self.child_nodes[i])
+        return None
+
+    def lookup(self, history: Iterable[FeedbackResult]) -> Optional[int]:
+        """
+        Descend dans l'arbre en suivant l'historique d'une partie.
+
+        Args:
+            history: Feedbacks des tentatives déjà jouées
+
+        Returns:
+            Nœud atteint, ou None si l'historique sort de l'arbre (mot joué
+            différent de celui de l'arbre, pattern non compilé)
+        """
+        node = 0
+        for feedback in history:
+            if self.guess(node) != feedback.guess.upper():
+                return None
+            node = self.child(node, encode_feedback(feedback))
+            if node is None:
+                return None
+        return node
+
+    def suggest(self, history: Iterable[FeedbackResult]) -> Optional[str]:
+        """
+        Retourne le mot à jouer après l'historique donné.
+
+        Args:
+            history: Feedbacks des tentatives déjà jouées
+
+        Returns:
+            Mot proposé, ou None (calcul en direct nécessaire)
+        """
+        node = self.lookup(history)
+        return None if node is None else self.guess(node)
+
+    def save(self, path: str):
+        """
+        Écrit l'arbre sur disque (écriture atomique).
+
+        Args:
+            path: Fichier .npz de destination
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            words=np.array(self.words),
+            guesses=self.guesses,
+            child_offsets=self.child_offsets,
+            child_patterns=self.child_patterns,
+            child_nodes=self.child_nodes,
+            metadata=np.array(json.dumps(self.metadata)),
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "DecisionTree":
+        """
+        Charge un arbre écrit par save().
+
+        Args:
+            path: Fichier .npz
+
+        Returns:
+            DecisionTree
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                words=data['words'].tolist(),
+                guesses=data['guesses'],
+                child_offsets=data['child_offsets'],
+                child_patterns=data['child_patterns'],
+                child_nodes=data['child_nodes'],
+                metadata=json.loads(str(data['metadata'])),
+            )
+
+
+class _TreeBuilder:
+    """Déroule une stratégie sur un ensemble de cibles (voir compile_decision_tree)."""
+
+    def __init__(self, strategy: BaseStrategy, dictionary: Set[str], language: str, max_depth: int):
+        self.strategy = strategy
+        self.dictionary = dictionary
+        self.language = language
+        self.max_depth = max_depth
+        self.solver = HybridSolver(dictionary)
+        self.word_ids: Dict[str, int] = {}
+        self.words: List[str] = []
+        self.guesses: List[int] = []
+        self.children: List[Dict[int, int]] = []
+
+    def _word_id(self, word: str) -> int:
+        if word not in self.word_ids:
+            self.word_ids[word] = len(self.words)
+            self.words.append(word)
+        return self.word_ids[word]
+
+    def choose(self, constraint_manager: ConstraintManager, attempt: int) -> Optional[str]:
+        """Reproduit le choix fait par l'API pour cet état."""
+        possible_words = self.solver.solve(constraint_manager, use_cpsat=False)
+        if not possible_words:
+            return None
+        if attempt == 1:
+            return self.strategy.get_first_guess(self.language)
+        return self.strategy.choose_word(
+            possible_words,
+            constraint_manager,
+            attempt,
+            full_dictionary=self.dictionary
+        )
+
+    def expand(self, constraint_manager: ConstraintManager, targets: List[str], depth: int) -> Optional[int]:
+        """
+        Compile le sous-arbre atteint par les cibles données.
+
+        Returns:
+            Indice du nœud créé, ou None si la stratégie n'a rien proposé
+        """
+        guess = self.choose(constraint_manager, depth + 1)
+        if not guess:
+            return None
+        guess = guess.upper()
+
+        node = len(self.guesses)
+        self.guesses.append(self._word_id(guess))
+        self.children.append({})
+        if depth + 1 >= self.max_depth:
+            return node
+
+        # Regrouper les cibles par pattern de feedback
+        groups: Dict[int, List[str]] = {}
+        matrix = find_pattern_matrix([guess], targets)
+        if matrix is not None:
+            patterns = matrix.matrix[matrix.index[guess], matrix.indices(targets)]
+            for target, pattern in zip(targets, patterns.tolist()):
+                groups.setdefault(pattern, []).append(target)
+        else:
+            for target in targets:
+                groups.setdefault(encode_feedback(generate_feedback(guess, target)), []).append(target)
+
+        for pattern in sorted(groups):
+            if pattern == ALL_CORRECT:
+                continue
+            group = groups[pattern]
+            child_cm = copy.deepcopy(constraint_manager)
+            child_cm.apply_feedback(generate_feedback(guess, group[0]))
+            child = self.expand(child_cm, group, depth + 1)
+            if child is not None:
+                self.children[node][pattern] = child
+        return node
+
+    def build(self, targets: List[str], metadata: Dict) -> DecisionTree:
+        """Compile l'arbre complet et le convertit au format compact."""
+        self.expand(ConstraintManager(), targets, 0)
+
+        offsets = np.zeros(len(self.guesses) + 1, dtype=np.int32)
+        patterns, nodes = [], []
+        for i, children in enumerate(self.children):
+            for pattern in sorted(children):
+                patterns.append(pattern)
+                nodes.append(children[pattern])
+            offsets[i + 1] = len(patterns)
+
+        return DecisionTree(
+            words=self.words,
+            guesses=np.array(self.guesses, dtype=np.int32),
+            child_offsets=offsets,
+            child_patterns=np.array(patterns, dtype=np.uint8),
+            child_nodes=np.array(nodes, dtype=np.int32),
+            metadata=metadata,
+        )
+
+
+def compile_decision_tree(
+    strategy: BaseStrategy,
+    dictionary: Set[str],
+    language: str = 'en',
+    strategy_name: Optional[str] = None,
+    answers: Optional[Iterable[str]] = None,
+    max_depth: int = MAX_ATTEMPTS
+) -> DecisionTree:
+    """
+    Déroule une stratégie sur tous les mots cibles.
+
+    Chaque nœud reproduit le choix de l'API (/api/game/suggest) : premier mot
+    de la stratégie, puis choose_word sur les mots filtrés par les
+    contraintes, avec le dictionnaire complet en argument.
+
+    Args:
+        strategy: Stratégie à compiler
+        dictionary: Dictionnaire de mots valides
+        language: Langue ('en' ou 'fr')
+        strategy_name: Identifiant de la stratégie (enregistré dans l'arbre)
+        answers: Mots cibles (par défaut tout le dictionnaire)
+        max_depth: Nombre maximal de tentatives compilées
+
+    Returns:
+        DecisionTree
+    """
+    dictionary = {word.upper() for word in dictionary}
+    targets = sorted(dictionary if answers is None else {word.upper() for word in answers})
+
+    start = time.time()
+    builder = _TreeBuilder(strategy, dictionary, language, max_depth)
+    metadata = {
+        'language': language,
+        'strategy': strategy_name or strategy.name,
+        'dictionary_hash': dictionary_hash(sorted(dictionary)),
+        'num_answers': len(targets),
+        'max_depth': max_depth,
+    }
+    tree = builder.build(targets, metadata)
+    tree.metadata['num_nodes'] = len(tree)
+    tree.metadata['compile_time'] = round(time.time() - start, 2)
+    return tree
+
+
+def decision_tree_path(language: str, strategy_name: str, tree_dir: Optional[str] = None) -> Path:
+    """
+    Chemin par défaut de l'arbre d'une langue et d'une stratégie.
+
+    Args:
+        language: Langue ('en' ou 'fr')
+        strategy_name: Identifiant de la stratégie
+        tree_dir: Dossier des arbres (DEFAULT_CACHE_DIR par défaut)
+
+    Returns:
+        Chemin du fichier .npz
+    """
+    tree_dir = Path(tree_dir) if tree_dir else DEFAULT_CACHE_DIR
+    return tree_dir / f"tree_{language}_{strategy_name}.npz"
+
+
+def load_decision_tree(
+    language: str,
+    strategy_name: str,
+    dictionary: Optional[Iterable[str]] = None,
+    tree_dir: Optional[str] = None
+) -> Optional[DecisionTree]:
+    """
+    Charge l'arbre compilé d'une langue et d'une stratégie.
+
+    Args:
+        language: Langue ('en' ou 'fr')
+        strategy_name: Identifiant de la stratégie
+        dictionary: Dictionnaire utilisé par l'appelant ; l'arbre est ignoré
+            s'il a été compilé sur un autre dictionnaire
+        tree_dir: Dossier des arbres (DEFAULT_CACHE_DIR par défaut)
+
+    Returns:
+        DecisionTree, ou None si aucun arbre compatible n'existe
+    """
+    path = decision_tree_path(language, strategy_name, tree_dir)
+    if not path.exists():
+        return None
+
+    tree = DecisionTree.load(str(path))
+    if dictionary is not None:
+        expected = dictionary_hash(sorted({word.upper() for word in dictionary}))
+        if tree.metadata.get('dictionary_hash') != expected:
+            return None
+    return tree
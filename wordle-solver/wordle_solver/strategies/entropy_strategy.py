@@ -8,9 +8,11 @@ c'est-à-dire celui qui divise le mieux l'espace des possibilités.
 from typing import Set, Optional, Dict, List, Tuple
 from collections import defaultdict
 import math
+import numpy as np
 from .base_strategy import BaseStrategy
+from .score_cache import ScoreCache, get_shared_cache, state_key
 from ..csp import ConstraintManager
-from ..game import generate_feedback
+from ..game import generate_feedback, PatternMatrix
 
 
 class EntropyStrategy(BaseStrategy):
@@ -34,20 +36,32 @@ class EntropyStrategy(BaseStrategy):
     Inconvénients :
     - Très coûteux en calcul (O(n²) où n = nombre de mots possibles)
     - Nécessite de simuler tous les feedbacks possibles
+    
+    Quand une matrice de patterns précalculée couvre les mots évalués, tous
+    les candidats sont scorés d'un coup par bincount (voir PatternMatrix).
     """
     
-    def __init__(self, use_full_dictionary: bool = False, max_words_to_evaluate: int = None):
+    def __init__(
+        self,
+        use_full_dictionary: bool = False,
+        max_words_to_evaluate: int = None,
+        pattern_matrix: Optional[PatternMatrix] = None,
+        cache: Optional[ScoreCache] = None
+    ):
         """
         Initialise la stratégie d'entropie.
         
         Args:
             use_full_dictionary: Si True, évalue aussi les mots hors possibles
             max_words_to_evaluate: Limite le nombre de mots à évaluer (optimisation)
+            pattern_matrix: Matrice de patterns précalculée (optionnel)
+            cache: Cache des entropies (par défaut le cache partagé 'entropy')
         """
         super().__init__(name="Entropie (Information Theory)")
         self.use_full_dictionary = use_full_dictionary
         self.max_words_to_evaluate = max_words_to_evaluate
-        self._entropy_cache = {}
+        self.pattern_matrix = pattern_matrix
+        self._entropy_cache = cache if cache is not None else get_shared_cache('entropy')
     
     def choose_word(
         self,
@@ -90,12 +104,20 @@ class EntropyStrategy(BaseStrategy):
             # Prendre un échantillon représentatif
             words_to_evaluate = self._sample_words(words_to_evaluate, self.max_words_to_evaluate)
         
+        # Empreinte de l'état, calculée une fois pour tous les candidats
+        targets_key = state_key(possible_words)
+        
+        # Calcul vectorisé si une matrice couvre les mots
+        matrix = self._get_pattern_matrix(words_to_evaluate, possible_words, **kwargs)
+        if matrix is not None:
+            return _best_by_entropy(self, matrix, words_to_evaluate, possible_words, targets_key)
+        
         # Calculer l'entropie de chaque mot
         best_word = None
         best_entropy = -1
         
         for candidate in words_to_evaluate:
-            entropy = self._calculate_entropy(candidate, possible_words)
+            entropy = self._calculate_entropy(candidate, possible_words, targets_key)
             
             if entropy > best_entropy:
                 best_entropy = entropy
@@ -104,22 +126,31 @@ class EntropyStrategy(BaseStrategy):
         self.stats['words_evaluated'] = len(words_to_evaluate)
         return best_word
     
-    def _calculate_entropy(self, candidate: str, possible_targets: Set[str]) -> float:
+    def _calculate_entropy(
+        self,
+        candidate: str,
+        possible_targets: Set[str],
+        targets_key: Optional[tuple] = None
+    ) -> float:
         """
         Calcule l'entropie d'un mot candidat.
         
         Args:
             candidate: Le mot à évaluer
             possible_targets: Les mots cibles possibles
+            targets_key: Empreinte des cibles (state_key), si déjà calculée
             
         Returns:
             Entropie du mot (bits d'information)
         """
         # Vérifier le cache
-        cache_key = (candidate, frozenset(possible_targets))
-        if cache_key in self._entropy_cache:
+        if targets_key is None:
+            targets_key = state_key(possible_targets)
+        cache_key = (candidate, targets_key)
+        entropy = self._entropy_cache.get(cache_key)
+        if entropy is not None:
             self.stats['cache_hits'] += 1
-            return self._entropy_cache[cache_key]
+            return entropy
         
         # Simuler le feedback pour chaque mot cible possible
         pattern_counts = defaultdict(int)
@@ -140,7 +171,7 @@ class EntropyStrategy(BaseStrategy):
                 entropy -= probability * math.log2(probability)
         
         # Mettre en cache
-        self._entropy_cache[cache_key] = entropy
+        self._entropy_cache.put(cache_key, entropy)
         return entropy
     
     def _sample_words(self, words: Set[str], n: int) -> Set[str]:
@@ -199,7 +230,7 @@ class EntropyStrategy(BaseStrategy):
         )
     
     def reset_cache(self):
-        """Vide le cache d'entropie."""
+        """Vide le cache d'entropie (partagé avec les autres instances)."""
         self._entropy_cache.clear()
 
 
@@ -213,16 +244,24 @@ class FastEntropyStrategy(BaseStrategy):
     - Échantillonnage intelligent
     """
     
-    def __init__(self, evaluation_limit: int = 50):
+    def __init__(
+        self,
+        evaluation_limit: int = 50,
+        pattern_matrix: Optional[PatternMatrix] = None,
+        cache: Optional[ScoreCache] = None
+    ):
         """
         Initialise la stratégie d'entropie rapide.
         
         Args:
             evaluation_limit: Nombre maximum de mots à évaluer
+            pattern_matrix: Matrice de patterns précalculée (optionnel)
+            cache: Cache des entropies (par défaut le cache partagé 'entropy')
         """
         super().__init__(name="Entropie Rapide")
         self.evaluation_limit = evaluation_limit
-        self._cache = {}
+        self.pattern_matrix = pattern_matrix
+        self._cache = cache if cache is not None else get_shared_cache('entropy')
     
     def choose_word(
         self,
@@ -258,12 +297,19 @@ class FastEntropyStrategy(BaseStrategy):
         else:
             words_to_eval = possible_words
         
+        # Calcul vectorisé sur le même échantillon de cibles
+        matrix = self._get_pattern_matrix(words_to_eval, possible_words, **kwargs)
+        targets = self._sample_targets(possible_words)
+        targets_key = state_key(targets)
+        if matrix is not None:
+            return _best_by_entropy(self, matrix, words_to_eval, targets, targets_key)
+        
         # Calculer l'entropie approximative
         best_word = None
         best_score = -1
         
         for candidate in words_to_eval:
-            score = self._approximate_entropy(candidate, possible_words)
+            score = self._calculate_exact_entropy(candidate, targets, targets_key)
             
             if score > best_score:
                 best_score = score
@@ -278,24 +324,40 @@ class FastEntropyStrategy(BaseStrategy):
         
         Utilise un échantillon si le nombre de cibles est trop grand.
         """
-        # Si peu de cibles, calcul exact
-        if len(targets) <= 20:
-            return self._calculate_exact_entropy(candidate, targets)
+        return self._calculate_exact_entropy(candidate, self._sample_targets(targets))
+    
+    def _sample_targets(self, targets: Set[str], sample_size: int = 20) -> Set[str]:
+        """
+        Échantillonne les cibles (toutes si elles sont peu nombreuses).
+        
+        Args:
+            targets: Mots cibles possibles
+            sample_size: Taille maximale de l'échantillon
+            
+        Returns:
+            Sous-ensemble des cibles
+        """
+        if len(targets) <= sample_size:
+            return targets
         
-        # Sinon, échantillonner
-        sample_size = 20
         targets_list = sorted(targets)
         step = max(1, len(targets_list) // sample_size)
-        sample = set(targets_list[::step][:sample_size])
-        
-        return self._calculate_exact_entropy(candidate, sample)
+        return set(targets_list[::step][:sample_size])
     
-    def _calculate_exact_entropy(self, candidate: str, targets: Set[str]) -> float:
-        """Calcule l'entropie exacte."""
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
+    def _calculate_exact_entropy(
+        self,
+        candidate: str,
+        targets: Set[str],
+        targets_key: Optional[tuple] = None
+    ) -> float:
+        """Calcule l'entropie exacte (targets_key : empreinte des cibles si connue)."""
+        if targets_key is None:
+            targets_key = state_key(targets)
+        cache_key = (candidate, targets_key)
+        entropy = self._cache.get(cache_key)
+        if entropy is not None:
             self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
+            return entropy
         
         pattern_counts = defaultdict(int)
         for target in targets:
@@ -311,5 +373,43 @@ class FastEntropyStrategy(BaseStrategy):
                 p = count / n_total
                 entropy -= p * math.log2(p)
         
-        self._cache[cache_key] = entropy
+        self._cache.put(cache_key, entropy)
         return entropy
+
+
+def _best_by_entropy(
+    strategy: BaseStrategy,
+    matrix: PatternMatrix,
+    candidates: Set[str],
+    targets: Set[str],
+    targets_key: tuple
+) -> str:
+    """
+    Choisit le candidat d'entropie maximale avec la matrice de patterns.
+    
+    Le choix est mémorisé par couple (candidats, cibles) dans le cache de la
+    stratégie ; à égalité, le premier candidat alphabétique l'emporte.
+    
+    Args:
+        strategy: Stratégie appelante (cache et statistiques)
+        matrix: Matrice couvrant les candidats et les cibles
+        candidates: Mots évalués
+        targets: Cibles possibles
+        targets_key: Empreinte des cibles
+        
+    Returns:
+        Le meilleur candidat
+    """
+    cache = strategy._entropy_cache if isinstance(strategy, EntropyStrategy) else strategy._cache
+    cache_key = ('best', state_key(candidates), targets_key)
+    best = cache.get(cache_key)
+    if best is not None:
+        strategy.stats['cache_hits'] += 1
+        return best
+    
+    ordered = sorted(candidates)
+    entropies = matrix.entropy_scores(matrix.indices(ordered), matrix.indices(targets))
+    best = ordered[int(np.argmax(entropies))]
+    strategy.stats['words_evaluated'] = len(ordered)
+    cache.put(cache_key, best)
+    return best
@@ -0,0 +1,293 @@
+"""
+Stratégie de recherche à profondeur limitée pour Wordle.
+
+Les autres stratégies sont gloutonnes : elles notent chaque mot sur un seul
+coup. Celle-ci minimise directement le nombre espéré de tentatives restantes
+en explorant l'arbre des feedbacks sur plusieurs coups, avec élagage par
+séparation et évaluation (branch and bound).
+"""
+
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .base_strategy import BaseStrategy
+from .score_cache import ScoreCache, get_shared_cache, state_key
+from ..csp import ConstraintManager
+from ..game import generate_feedback, encode_feedback, PatternMatrix
+from ..game.patterns import ALL_CORRECT
+
+
+class _SearchTimeout(Exception):
+    """Budget de temps du coup épuisé."""
+
+
+def _group_lower_bound(size: int) -> float:
+    """
+    Borne inférieure du nombre espéré de tentatives pour un groupe.
+
+    Au mieux, un mot est trouvé au coup suivant et tous les autres au coup
+    d'après : (1 + 2 * (k - 1)) / k. Exacte pour k <= 2.
+    """
+    return (2 * size - 1) / size
+
+
+class LookaheadStrategy(BaseStrategy):
+    """
+    Stratégie Lookahead : minimise le nombre espéré de tentatives.
+    
+    Principe :
+    - Coût(S) = 1 + somme sur les patterns p != tout vert de |S_p|/|S| * Coût(S_p)
+    - Borne inférieure d'un mot (comme get_score_lower_bounds de
+      SolveurWordle) : 1 tentative s'il est la cible, 2 pour une cible par
+      groupe de feedback, 3 pour les autres
+    - Les mots sont explorés par borne croissante ; un mot (ou un groupe)
+      est abandonné dès que sa borne dépasse la meilleure valeur connue
+    - Au-delà de la profondeur maximale, la borne sert d'estimation
+    
+    La profondeur augmente progressivement (approfondissement itératif)
+    tant que le budget de temps du coup le permet ; le meilleur mot de la
+    dernière profondeur terminée est retenu. Les sous-problèmes sont
+    mémorisés par empreinte de l'ensemble des candidats (state_key), dans
+    un cache partagé entre les coups et les parties.
+    
+    Avantages :
+    - Optimise directement le score moyen
+    - Temps de réponse borné
+    
+    Inconvénients :
+    - Plus coûteux que les stratégies gloutonnes
+    - Exact seulement parmi les beam_width meilleurs mots de chaque nœud
+    """
+    
+    def __init__(
+        self,
+        max_depth: int = 3,
+        time_budget: float = 1.0,
+        beam_width: int = 10,
+        use_full_dictionary: bool = False,
+        pattern_matrix: Optional[PatternMatrix] = None,
+        cache: Optional[ScoreCache] = None
+    ):
+        """
+        Initialise la stratégie de recherche.
+        
+        Args:
+            max_depth: Nombre maximal de coups explorés
+            time_budget: Temps maximal par coup (secondes)
+            beam_width: Nombre de mots explorés à chaque nœud (par borne croissante)
+            use_full_dictionary: Si True, propose aussi des mots hors possibles
+            pattern_matrix: Matrice de patterns précalculée (optionnel)
+            cache: Mémoire des sous-problèmes (par défaut le cache partagé 'lookahead')
+        """
+        super().__init__(name="Lookahead (Branch & Bound)")
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self.beam_width = beam_width
+        self.use_full_dictionary = use_full_dictionary
+        self.pattern_matrix = pattern_matrix
+        self._memo = cache if cache is not None else get_shared_cache('lookahead')
+        self._deadline = float('inf')
+        
+        # État du coup en cours (voir choose_word)
+        self._pool: Optional[List[str]] = None
+        self._pool_key: Optional[tuple] = None
+        self._matrix: Optional[PatternMatrix] = None
+    
+    def choose_word(
+        self,
+        possible_words: Set[str],
+        constraint_manager: ConstraintManager,
+        attempt_number: int,
+        **kwargs
+    ) -> Optional[str]:
+        """
+        Choisit le mot qui minimise le nombre espéré de tentatives.
+        
+        Args:
+            possible_words: Mots encore possibles
+            constraint_manager: Gestionnaire de contraintes
+            attempt_number: Numéro de la tentative
+            **kwargs: Peut contenir 'full_dictionary' et 'pattern_matrix'
+        
+        Returns:
+            Le meilleur mot trouvé dans le budget de temps
+        """
+        if not possible_words:
+            return None
+        
+        if len(possible_words) <= 2:
+            return sorted(possible_words)[0]
+        
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        
+        targets = sorted(possible_words)
+        pool = None
+        if self.use_full_dictionary and kwargs.get('full_dictionary'):
+            pool = sorted(set(kwargs['full_dictionary']).union(possible_words))
+        self._pool = pool
+        self._pool_key = state_key(pool) if pool is not None else None
+        self._matrix = self._get_pattern_matrix(pool or targets, targets, **kwargs)
+        
+        # Profondeur 1 : meilleure borne (toujours calculée)
+        best_word = self._rank(targets)[0][1]
+        self.stats['search_depth'] = 1
+        self.stats['expected_guesses'] = None
+        self.stats['nodes_expanded'] = 0
+        
+        for depth in range(2, self.max_depth + 1):
+            try:
+                value, word = self._search(targets, depth, float('inf'))
+            except _SearchTimeout:
+                break
+            best_word = word
+            self.stats['search_depth'] = depth
+            self.stats['expected_guesses'] = value
+        
+        self.stats['words_evaluated'] = len(pool or targets)
+        self.stats['time_taken'] = time.perf_counter() - start
+        return best_word
+    
+    def _rank(self, targets: List[str]) -> List[Tuple[float, str]]:
+        """
+        Classe les mots proposables par borne inférieure croissante.
+        
+        Args:
+            targets: Cibles possibles (triées)
+        
+        Returns:
+            Liste (borne, mot) triée (à égalité, ordre alphabétique)
+        """
+        guesses = self._pool if self._pool is not None else targets
+        n = len(targets)
+        target_set = set(targets)
+        
+        if self._matrix is not None:
+            matrix = self._matrix
+            num_groups = matrix.num_groups(matrix.indices(guesses), matrix.indices(targets))
+        else:
+            num_groups = np.array([
+                len({encode_feedback(generate_feedback(guess, target)) for target in targets})
+                for guess in guesses
+            ])
+        
+        # (1 * hit + 2 * (groupes - hit) + 3 * (n - groupes)) / n
+        hits = np.array([guess in target_set for guess in guesses], dtype=np.int64)
+        bounds = (3 * n - num_groups - hits) / n
+        order = np.lexsort((np.arange(len(guesses)), bounds))
+        return [(float(bounds[i]), guesses[i]) for i in order]
+    
+    def _partition(self, guess: str, targets: List[str]) -> Dict[int, List[str]]:
+        """
+        Regroupe les cibles par pattern de feedback.
+        
+        Args:
+            guess: Mot proposé
+            targets: Cibles possibles (triées ; chaque groupe le reste)
+        
+        Returns:
+            Dictionnaire pattern -> cibles
+        """
+        groups: Dict[int, List[str]] = {}
+        if self._matrix is not None:
+            matrix = self._matrix
+            patterns = matrix.matrix[matrix.index[guess], matrix.indices(targets)].tolist()
+        else:
+            patterns = [encode_feedback(generate_feedback(guess, target)) for target in targets]
+        for target, pattern in zip(targets, patterns):
+            groups.setdefault(pattern, []).append(target)
+        return groups
+    
+    def _search(self, targets: List[str], depth: int, beta: float) -> Tuple[float, Optional[str]]:
+        """
+        Nombre espéré de tentatives pour trouver une cible parmi targets.
+        
+        Args:
+            targets: Cibles possibles (triées)
+            depth: Nombre de coups encore explorés
+            beta: Valeur au-delà de laquelle le résultat est inutile à l'appelant
+        
+        Returns:
+            Tuple (valeur, mot). Si valeur >= beta, la valeur n'est qu'une
+            borne inférieure.
+        """
+        n = len(targets)
+        if n <= 2:
+            return _group_lower_bound(n), targets[0]
+        
+        key = ('lookahead', state_key(targets), self._pool_key, depth, self.beam_width)
+        entry = self._memo.get(key)
+        if entry is not None:
+            value, word, exact = entry
+            if exact or value >= beta:
+                self.stats['cache_hits'] += 1
+                return value, word
+        
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        
+        ranked = self._rank(targets)
+        if depth <= 1:
+            value, word = ranked[0]
+            self._memo.put(key, (value, word, True))
+            return value, word
+        
+        self.stats['nodes_expanded'] += 1
+        best_value = float('inf')
+        best_word = ranked[0][1]
+        lower = float('inf')
+        
+        for bound, guess in ranked[:self.beam_width]:
+            limit = min(best_value, beta)
+            if bound >= limit:
+                lower = min(lower, bound)
+                break
+            
+            # Remplacer la borne de chaque groupe par sa valeur, les plus gros d'abord
+            total = bound
+            groups = self._partition(guess, targets)
+            for pattern, group in sorted(groups.items(), key=lambda item: -len(item[1])):
+                k = len(group)
+                if pattern == ALL_CORRECT or k <= 2:
+                    continue
+                group_bound = _group_lower_bound(k)
+                child_beta = group_bound + (limit - total) * n / k
+                value, _ = self._search(group, depth - 1, child_beta)
+                total += k / n * (value - group_bound)
+                if total >= limit:
+                    break
+            
+            if total < best_value:
+                best_value, best_word = total, guess
+            lower = min(lower, total)
+        
+        if best_value < beta:
+            self._memo.put(key, (best_value, best_word, True))
+            return best_value, best_word
+        
+        self._memo.put(key, (lower, best_word, False))
+        return lower, best_word
+    
+    def explain_choice(
+        self,
+        chosen_word: str,
+        possible_words: Set[str],
+        **kwargs
+    ) -> str:
+        """Explique le choix de la recherche."""
+        expected = self.stats.get('expected_guesses')
+        depth = self.stats.get('search_depth', 1)
+        
+        if expected is not None:
+            return (
+                f"Stratégie Lookahead : '{chosen_word}' minimise le nombre espéré "
+                f"de tentatives (~{expected:.2f}, recherche sur {depth} coups) "
+                f"parmi {len(possible_words)} mots"
+            )
+        
+        return (
+            f"Stratégie Lookahead : '{chosen_word}' a la meilleure borne "
+            f"inférieure parmi {len(possible_words)} mots"
+        )
@@ -7,9 +7,11 @@ le meilleur résultat dans le scénario le moins favorable.
 
 from typing import Set, Optional, Dict, Tuple
 from collections import defaultdict
+import numpy as np
 from .base_strategy import BaseStrategy
+from .score_cache import ScoreCache, get_shared_cache, state_key
 from ..csp import ConstraintManager
-from ..game import generate_feedback
+from ..game import generate_feedback, PatternMatrix
 
 
 class MinimaxStrategy(BaseStrategy):
@@ -36,17 +38,25 @@ class MinimaxStrategy(BaseStrategy):
     - Coûteux en calcul
     """
     
-    def __init__(self, tie_breaker: str = "entropy"):
+    def __init__(
+        self,
+        tie_breaker: str = "entropy",
+        pattern_matrix: Optional[PatternMatrix] = None,
+        cache: Optional[ScoreCache] = None
+    ):
         """
         Initialise la stratégie minimax.
         
         Args:
             tie_breaker: Méthode pour départager les ex-aequo
                         ("entropy", "frequency", "alphabetical")
+            pattern_matrix: Matrice de patterns précalculée (optionnel)
+            cache: Cache des pires cas (par défaut le cache partagé 'minimax')
         """
         super().__init__(name="Minimax")
         self.tie_breaker = tie_breaker
-        self._cache = {}
+        self.pattern_matrix = pattern_matrix
+        self._cache = cache if cache is not None else get_shared_cache('minimax')
     
     def choose_word(
         self,
@@ -77,12 +87,26 @@ class MinimaxStrategy(BaseStrategy):
         if len(possible_words) == 2:
             return sorted(possible_words)[0]
         
+        # Calcul vectorisé si une matrice couvre les mots
+        matrix = self._get_pattern_matrix(possible_words, **kwargs)
+        if matrix is not None:
+            candidates = sorted(possible_words)
+            worst_cases = matrix.worst_case_scores(
+                matrix.indices(candidates), matrix.indices(possible_words)
+            )
+            best_words = [candidates[i] for i in np.flatnonzero(worst_cases == worst_cases.min())]
+            self.stats['words_evaluated'] = len(candidates)
+            if len(best_words) > 1:
+                return self._break_tie(best_words, possible_words, matrix)
+            return best_words[0]
+        
         # Évaluer chaque mot
         best_words = []
         best_worst_case = float('inf')
+        targets_key = state_key(possible_words)
         
         for candidate in possible_words:
-            worst_case = self._calculate_worst_case(candidate, possible_words)
+            worst_case = self._calculate_worst_case(candidate, possible_words, targets_key)
             
             if worst_case < best_worst_case:
                 best_worst_case = worst_case
@@ -98,21 +122,30 @@ class MinimaxStrategy(BaseStrategy):
         
         return best_words[0]
     
-    def _calculate_worst_case(self, candidate: str, targets: Set[str]) -> int:
+    def _calculate_worst_case(
+        self,
+        candidate: str,
+        targets: Set[str],
+        targets_key: Optional[tuple] = None
+    ) -> int:
         """
         Calcule la taille du pire groupe après feedback.
         
         Args:
             candidate: Mot candidat
             targets: Mots cibles possibles
+            targets_key: Empreinte des cibles (state_key), si déjà calculée
             
         Returns:
             Taille du plus grand groupe
         """
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
+        if targets_key is None:
+            targets_key = state_key(targets)
+        cache_key = (candidate, targets_key)
+        worst_case = self._cache.get(cache_key)
+        if worst_case is not None:
             self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
+            return worst_case
         
         # Grouper les cibles par pattern de feedback
         pattern_groups = defaultdict(list)
@@ -125,16 +158,22 @@ class MinimaxStrategy(BaseStrategy):
         # Trouver le groupe le plus grand
         worst_case = max(len(group) for group in pattern_groups.values())
         
-        self._cache[cache_key] = worst_case
+        self._cache.put(cache_key, worst_case)
         return worst_case
     
-    def _break_tie(self, tied_words: list, possible_words: Set[str]) -> str:
+    def _break_tie(
+        self,
+        tied_words: list,
+        possible_words: Set[str],
+        matrix: Optional[PatternMatrix] = None
+    ) -> str:
         """
         Départage les ex-aequo selon la méthode choisie.
         
         Args:
             tied_words: Liste de mots ex-aequo
             possible_words: Mots possibles
+            matrix: Matrice de patterns couvrant les mots (optionnel)
             
         Returns:
             Le mot choisi
@@ -142,6 +181,10 @@ class MinimaxStrategy(BaseStrategy):
         if self.tie_breaker == "alphabetical":
             return sorted(tied_words)[0]
         
+        elif self.tie_breaker == "entropy" and matrix is not None:
+            groups = matrix.num_groups(matrix.indices(tied_words), matrix.indices(possible_words))
+            return tied_words[int(np.argmax(groups))]
+        
         elif self.tie_breaker == "entropy":
             # Calculer une entropie simplifiée
             best_word = tied_words[0]
@@ -232,9 +275,10 @@ class ExpectedSizeStrategy(BaseStrategy):
     Compromis entre Minimax (pessimiste) et Entropie (optimiste).
     """
     
-    def __init__(self):
+    def __init__(self, pattern_matrix: Optional[PatternMatrix] = None, cache: Optional[ScoreCache] = None):
         super().__init__(name="Taille Espérée")
-        self._cache = {}
+        self.pattern_matrix = pattern_matrix
+        self._cache = cache if cache is not None else get_shared_cache('expected_size')
     
     def choose_word(
         self,
@@ -250,11 +294,21 @@ class ExpectedSizeStrategy(BaseStrategy):
         if len(possible_words) <= 2:
             return sorted(possible_words)[0]
         
+        matrix = self._get_pattern_matrix(possible_words, **kwargs)
+        if matrix is not None:
+            candidates = sorted(possible_words)
+            expected_sizes = matrix.expected_size_scores(
+                matrix.indices(candidates), matrix.indices(possible_words)
+            )
+            self.stats['words_evaluated'] = len(candidates)
+            return candidates[int(np.argmin(expected_sizes))]
+        
         best_word = None
         best_expected = float('inf')
+        targets_key = state_key(possible_words)
         
         for candidate in possible_words:
-            expected = self._calculate_expected_size(candidate, possible_words)
+            expected = self._calculate_expected_size(candidate, possible_words, targets_key)
             
             if expected < best_expected:
                 best_expected = expected
@@ -263,21 +317,30 @@ class ExpectedSizeStrategy(BaseStrategy):
         self.stats['words_evaluated'] = len(possible_words)
         return best_word
     
-    def _calculate_expected_size(self, candidate: str, targets: Set[str]) -> float:
+    def _calculate_expected_size(
+        self,
+        candidate: str,
+        targets: Set[str],
+        targets_key: Optional[tuple] = None
+    ) -> float:
         """
         Calcule la taille moyenne attendue des groupes.
         
         Args:
             candidate: Mot candidat
             targets: Mots cibles possibles
+            targets_key: Empreinte des cibles (state_key), si déjà calculée
             
         Returns:
             Taille moyenne pondérée des groupes
         """
-        cache_key = (candidate, frozenset(targets))
-        if cache_key in self._cache:
+        if targets_key is None:
+            targets_key = state_key(targets)
+        cache_key = (candidate, targets_key)
+        expected = self._cache.get(cache_key)
+        if expected is not None:
             self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
+            return expected
         
         # Grouper par pattern
         pattern_groups = defaultdict(list)
@@ -294,7 +357,7 @@ class ExpectedSizeStrategy(BaseStrategy):
             for group in pattern_groups.values()
         )
         
-        self._cache[cache_key] = expected
+        self._cache.put(cache_key, expected)
         return expected
     
     def explain_choice(
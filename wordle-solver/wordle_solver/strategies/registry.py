@@ -0,0 +1,43 @@
+"""
+Registre des stratégies exposées par l'API.
+
+Associe un identifiant ('frequency', 'entropy'...) à une configuration de
+stratégie. Le backend et le compilateur d'arbres de décision passent par ce
+registre : un arbre compilé correspond exactement à la stratégie servie.
+"""
+
+from typing import Callable, Dict, List
+
+from .base_strategy import BaseStrategy, SimpleStrategy
+from .frequency_strategy import FrequencyStrategy
+from .entropy_strategy import EntropyStrategy
+from .minimax_strategy import MinimaxStrategy
+from .lookahead_strategy import LookaheadStrategy
+
+
+STRATEGY_FACTORIES: Dict[str, Callable[[], BaseStrategy]] = {
+    'frequency': lambda: FrequencyStrategy(),
+    'entropy': lambda: EntropyStrategy(max_words_to_evaluate=100),
+    'minimax': lambda: MinimaxStrategy(),
+    'lookahead': lambda: LookaheadStrategy(time_budget=0.5),
+    'simple': lambda: SimpleStrategy(),
+}
+
+
+def create_strategy(strategy_name: str) -> BaseStrategy:
+    """
+    Crée une stratégie à partir de son identifiant.
+
+    Args:
+        strategy_name: Identifiant de la stratégie
+
+    Returns:
+        Nouvelle instance (FrequencyStrategy si l'identifiant est inconnu)
+    """
+    factory = STRATEGY_FACTORIES.get(strategy_name, STRATEGY_FACTORIES['frequency'])
+    return factory()
+
+
+def available_strategies() -> List[str]:
+    """Retourne les identifiants des stratégies enregistrées."""
+    return list(STRATEGY_FACTORIES)
@@ -0,0 +1,210 @@
+"""
+Cache partagé des scores de stratégies.
+
+Les stratégies mémorisent des scores (entropie, pire cas...) par état de
+l'ensemble des candidats. La clé d'un état est une empreinte stable et
+indépendante de l'ordre : somme modulo 2^64 des empreintes blake2b des mots,
+calculée une fois par appel de choose_word au lieu d'un frozenset par
+candidat. Le cache est borné (éviction LRU), partagé entre les parties et
+les instances d'une même stratégie, et peut être sauvegardé sur disque :
+les empreintes ne dépendent pas du processus.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+_MASK = (1 << 64) - 1
+
+# Sentinelle des entrées absentes (une valeur mémorisée peut valoir None)
+_MISSING = object()
+
+# Empreinte de chaque mot déjà rencontré
+_word_hashes: Dict[str, int] = {}
+
+
+def _word_hash(word: str) -> int:
+    """Empreinte stable (64 bits) d'un mot."""
+    value = _word_hashes.get(word)
+    if value is None:
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest()
+        value = _word_hashes[word] = int.from_bytes(digest, 'little')
+    return value
+
+
+def state_key(words: Iterable[str]) -> tuple:
+    """
+    Calcule l'empreinte d'un ensemble de mots.
+
+    Args:
+        words: Mots (ensemble ou liste sans doublons)
+
+    Returns:
+        Tuple (nombre de mots, somme des empreintes modulo 2^64)
+    """
+    total = 0
+    count = 0
+    for word in words:
+        total += _word_hash(word)
+        count += 1
+    return count, total & _MASK
+
+
+class ScoreCache:
+    """
+    Cache LRU borné avec statistiques d'utilisation.
+
+    Thread-safe : le backend partage les stratégies entre les requêtes.
+    """
+
+    def __init__(self, max_entries: int = 200000, path: Optional[str] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            max_entries: Nombre maximal d'entrées avant éviction LRU
+            path: Fichier de persistance (chargé s'il existe, voir save())
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getstate__(self):
+        # Le verrou n'est pas sérialisable (stratégies envoyées aux workers)
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Cherche une entrée.
+
+        Args:
+            key: Clé de l'entrée
+            default: Valeur retournée en cas d'absence
+
+        Returns:
+            La valeur mémorisée, ou default
+        """
+        with self._lock:
+            value = self.entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Enregistre une entrée (évince les plus anciennes au-delà de la limite).
+
+        Args:
+            key: Clé de l'entrée
+            value: Valeur à mémoriser
+        """
+        with self._lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Vide le cache (les statistiques sont conservées)."""
+        with self._lock:
+            self.entries.clear()
+
+    def save(self, path: Optional[str] = None):
+        """
+        Sauvegarde le cache sur disque (écriture atomique).
+
+        Args:
+            path: Fichier de destination (par défaut celui du constructeur)
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("Aucun fichier de persistance spécifié")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            items = list(self.entries.items())
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(items, f)
+        os.replace(path + '.tmp', path)
+
+    def load(self, path: str):
+        """
+        Charge des entrées depuis le disque (les plus récentes en dernier).
+
+        Args:
+            path: Fichier créé par save()
+        """
+        with open(path, 'rb') as f:
+            items = pickle.load(f)
+        with self._lock:
+            for key, value in items:
+                self.entries[key] = value
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        """
+        Retourne les statistiques du cache.
+
+        Returns:
+            Dictionnaire (entries, max_entries, hits, misses, evictions, hit_rate)
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Caches partagés par nom (un par famille de scores)
+_shared_caches: Dict[str, ScoreCache] = {}
+
+
+def get_shared_cache(name: str, max_entries: int = 200000) -> ScoreCache:
+    """
+    Retourne le cache partagé d'une famille de scores.
+
+    Args:
+        name: Nom du cache ('entropy', 'minimax'...)
+        max_entries: Taille maximale si le cache est créé
+
+    Returns:
+        ScoreCache
+    """
+    if name not in _shared_caches:
+        _shared_caches[name] = ScoreCache(max_entries)
+    return _shared_caches[name]
+
+
+def get_cache_stats() -> Dict[str, Dict]:
+    """Retourne les statistiques de tous les caches partagés."""
+    return {name: cache.get_stats() for name, cache in _shared_caches.items()}